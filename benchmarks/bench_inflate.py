@@ -0,0 +1,122 @@
+"""
+Micro-benchmark of StructuredNode.inflate / deflate on a wide model.
+
+Compares the per-class generated functions with the generic per-property loop
+neomodel used before (reproduced below). No database is needed:
+
+    python benchmarks/bench_inflate.py [--rows 20000] [--width 30] [--save base.json]
+
+See harness.py for the options common to the benchmark scripts.
+"""
+
+import sys
+
+import harness
+from neo4j.graph import Graph, Node
+
+from neomodel import (
+    FloatProperty,
+    IntegerProperty,
+    StringProperty,
+    StructuredNode,
+)
+from neomodel.exceptions import RequiredProperty
+
+
+def make_model(width: int) -> type:
+    namespace = {}
+    for i in range(width):
+        match i % 3:
+            case 0:
+                namespace[f"s{i}"] = StringProperty()
+            case 1:
+                namespace[f"i{i}"] = IntegerProperty(default=0)
+            case _:
+                namespace[f"f{i}"] = FloatProperty(db_property=f"float_{i}")
+    return type("BenchWideNode", (StructuredNode,), namespace)
+
+
+def generic_inflate(cls, graph_entity):
+    inflated = {}
+    for name, property in cls.defined_properties(aliases=False, rels=False).items():
+        db_property = property.get_db_property_name(name)
+        if db_property in graph_entity:
+            inflated[name] = property.inflate(graph_entity[db_property], graph_entity)
+        elif property.has_default:
+            inflated[name] = property.default_value()
+        else:
+            inflated[name] = None
+    snode = cls(**inflated)
+    snode.element_id_property = graph_entity.element_id
+    return snode
+
+
+def generic_deflate(cls, properties, obj=None, skip_empty=False):
+    deflated = {}
+    for name, property in cls.defined_properties(aliases=False, rels=False).items():
+        db_property = property.get_db_property_name(name)
+        if properties.get(name) is not None:
+            deflated[db_property] = property.deflate(properties[name], obj)
+        elif property.has_default:
+            deflated[db_property] = property.deflate(property.default_value(), obj)
+        elif property.required:
+            raise RequiredProperty(name, cls)
+        elif not skip_empty:
+            deflated[db_property] = None
+    return deflated
+
+
+def make_rows(model: type, rows: int) -> list[Node]:
+    graph = Graph()
+    properties = {}
+    for name, db_property, property in model.get_schema().property_fields:
+        if isinstance(property, StringProperty):
+            properties[db_property] = f"value of {name}"
+        elif isinstance(property, IntegerProperty):
+            properties[db_property] = 42
+        else:
+            properties[db_property] = 4.2
+    return [
+        Node(graph, f"4:bench:{i}", i, ["BenchWideNode"], dict(properties))
+        for i in range(rows)
+    ]
+
+
+def main() -> int:
+    parser = harness.parser(__doc__)
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--width", type=int, default=30)
+    args = parser.parse_args()
+    report = harness.Report(args)
+
+    model = make_model(args.width)
+    nodes = make_rows(model, args.rows)
+    instances = [model.inflate(node) for node in nodes]
+    properties = [instance.__properties__ for instance in instances]
+
+    print(f"{args.rows} rows, {args.width} properties per node")
+    before = report.time(
+        "inflate (generic loop)",
+        lambda: [generic_inflate(model, node) for node in nodes],
+        args.rows,
+    )
+    after = report.time(
+        "inflate (generated)", lambda: [model.inflate(n) for n in nodes], args.rows
+    )
+    report.ratio("speedup", before, after)
+    before = report.time(
+        "deflate (generic loop)",
+        lambda: [generic_deflate(model, props) for props in properties],
+        args.rows,
+    )
+    after = report.time(
+        "deflate (generated)",
+        lambda: [model.deflate(props) for props in properties],
+        args.rows,
+    )
+    report.ratio("speedup", before, after)
+    return report.finish()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+"""
+Memory benchmark: bytes allocated per node inflated by StructuredNode.inflate.
+
+Compares the eager relationship managers and per instance get_<name>_display methods
+neomodel used before (reproduced below) with the lazily created managers and class
+level display methods, and with the compact storage mode (``__compact__ = True``).
+No database is needed:
+
+    python benchmarks/bench_memory.py [--rows 100000] [--width 10] [--relationships 10]
+
+See harness.py for the options common to the benchmark scripts.
+"""
+
+import sys
+from types import MethodType
+
+import harness
+from neo4j.graph import Graph, Node
+
+from neomodel import IntegerProperty, RelationshipTo, StringProperty, StructuredNode
+from neomodel.schema import display_for
+
+
+class BenchMemoryTarget(StructuredNode):
+    name = StringProperty()
+
+
+def make_model(name: str, width: int, relationships: int, compact: bool) -> type:
+    namespace = {
+        "__compact__": compact,
+        "kind": StringProperty(choices={"a": "Kind A", "b": "Kind B"}),
+    }
+    for i in range(width - 1):
+        if i % 2:
+            namespace[f"s{i}"] = StringProperty()
+        else:
+            namespace[f"i{i}"] = IntegerProperty(default=0)
+    for i in range(relationships):
+        namespace[f"rel_{i}"] = RelationshipTo(BenchMemoryTarget, f"BENCH_MEM_{i}")
+    return type(name, (StructuredNode,), namespace)
+
+
+def eager_inflate(cls, graph_entity):
+    """Inflate, then build every relationship manager and display method upfront."""
+    node = cls.inflate(graph_entity)
+    schema = cls.get_schema()
+    for name, definition in schema.relationships.items():
+        node.__dict__[name] = definition.build_manager(node, name)
+    for name, property in schema.properties.items():
+        if getattr(property, "choices", None):
+            node.__dict__[f"get_{name}_display"] = MethodType(display_for(name), node)
+    return node
+
+
+def make_rows(model: type, rows: int) -> list[Node]:
+    graph = Graph()
+    properties = {}
+    for name, db_property, property in model.get_schema().property_fields:
+        if name == "kind":
+            properties[db_property] = "a"
+        elif isinstance(property, StringProperty):
+            properties[db_property] = f"value of {name}"
+        else:
+            properties[db_property] = 42
+    return [
+        Node(graph, f"4:bench:{i}", i, [model.__name__], dict(properties))
+        for i in range(rows)
+    ]
+
+
+def main() -> int:
+    parser = harness.parser(__doc__)
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--width", type=int, default=10)
+    parser.add_argument("--relationships", type=int, default=10)
+    args = parser.parse_args()
+    report = harness.Report(args)
+
+    model = make_model("BenchMemoryNode", args.width, args.relationships, False)
+    compact = make_model(
+        "BenchCompactNode", args.width, args.relationships, compact=True
+    )
+    rows = make_rows(model, args.rows)
+    compact_rows = make_rows(compact, args.rows)
+    # generate the inflate functions outside of the measurements
+    model.inflate(rows[0])
+    compact.inflate(compact_rows[0])
+
+    print(
+        f"{args.rows} rows, {args.width} properties, "
+        f"{args.relationships} relationships per node"
+    )
+    before = report.memory(
+        "inflate (eager managers, bound displays)",
+        lambda: [eager_inflate(model, node) for node in rows],
+        args.rows,
+    )
+    after = report.memory(
+        "inflate (lazy managers)",
+        lambda: [model.inflate(node) for node in rows],
+        args.rows,
+    )
+    report.ratio("smaller", before, after)
+    after = report.memory(
+        "inflate (lazy managers, compact)",
+        lambda: [compact.inflate(node) for node in compact_rows],
+        args.rows,
+    )
+    report.ratio("smaller", before, after)
+    return report.finish()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
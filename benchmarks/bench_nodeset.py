@@ -0,0 +1,90 @@
+"""
+Micro-benchmark of the client side overhead of Model.nodes.get() on a model with
+many relationships: creating the node set and building the query.
+
+Compares lazily created traversals with the eager installation neomodel used before
+(reproduced below). No database is needed:
+
+    python benchmarks/bench_nodeset.py [--calls 20000] [--relationships 40]
+
+See harness.py for the options common to the benchmark scripts.
+"""
+
+import sys
+
+import harness
+
+from neomodel import (
+    NodeSet,
+    RelationshipTo,
+    StringProperty,
+    StructuredNode,
+    Traversal,
+    UniqueIdProperty,
+)
+
+
+class BenchTarget(StructuredNode):
+    name = StringProperty()
+
+
+def make_model(relationships: int) -> type:
+    namespace = {"uid": UniqueIdProperty(), "name": StringProperty()}
+    for i in range(relationships):
+        namespace[f"rel_{i}"] = RelationshipTo(BenchTarget, f"BENCH_REL_{i}")
+    return type("BenchCentralNode", (StructuredNode,), namespace)
+
+
+class EagerNodeSet(NodeSet):
+    """NodeSet installing a Traversal for each relationship when created."""
+
+    def __init__(self, source):
+        super().__init__(source)
+        for key, rel in self.source_class.get_schema().relationships.items():
+            rel.lookup_node_class()
+            setattr(self, key, Traversal(self, key, rel.definition))
+
+
+def build_get_query(node_set: NodeSet, uid: str) -> str:
+    node_set = node_set.filter(uid=uid)
+    node_set.limit = 2
+    return node_set.query_cls(node_set).build_ast().build_query()
+
+
+def main() -> int:
+    parser = harness.parser(__doc__)
+    parser.add_argument("--calls", type=int, default=20000)
+    parser.add_argument("--relationships", type=int, default=40)
+    args = parser.parse_args()
+    report = harness.Report(args)
+
+    model = make_model(args.relationships)
+    calls = range(args.calls)
+    print(f"{args.calls} calls, {args.relationships} relationships")
+    before = report.time(
+        "Model.nodes (eager traversals)",
+        lambda: [EagerNodeSet(model) for _ in calls],
+        args.calls,
+    )
+    after = report.time(
+        "Model.nodes (lazy traversals)",
+        lambda: [model.nodes for _ in calls],
+        args.calls,
+    )
+    report.ratio("speedup", before, after)
+    before = report.time(
+        "get() query (eager traversals)",
+        lambda: [build_get_query(EagerNodeSet(model), str(i)) for i in calls],
+        args.calls,
+    )
+    after = report.time(
+        "get() query (lazy traversals)",
+        lambda: [build_get_query(model.nodes, str(i)) for i in calls],
+        args.calls,
+    )
+    report.ratio("speedup", before, after)
+    return report.finish()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
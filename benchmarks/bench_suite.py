@@ -0,0 +1,263 @@
+"""
+Benchmark suite of neomodel's client side hot paths: model class creation, query
+building, result resolution, inflate / deflate per property type, resolve_subgraph
+and NeomodelPath construction. No database is needed:
+
+    python benchmarks/bench_suite.py [--filter query] [--repeat 5] [--save base.json]
+    python benchmarks/bench_suite.py --compare base.json [--tolerance 0.15]
+
+Each benchmark reports the best time per operation out of --repeat runs. Results
+saved on one commit can be compared on another, see harness.py.
+"""
+
+import itertools
+import sys
+from collections.abc import Callable
+
+import harness
+from neo4j.graph import Graph, Node, Path
+
+from neomodel import (
+    ArrayProperty,
+    BooleanProperty,
+    DateProperty,
+    DateTimeProperty,
+    EmailProperty,
+    FloatProperty,
+    IntegerProperty,
+    JSONProperty,
+    NeomodelPath,
+    NodeSet,
+    Q,
+    RelationshipFrom,
+    RelationshipTo,
+    StringProperty,
+    StructuredNode,
+    StructuredRel,
+    UniqueIdProperty,
+    db,
+)
+from neomodel.sync_.match import QueryBuilder
+
+# name -> (setup returning the function to time, number of operations per call)
+BENCHMARKS: dict[str, tuple[Callable[[], Callable[[], object]], int]] = {}
+
+
+def benchmark(name: str, number: int) -> Callable:
+    def register(setup: Callable[[], Callable[[], object]]) -> Callable:
+        BENCHMARKS[name] = (setup, number)
+        return setup
+
+    return register
+
+
+class BenchCompany(StructuredNode):
+    name = StringProperty(unique_index=True)
+
+
+class BenchWorksFor(StructuredRel):
+    since = DateTimeProperty(default_now=True)
+
+
+class BenchPerson(StructuredNode):
+    uid = UniqueIdProperty()
+    name = StringProperty(index=True)
+    age = IntegerProperty(default=0)
+    height = FloatProperty()
+    active = BooleanProperty(default=True)
+    email = EmailProperty()
+    born = DateProperty()
+    tags = ArrayProperty(StringProperty())
+    employer = RelationshipTo(BenchCompany, "BENCH_WORKS_FOR", model=BenchWorksFor)
+    friends = RelationshipTo("BenchPerson", "BENCH_FRIEND")
+    friend_of = RelationshipFrom("BenchPerson", "BENCH_FRIEND")
+
+
+_class_names = itertools.count()
+
+
+@benchmark("class creation (30 properties, 10 relationships)", 200)
+def bench_class_creation() -> Callable[[], object]:
+    def run() -> None:
+        for _ in range(200):
+            namespace: dict = {}
+            for i in range(30):
+                if i % 2:
+                    namespace[f"s{i}"] = StringProperty(index=i % 3 == 0)
+                else:
+                    namespace[f"i{i}"] = IntegerProperty(default=0)
+            for i in range(10):
+                namespace[f"rel_{i}"] = RelationshipTo(BenchCompany, f"BENCH_REL_{i}")
+            # a new label each time, to be added to the class registry
+            type(f"BenchClass{next(_class_names)}", (StructuredNode,), namespace)
+
+    return run
+
+
+def query_benchmark(name: str, make_node_set: Callable[[], NodeSet]) -> None:
+    def setup() -> Callable[[], object]:
+        def run() -> None:
+            for _ in range(1000):
+                node_set = make_node_set()
+                node_set.query_cls(node_set).build_ast().build_query()
+
+        return run
+
+    benchmark(f"query: {name}", 1000)(setup)
+
+
+query_benchmark("filter", lambda: BenchPerson.nodes.filter(name="jim"))
+query_benchmark(
+    "filter Q exclude order_by slice",
+    lambda: BenchPerson.nodes.filter(
+        Q(name__istartswith="j") | Q(age__gte=30), active=True
+    )
+    .exclude(name__endswith="son")
+    .order_by("-age", "name")[10:20],
+)
+query_benchmark(
+    "filter through relationship",
+    lambda: BenchPerson.nodes.filter(employer__name="acme", friends__age__lt=30),
+)
+query_benchmark(
+    "has traverse",
+    lambda: BenchPerson.nodes.has(friends=True).traverse("employer", "friends"),
+)
+
+
+def make_person_node(graph: Graph, i: int) -> Node:
+    return Node(
+        graph,
+        f"4:bench:{i}",
+        i,
+        ["BenchPerson"],
+        {
+            "uid": f"{i:032x}",
+            "name": f"person {i}",
+            "age": i % 90,
+            "height": 1.8,
+            "active": True,
+            "email": f"person{i}@example.com",
+            "born": "1990-01-01",
+            "tags": ["a", "b"],
+        },
+    )
+
+
+@benchmark("result resolution (1000 rows)", 1000)
+def bench_result_resolution() -> Callable[[], object]:
+    graph = Graph()
+    rows = [[make_person_node(graph, i), i] for i in range(1000)]
+    # resolution happens in place
+    return lambda: db._result_resolution([list(row) for row in rows])
+
+
+# property, value as stored in the database
+PROPERTY_VALUES: list[tuple[str, object, object]] = [
+    ("StringProperty", StringProperty(), "some text"),
+    ("IntegerProperty", IntegerProperty(), 42),
+    ("FloatProperty", FloatProperty(), 4.2),
+    ("BooleanProperty", BooleanProperty(), True),
+    ("DateProperty", DateProperty(), "2024-05-17"),
+    ("DateTimeProperty", DateTimeProperty(), 1715904000.0),
+    ("EmailProperty", EmailProperty(), "jim@example.com"),
+    ("JSONProperty", JSONProperty(), '{"a": [1, 2], "b": null}'),
+    ("ArrayProperty(StringProperty)", ArrayProperty(StringProperty()), ["a", "b"]),
+    ("UniqueIdProperty", UniqueIdProperty(), "8d5e5f8e3c9d4c7a9b1f0e2d3c4b5a69"),
+]
+# give them the names their errors need
+BenchPropertyTypes = type(
+    "BenchPropertyTypes",
+    (StructuredNode,),
+    {f"p{i}": property for i, (_, property, _) in enumerate(PROPERTY_VALUES)},
+)
+
+
+def property_benchmarks(name: str, property: object, db_value: object) -> None:
+    def inflate() -> Callable[[], object]:
+        return lambda: [property.inflate(db_value) for _ in range(10000)]
+
+    def deflate() -> Callable[[], object]:
+        value = property.inflate(db_value)
+        return lambda: [property.deflate(value) for _ in range(10000)]
+
+    benchmark(f"inflate: {name}", 10000)(inflate)
+    benchmark(f"deflate: {name}", 10000)(deflate)
+
+
+for name, property, db_value in PROPERTY_VALUES:
+    property_benchmarks(name, property, db_value)
+
+
+@benchmark("inflate: StructuredNode (8 properties)", 10000)
+def bench_node_inflate() -> Callable[[], object]:
+    graph = Graph()
+    nodes = [make_person_node(graph, i) for i in range(10000)]
+    return lambda: [BenchPerson.inflate(node) for node in nodes]
+
+
+@benchmark("deflate: StructuredNode (8 properties)", 10000)
+def bench_node_deflate() -> Callable[[], object]:
+    person = BenchPerson.inflate(make_person_node(Graph(), 1))
+    properties = person.__properties__
+    return lambda: [BenchPerson.deflate(properties, person) for _ in range(10000)]
+
+
+class SyntheticQueryBuilder(QueryBuilder):
+    """Returns rows of synthetic nodes instead of running the query."""
+
+    rows: list[dict] = []
+
+    def _execute(self, lazy: bool = False, dict_output: bool = False):
+        for row in self.rows:
+            yield {name: db._object_resolution(value) for name, value in row.items()}
+
+
+@benchmark("resolve_subgraph (500 rows)", 500)
+def bench_resolve_subgraph() -> Callable[[], object]:
+    node_set = BenchPerson.nodes.traverse("employer")
+    node_set.query_cls = SyntheticQueryBuilder
+    names = node_set.query_cls(node_set).build_ast()._ast.subgraph["employer"]
+    graph = Graph()
+    works_for = graph.relationship_type("BENCH_WORKS_FOR")
+    SyntheticQueryBuilder.rows = []
+    for i in range(500):
+        person = make_person_node(graph, i)
+        company = Node(graph, f"4:company:{i}", i, ["BenchCompany"], {"name": "acme"})
+        relationship = works_for(graph, f"5:bench:{i}", i, {"since": 1715904000.0})
+        relationship._start_node, relationship._end_node = person, company
+        SyntheticQueryBuilder.rows.append(
+            {
+                "benchperson": person,
+                names["variable_name"]: company,
+                names["rel_variable_name"]: relationship,
+            }
+        )
+    return node_set.resolve_subgraph
+
+
+@benchmark("NeomodelPath (3 relationships)", 2000)
+def bench_path() -> Callable[[], object]:
+    graph = Graph()
+    friend = graph.relationship_type("BENCH_FRIEND")
+    nodes = [make_person_node(graph, i) for i in range(4)]
+    relationships = []
+    for i in range(3):
+        relationship = friend(graph, f"5:friend:{i}", i, {})
+        relationship._start_node, relationship._end_node = nodes[i], nodes[i + 1]
+        relationships.append(relationship)
+    path = Path(nodes[0], *relationships)
+    return lambda: [NeomodelPath(path) for _ in range(2000)]
+
+
+def main() -> int:
+    args = harness.parser(__doc__).parse_args()
+    report = harness.Report(args)
+    for name, (setup, number) in BENCHMARKS.items():
+        if report.wants(name):
+            report.time(name, setup(), number)
+    return report.finish()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+"""
+Measurement, reporting and save / compare logic shared by the benchmark scripts.
+
+Every script accepts the same options: --filter to only run the matching benchmarks,
+--repeat, and --save / --compare / --tolerance to compare results across commits.
+All the results are lower-is-better (time or bytes per operation): the ones higher
+than the saved ones by more than the tolerance are reported as regressions, and the
+exit status is then 1.
+"""
+
+import argparse
+import gc
+import json
+import platform
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import datetime, timezone
+
+from neomodel._version import __version__
+
+
+def time_per_op(fn: Callable[[], object], number: int, repeat: int) -> float:
+    """Return the best time of fn out of repeat runs, in microseconds per
+    operation, fn running number operations."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best / number * 1e6
+
+
+def bytes_per_item(fn: Callable[[], list], count: int) -> float:
+    """Return the memory still allocated after fn returned its count items,
+    in bytes per item."""
+    gc.collect()
+    tracemalloc.start()
+    items = fn()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(items) == count
+    return size / count
+
+
+def parser(description: str | None) -> argparse.ArgumentParser:
+    """Return an argument parser with the options common to all the scripts."""
+    parser = argparse.ArgumentParser(
+        description=description, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--filter", default="", help="only run matching benchmarks")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--save", help="save the results to this JSON file")
+    parser.add_argument("--compare", help="compare with results saved before")
+    parser.add_argument("--tolerance", type=float, default=0.15)
+    return parser
+
+
+class Report:
+    """Prints the results as they are measured, next to the saved ones."""
+
+    def __init__(self, args: argparse.Namespace) -> None:
+        self.args = args
+        self.results: dict[str, float] = {}
+        self.regressions: list[str] = []
+        self.baseline: dict[str, float] = {}
+        if args.compare:
+            with open(args.compare, encoding="utf-8") as file:
+                self.baseline = json.load(file)["results"]
+        print(f"neomodel {__version__}, Python {platform.python_version()}")
+
+    def wants(self, name: str) -> bool:
+        return self.args.filter in name
+
+    def add(self, name: str, value: float, unit: str) -> float:
+        self.results[name] = value
+        print(f"{name:<56}{value:>12,.2f} {unit}", end="")
+        if name in self.baseline:
+            ratio = value / self.baseline[name]
+            print(f"{ratio:>8.2f}x", end="")
+            if ratio > 1 + self.args.tolerance:
+                self.regressions.append(name)
+                print("  regression", end="")
+        print()
+        return value
+
+    def time(self, name: str, fn: Callable[[], object], number: int) -> float | None:
+        """Time fn, running number operations, unless filtered out."""
+        if not self.wants(name):
+            return None
+        return self.add(name, time_per_op(fn, number, self.args.repeat), "us/op")
+
+    def memory(self, name: str, fn: Callable[[], list], count: int) -> float | None:
+        """Measure the memory of the count items fn returns, unless filtered out."""
+        if not self.wants(name):
+            return None
+        return self.add(name, bytes_per_item(fn, count), "bytes/item")
+
+    def ratio(self, label: str, before: float | None, after: float | None) -> None:
+        """Print how many times faster or smaller after is than before."""
+        if before is not None and after is not None:
+            print(f"  {label:<54}{before / after:>12.2f}x")
+
+    def finish(self) -> int:
+        """Save the results if asked, and return the exit status."""
+        if self.args.save:
+            with open(self.args.save, "w", encoding="utf-8") as file:
+                json.dump(
+                    {
+                        "neomodel": __version__,
+                        "python": platform.python_version(),
+                        "date": datetime.now(timezone.utc).isoformat(),
+                        "results": self.results,
+                    },
+                    file,
+                    indent=2,
+                )
+        if self.regressions:
+            print(f"{len(self.regressions)} regressions since {self.args.compare}")
+            return 1
+        return 0
@@ -54,6 +54,7 @@ from neomodel.sync_.relationship_manager import (
     RelationshipManager,
     RelationshipTo,
 )
+from neomodel.util import Param, QueryEvent, QueryPlan
 
 __author__ = "Robin Edwards"
 __email__ = "robin.ge@gmail.com"
@@ -1,9 +1,116 @@
+import asyncio
+import contextvars
+import queue
+import threading
+import time
 import typing as t
+from concurrent.futures import ThreadPoolExecutor
+
+# number of items each iterator can produce ahead of the consumer in merge()
+MERGE_BUFFER_SIZE = 1000
 
 
 class AsyncUtil:
     is_async_code: t.ClassVar = True
+    sleep: t.ClassVar = staticmethod(asyncio.sleep)
+
+    @staticmethod
+    async def merge(
+        iterables: t.Sequence[t.AsyncIterable], buffer_size: int = MERGE_BUFFER_SIZE
+    ) -> t.AsyncIterator:
+        """
+        Consume async iterables concurrently, each in its own task, and yield their
+        items as they arrive. The first error raised by an iterable is raised, and
+        the remaining tasks are cancelled when the iteration ends for any reason.
+        """
+        items: asyncio.Queue = asyncio.Queue(buffer_size)
+
+        async def consume(iterable: t.AsyncIterable) -> None:
+            try:
+                async for item in iterable:
+                    await items.put((True, item))
+            except Exception as exc:
+                await items.put((False, exc))
+            else:
+                await items.put((False, None))
+
+        tasks = [asyncio.create_task(consume(iterable)) for iterable in iterables]
+        running = len(tasks)
+        try:
+            while running:
+                is_item, value = await items.get()
+                if is_item:
+                    yield value
+                    continue
+                running -= 1
+                if value is not None:
+                    raise value
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
 
 class Util:
     is_async_code: t.ClassVar = False
+    sleep: t.ClassVar = staticmethod(time.sleep)
+
+    @staticmethod
+    def merge(
+        iterables: t.Sequence[t.Iterable], buffer_size: int = MERGE_BUFFER_SIZE
+    ) -> t.Iterator:
+        """
+        Consume iterables concurrently, each in its own thread, and yield their
+        items as they arrive. The first error raised by an iterable is raised, and
+        the remaining threads stop when the iteration ends for any reason.
+
+        Each thread runs in a copy of the current context, so that it sees the
+        connection set up by the caller but keeps its own session and transaction.
+        """
+        items: queue.Queue = queue.Queue(buffer_size)
+        stopped = threading.Event()
+
+        def put(entry: tuple[bool, t.Any]) -> bool:
+            # don't block forever on a full queue once the consumer is gone
+            while not stopped.is_set():
+                try:
+                    items.put(entry, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def consume(iterable: t.Iterable) -> None:
+            iterator = iter(iterable)
+            try:
+                for item in iterator:
+                    if not put((True, item)):
+                        return
+            except Exception as exc:
+                put((False, exc))
+            else:
+                put((False, None))
+            finally:
+                # release the session of a generator stopped early
+                close = getattr(iterator, "close", None)
+                if close is not None:
+                    close()
+
+        if not iterables:
+            return
+        executor = ThreadPoolExecutor(max_workers=len(iterables))
+        try:
+            for iterable in iterables:
+                executor.submit(contextvars.copy_context().run, consume, iterable)
+            running = len(iterables)
+            while running:
+                is_item, value = items.get()
+                if is_item:
+                    yield value
+                    continue
+                running -= 1
+                if value is not None:
+                    raise value
+        finally:
+            stopped.set()
+            executor.shutdown(wait=True)
@@ -0,0 +1,265 @@
+"""
+Cassettes of queries and their results, recorded from and replayed by the fake
+drivers of neomodel.testing.
+"""
+
+import base64
+import json
+from typing import Any
+
+import neo4j.time
+from neo4j import Record, SummaryCounters
+from neo4j.exceptions import Neo4jError
+from neo4j.graph import Graph, Node, Path, Relationship
+from neo4j.spatial import CartesianPoint, Point, WGS84Point
+
+CASSETTE_VERSION = 1
+
+_TIME_TYPES = {
+    cls.__name__: cls for cls in (neo4j.time.Date, neo4j.time.DateTime, neo4j.time.Time)
+}
+_POINT_TYPES = {cls.__name__: cls for cls in (CartesianPoint, WGS84Point)}
+
+
+class CassetteMismatch(AssertionError):
+    """Raised when a query is replayed which wasn't recorded in the cassette."""
+
+
+def encode_value(value: Any) -> Any:
+    """Convert a value returned by the driver to JSON compatible values."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, dict):
+        return {"$map": {key: encode_value(item) for key, item in value.items()}}
+    if isinstance(value, Node):
+        return {"$node": _encode_node(value)}
+    if isinstance(value, Relationship):
+        return {"$relationship": _encode_relationship(value)}
+    if isinstance(value, Path):
+        return {
+            "$path": {
+                "nodes": [_encode_node(node) for node in value.nodes],
+                "relationships": [
+                    _encode_relationship(rel) for rel in value.relationships
+                ],
+            }
+        }
+    if isinstance(value, (bytes, bytearray)):
+        return {"$bytes": base64.b64encode(value).decode("ascii")}
+    if isinstance(value, neo4j.time.Duration):
+        return {"$time": ["Duration", value.iso_format()]}
+    if type(value).__name__ in _TIME_TYPES:
+        return {"$time": [type(value).__name__, value.iso_format()]}
+    if isinstance(value, Point):
+        return {"$point": [type(value).__name__, list(value)]}
+    # after Duration and Point, which are tuples too
+    if isinstance(value, (list, tuple)):
+        return [encode_value(item) for item in value]
+    raise TypeError(f"Cannot record values of type {type(value).__name__}")
+
+
+def _encode_parameters(parameters: dict | None) -> dict:
+    # parameters are only kept for reference, values not returned by the driver
+    # like Python dates are kept as their repr
+    encoded = {}
+    for name, value in (parameters or {}).items():
+        try:
+            encoded[name] = encode_value(value)
+        except TypeError:
+            encoded[name] = {"$repr": repr(value)}
+    return encoded
+
+
+# the legacy ids are read from _id, as the id properties are deprecated
+def _encode_node(node: Node) -> dict:
+    return {
+        "element_id": node.element_id,
+        "id": node._id,
+        "labels": sorted(node.labels),
+        "properties": encode_value(dict(node))["$map"],
+    }
+
+
+def _encode_relationship(rel: Relationship) -> dict:
+    return {
+        "element_id": rel.element_id,
+        "id": rel._id,
+        "type": rel.type,
+        "start": _encode_node(rel.start_node) if rel.start_node else None,
+        "end": _encode_node(rel.end_node) if rel.end_node else None,
+        "properties": encode_value(dict(rel))["$map"],
+    }
+
+
+class _Decoder:
+    """Decodes the values of a result, sharing nodes by element id like the driver."""
+
+    def __init__(self) -> None:
+        self.graph = Graph()
+        self.nodes: dict[str, Node] = {}
+
+    def decode(self, value: Any) -> Any:
+        if isinstance(value, list):
+            return [self.decode(item) for item in value]
+        if not isinstance(value, dict):
+            return value
+        ((tag, data),) = value.items()
+        match tag:
+            case "$map":
+                return {key: self.decode(item) for key, item in data.items()}
+            case "$node":
+                return self.node(data)
+            case "$relationship":
+                return self.relationship(data)
+            case "$path":
+                return Path(
+                    self.node(data["nodes"][0]),
+                    *(self.relationship(rel) for rel in data["relationships"]),
+                )
+            case "$bytes":
+                return base64.b64decode(data)
+            case "$time":
+                name, iso = data
+                if name == "Duration":
+                    return neo4j.time.Duration.from_iso_format(iso)
+                return _TIME_TYPES[name].from_iso_format(iso)
+            case "$point":
+                name, coordinates = data
+                return _POINT_TYPES[name](coordinates)
+        raise ValueError(f"Unknown value tag {tag!r} in cassette")
+
+    def node(self, data: dict) -> Node:
+        node = self.nodes.get(data["element_id"])
+        if node is None:
+            node = Node(
+                self.graph,
+                data["element_id"],
+                data["id"],
+                data["labels"],
+                self.decode({"$map": data["properties"]}),
+            )
+            self.nodes[data["element_id"]] = node
+        return node
+
+    def relationship(self, data: dict) -> Relationship:
+        cls = self.graph.relationship_type(data["type"])
+        rel = cls(
+            self.graph,
+            data["element_id"],
+            data["id"],
+            self.decode({"$map": data["properties"]}),
+        )
+        rel._start_node = self.node(data["start"]) if data["start"] else None
+        rel._end_node = self.node(data["end"]) if data["end"] else None
+        return rel
+
+
+class RecordedSummary:
+    """The parts of a ResultSummary kept in cassettes."""
+
+    def __init__(self, data: dict) -> None:
+        self.query_type = data.get("query_type")
+        self.plan = data.get("plan")
+        self.profile = data.get("profile")
+        self.counters = SummaryCounters(data.get("stats", {}))
+        self.result_available_after = data.get("result_available_after")
+        self.result_consumed_after = data.get("result_consumed_after")
+        self.notifications = None
+
+    @staticmethod
+    def encode(summary: Any) -> dict:
+        return {
+            "query_type": summary.query_type,
+            "plan": summary.plan,
+            "profile": summary.profile,
+            "stats": getattr(summary, "metadata", {}).get("stats", {}),
+            "result_available_after": summary.result_available_after,
+            "result_consumed_after": summary.result_consumed_after,
+        }
+
+
+class Cassette:
+    """
+    Queries run through a fake driver, with their records, or the error raised,
+    in the order they were run. Stored as JSON.
+    """
+
+    def __init__(self, interactions: list[dict] | None = None) -> None:
+        self.interactions: list[dict] = interactions or []
+        self._replayed: set[int] = set()
+
+    @classmethod
+    def load(cls, path: str) -> "Cassette":
+        with open(path, encoding="utf-8") as file:
+            data = json.load(file)
+        if data.get("version") != CASSETTE_VERSION:
+            raise ValueError(f"Unsupported cassette version {data.get('version')}")
+        return cls(data["interactions"])
+
+    def save(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(
+                {"version": CASSETTE_VERSION, "interactions": self.interactions},
+                file,
+                indent=1,
+            )
+
+    def record(
+        self,
+        query: str,
+        parameters: dict | None,
+        keys: list[str],
+        records: list[list],
+        summary: Any,
+    ) -> None:
+        self.interactions.append(
+            {
+                "query": query,
+                "parameters": _encode_parameters(parameters),
+                "keys": list(keys),
+                "records": [encode_value(values) for values in records],
+                "summary": RecordedSummary.encode(summary),
+            }
+        )
+
+    def record_error(
+        self, query: str, parameters: dict | None, error: Neo4jError
+    ) -> None:
+        self.interactions.append(
+            {
+                "query": query,
+                "parameters": _encode_parameters(parameters),
+                "error": {"code": error.code, "message": error.message},
+            }
+        )
+
+    def replay(
+        self, query: str, ordered: bool = True
+    ) -> tuple[list[str], list[Record], RecordedSummary]:
+        """
+        Return the keys, records and summary recorded for the query: the next
+        recorded query if ordered, or else the first not yet replayed one with the
+        same text. Raises the recorded error if the query failed.
+        """
+        for index, interaction in enumerate(self.interactions):
+            if index in self._replayed:
+                continue
+            if interaction["query"] == query:
+                break
+            if ordered:
+                raise CassetteMismatch(
+                    f"Expected query {interaction['query']!r}, got {query!r}"
+                )
+        else:
+            raise CassetteMismatch(f"No recorded query left for {query!r}")
+
+        self._replayed.add(index)
+        if "error" in interaction:
+            raise Neo4jError._hydrate_neo4j(**interaction["error"])
+        decoder = _Decoder()
+        keys = interaction["keys"]
+        records = [
+            Record(zip(keys, decoder.decode(values)))
+            for values in interaction["records"]
+        ]
+        return keys, records, RecordedSummary(interaction["summary"])
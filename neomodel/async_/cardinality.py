@@ -4,7 +4,6 @@ from neomodel.async_.relationship_manager import (  # pylint:disable=unused-impo
     AsyncRelationshipManager,
     AsyncZeroOrMore,
 )
-from neomodel.config import get_config
 from neomodel.exceptions import AttemptedCardinalityViolation, CardinalityViolation
 
 if TYPE_CHECKING:
@@ -15,18 +14,7 @@ class AsyncZeroOrOne(AsyncRelationshipManager):
     """A relationship to zero or one node."""
 
     description = "zero or one relationship"
-
-    async def check_cardinality(self, node: "AsyncStructuredNode") -> None:
-        if await self.get_len():
-            detailed_description = str(self)
-            if get_config().soft_cardinality_check:
-                print(
-                    f"Cardinality violation detected : Node already has {detailed_description}, should not connect more. Soft check is enabled so the relationship will be created."
-                )
-            else:
-                raise AttemptedCardinalityViolation(
-                    f"Node already has {detailed_description}. Use reconnect() to replace the existing relationship."
-                )
+    max_connections = 1
 
     async def single(self) -> Optional["AsyncStructuredNode"]:
         """
@@ -109,18 +97,7 @@ class AsyncOne(AsyncRelationshipManager):
     """
 
     description = "one relationship"
-
-    async def check_cardinality(self, node: "AsyncStructuredNode") -> None:
-        if await self.get_len():
-            detailed_description = str(self)
-            if get_config().soft_cardinality_check:
-                print(
-                    f"Cardinality violation detected : Node already has {detailed_description}, should not connect more. Soft check is enabled so the relationship will be created."
-                )
-            else:
-                raise AttemptedCardinalityViolation(
-                    f"Node already has {detailed_description}. Use reconnect() to replace the existing relationship."
-                )
+    max_connections = 1
 
     async def single(self) -> "AsyncStructuredNode":
         """
@@ -6,6 +6,7 @@ import logging
 import os
 import sys
 import time
+from contextlib import aclosing
 from contextvars import ContextVar
 from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, TextIO
 from urllib.parse import quote, unquote, urlparse
@@ -54,14 +55,20 @@ from neomodel.exceptions import (
     RelationshipClassNotDefined,
     UniqueProperty,
 )
+from neomodel.hooks import _exec_hook
 from neomodel.properties import FulltextIndex, Property, VectorIndex
-from neomodel.util import version_tag_to_integer
+from neomodel.util import QueryEvent, QueryPlan, version_tag_to_integer
 
 # The imports inside this block are only for type checking tools (like mypy or IDEs) to help with code hints and error checking.
 # These imports are ignored when the code actually runs, so they don't affect runtime performance or cause circular import problems.
 if TYPE_CHECKING:
     from neomodel.async_.node import AsyncStructuredNode  # type: ignore
-    from neomodel.async_.transaction import AsyncTransactionProxy, ImpersonationHandler
+    from neomodel.async_.transaction import (
+        AsyncTransactionProxy,
+        ImpersonationHandler,
+        NPlusOneDetector,
+        QueryCounter,
+    )
 
 logger = logging.getLogger(__name__)
 
@@ -84,11 +91,7 @@ def ensure_connection(func: Callable) -> Callable:
             _db = self
 
         if not _db.driver:
-            config = get_config()
-            if hasattr(config, "database_url") and config.database_url:
-                await _db.set_connection(url=config.database_url)
-            elif hasattr(config, "driver") and config.driver:
-                await _db.set_connection(driver=config.driver)
+            await _db._connect_from_config()
 
         return await func(self, *args, **kwargs)
 
@@ -156,6 +159,17 @@ class AsyncDatabase:
         self.__parallel_runtime: ContextVar[bool | None] = ContextVar(
             "_parallel_runtime", default=False
         )
+        self.__identity_map: ContextVar[dict[str, Any] | None] = ContextVar(
+            "_identity_map", default=None
+        )
+        self.__query_counters: ContextVar[tuple["QueryCounter", ...]] = ContextVar(
+            "_query_counters", default=()
+        )
+        self.__n_plus_one_detector: ContextVar["NPlusOneDetector | None"] = ContextVar(
+            "_n_plus_one_detector", default=None
+        )
+        # Shared by all contexts, see add_query_listener
+        self._query_listeners: list[Callable[[QueryEvent], Any]] = []
 
         # Mark the singleton as initialized
         AsyncDatabase._initialized = True
@@ -250,6 +264,30 @@ class AsyncDatabase:
     def _database_edition(self, value: str | None) -> None:
         self.__database_edition.set(value)
 
+    @property
+    def _identity_map(self) -> dict[str, Any] | None:
+        return self.__identity_map.get()
+
+    @_identity_map.setter
+    def _identity_map(self, value: dict[str, Any] | None) -> None:
+        self.__identity_map.set(value)
+
+    @property
+    def _query_counters(self) -> tuple["QueryCounter", ...]:
+        return self.__query_counters.get()
+
+    @_query_counters.setter
+    def _query_counters(self, value: tuple["QueryCounter", ...]) -> None:
+        self.__query_counters.set(value)
+
+    @property
+    def _n_plus_one_detector(self) -> "NPlusOneDetector | None":
+        return self.__n_plus_one_detector.get()
+
+    @_n_plus_one_detector.setter
+    def _n_plus_one_detector(self, value: "NPlusOneDetector | None") -> None:
+        self.__n_plus_one_detector.set(value)
+
     @property
     def impersonated_user(self) -> str | None:
         return self.__impersonated_user.get()
@@ -266,6 +304,16 @@ class AsyncDatabase:
     def _parallel_runtime(self, value: bool | None) -> None:
         self.__parallel_runtime.set(value)
 
+    async def _connect_from_config(self) -> None:
+        """
+        Connect using the database_url or driver of the configuration, if any.
+        """
+        config = get_config()
+        if hasattr(config, "database_url") and config.database_url:
+            await self.set_connection(url=config.database_url)
+        elif hasattr(config, "driver") and config.driver:
+            await self.set_connection(driver=config.driver)
+
     async def set_connection(
         self, url: str | None = None, driver: AsyncDriver | None = None
     ) -> None:
@@ -421,6 +469,54 @@ class AsyncDatabase:
             self, access_mode=ACCESS_MODE_READ, parallel_runtime=True
         )
 
+    def session_cache(self) -> "SessionCache":
+        """
+        Within this context manager, a node appearing several times in query results
+        (in several rows, paths or queries) is resolved to the same instance, inflated
+        only the first time. Nodes are identified by their element_id.
+
+        Returns:
+            SessionCache: Context manager enabling the identity map
+        """
+        from neomodel.async_.transaction import SessionCache  # type: ignore
+
+        return SessionCache(self)
+
+    def assert_max_queries(self, max_queries: int) -> "QueryCounter":
+        """
+        Within this context manager, the queries run are recorded, including by the
+        tasks or threads started in it, and an AssertionError listing them is raised
+        on exit if there were more than max_queries. The QueryEvent of each query
+        is kept in the queries attribute of the context manager.
+
+        Returns:
+            QueryCounter: Context manager counting the queries
+        """
+        from neomodel.async_.transaction import QueryCounter  # type: ignore
+
+        return QueryCounter(self, max_queries)
+
+    def detect_n_plus_one(self, threshold: int | None = None) -> "NPlusOneDetector":
+        """
+        Within this context manager, an NPlusOneWarning is emitted when the same
+        query, literal values aside, runs more than threshold times, e.g. when a
+        relationship is fetched for each node of a loop. The warning points at the
+        code which ran the query. Set config.n_plus_one_threshold to detect them in
+        every transaction block instead.
+
+        Args:
+            threshold (int): Number of times a query can run, by default
+                config.n_plus_one_threshold, or 10 if it is not set
+
+        Returns:
+            NPlusOneDetector: Context manager detecting the repeated queries
+        """
+        from neomodel.async_.transaction import NPlusOneDetector  # type: ignore
+
+        if threshold is None:
+            threshold = get_config().n_plus_one_threshold or 10
+        return NPlusOneDetector(self, threshold)
+
     async def impersonate(self, user: str) -> "ImpersonationHandler":
         """All queries executed within this context manager will be executed as impersonated user
 
@@ -454,12 +550,8 @@ class AsyncDatabase:
 
         assert self.driver is not None, "Driver has not been created"
 
-        self._session = self.driver.session(
-            default_access_mode=access_mode,
-            database=self._database_name,
-            impersonated_user=self.impersonated_user,
-            **parameters,
-        )
+        parameters.setdefault("fetch_size", get_config().fetch_size)
+        self._session = self._open_session(access_mode, **parameters)
 
         assert self._session is not None, "Session has not been created"
         self._active_transaction = await self._session.begin_transaction()
@@ -526,6 +618,28 @@ class AsyncDatabase:
             # The database server is not running yet
             pass
 
+    def _resolve_node(self, node: Node) -> Any:
+        """
+        Inflate a Node into an instance of the class registered for its labels.
+        """
+        _labels = frozenset(node.labels)
+        if _labels in self._NODE_CLASS_REGISTRY:
+            return self._NODE_CLASS_REGISTRY[_labels].inflate(node)
+        elif (
+            self._database_name is not None
+            and self._database_name in self._DB_SPECIFIC_CLASS_REGISTRY
+            and _labels in self._DB_SPECIFIC_CLASS_REGISTRY[self._database_name]
+        ):
+            return self._DB_SPECIFIC_CLASS_REGISTRY[self._database_name][
+                _labels
+            ].inflate(node)
+        else:
+            raise NodeClassNotDefined(
+                node,
+                self._NODE_CLASS_REGISTRY,
+                self._DB_SPECIFIC_CLASS_REGISTRY,
+            )
+
     def _object_resolution(self, object_to_resolve: Any) -> Any:
         """
         Performs in place automatic object resolution on a result
@@ -554,23 +668,15 @@ class AsyncDatabase:
         # Consequently, the type checking was changed for both
         # Node, Relationship objects
         if isinstance(object_to_resolve, Node):
-            _labels = frozenset(object_to_resolve.labels)
-            if _labels in self._NODE_CLASS_REGISTRY:
-                return self._NODE_CLASS_REGISTRY[_labels].inflate(object_to_resolve)
-            elif (
-                self._database_name is not None
-                and self._database_name in self._DB_SPECIFIC_CLASS_REGISTRY
-                and _labels in self._DB_SPECIFIC_CLASS_REGISTRY[self._database_name]
-            ):
-                return self._DB_SPECIFIC_CLASS_REGISTRY[self._database_name][
-                    _labels
-                ].inflate(object_to_resolve)
-            else:
-                raise NodeClassNotDefined(
-                    object_to_resolve,
-                    self._NODE_CLASS_REGISTRY,
-                    self._DB_SPECIFIC_CLASS_REGISTRY,
-                )
+            identity_map = self._identity_map
+            if identity_map is not None:
+                # resolve each node only once, see session_cache
+                node = identity_map.get(object_to_resolve.element_id)
+                if node is None:
+                    node = self._resolve_node(object_to_resolve)
+                    identity_map[object_to_resolve.element_id] = node
+                return node
+            return self._resolve_node(object_to_resolve)
 
         if isinstance(object_to_resolve, Relationship):
             rel_type = frozenset([object_to_resolve.type])
@@ -635,6 +741,76 @@ class AsyncDatabase:
 
         return result_list
 
+    def _open_session(
+        self, access_mode: str | None = None, **parameters: Any
+    ) -> AsyncSession:
+        assert self.driver is not None, "Driver has not been created"
+        if get_config().route_reads:
+            # chain all the sessions with bookmarks, so that reads routed to another
+            # member of the cluster see the writes made before them
+            parameters.setdefault(
+                "bookmark_manager", self.driver.execute_query_bookmark_manager
+            )
+        return self.driver.session(
+            default_access_mode=access_mode or ACCESS_MODE_WRITE,
+            database=self._database_name,
+            impersonated_user=self.impersonated_user,
+            **parameters,
+        )
+
+    def _read_access_mode(self, access_mode: str | None = None) -> str:
+        """
+        Access mode of the read-only queries run by neomodel outside transactions:
+        access_mode if given, otherwise READ if config.route_reads is set, so that
+        the cluster routes them to its followers and read replicas, or else WRITE.
+        """
+        if access_mode is not None:
+            return access_mode
+        return ACCESS_MODE_READ if get_config().route_reads else ACCESS_MODE_WRITE
+
+    def add_query_listener(self, listener: Callable[[QueryEvent], Any]) -> None:
+        """
+        Register a function called with a QueryEvent after each query run by neomodel,
+        including streamed ones, e.g. to log or measure them. Listeners are called in
+        the thread or task which ran the query, and their errors are logged and ignored.
+        """
+        self._query_listeners.append(listener)
+
+    def remove_query_listener(self, listener: Callable[[QueryEvent], Any]) -> None:
+        self._query_listeners.remove(listener)
+
+    def _is_instrumented(self) -> bool:
+        config = get_config()
+        return bool(
+            self._query_listeners
+            or config.cypher_debug
+            or config.slow_queries
+            or self._query_counters
+            or self._n_plus_one_detector
+        )
+
+    def _emit_query_event(self, event: QueryEvent) -> None:
+        config = get_config()
+        if (
+            config.cypher_debug or config.slow_queries
+        ) and event.duration >= config.slow_queries:
+            # params are only formatted if the message is emitted
+            logger.debug(
+                "query: %s\nparams: %r\ntook: %.2gs\n",
+                event.query,
+                event.params,
+                event.duration,
+            )
+        for counter in self._query_counters:
+            counter.queries.append(event)
+        if self._n_plus_one_detector is not None:
+            self._n_plus_one_detector.add(event.query)
+        for listener in self._query_listeners:
+            try:
+                listener(event)
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.exception("Query listener %r failed", listener)
+
     @ensure_connection
     async def cypher_query(
         self,
@@ -643,6 +819,7 @@ class AsyncDatabase:
         handle_unique: bool = True,
         retry_on_session_expire: bool = False,
         resolve_objects: bool = False,
+        access_mode: str | None = None,
     ) -> tuple[list | None, tuple[str, ...] | None]:
         """
         Runs a query on the database and returns a list of results and their headers.
@@ -658,6 +835,9 @@ class AsyncDatabase:
         :type: bool
         :param resolve_objects: Whether to attempt to resolve the returned nodes to data model objects automatically
         :type: bool
+        :param access_mode: Access mode of the session when no transaction is active, READ to route a read-only
+        query to the followers and read replicas of a cluster. WRITE by default.
+        :type: str
 
         :return: A tuple containing a list of results and a tuple of headers.
         """
@@ -676,10 +856,7 @@ class AsyncDatabase:
         else:
             # Otherwise create a new session in a with to dispose of it after it has been run
             if self.driver:
-                async with self.driver.session(
-                    database=self._database_name,
-                    impersonated_user=self.impersonated_user,
-                ) as session:
+                async with self._open_session(access_mode) as session:
                     results, meta = await self._run_cypher_query(
                         session,
                         query,
@@ -693,6 +870,46 @@ class AsyncDatabase:
 
         return results, meta
 
+    @ensure_connection
+    async def explain_query(
+        self,
+        query: str,
+        params: dict[str, Any] | None = None,
+        profile: bool = False,
+    ) -> QueryPlan:
+        """
+        Returns the execution plan of a query, prefixed with EXPLAIN, without running
+        it. With profile, the query is run prefixed with PROFILE instead, and the plan
+        holds the actual number of rows and database hits of each operator. The
+        query runs in the current transaction if any.
+
+        :param query: A CYPHER query
+        :type: str
+        :param params: Dictionary of parameters
+        :type: dict
+        :param profile: Whether to run the query to profile it
+        :type: bool
+        :return: the plan tree of the query
+        """
+        prefix = "PROFILE" if profile else "EXPLAIN"
+
+        async def run(session: AsyncSession | AsyncTransaction) -> Any:
+            response = await session.run(
+                query=f"{prefix} {query}", parameters=params or {}
+            )
+            return await response.consume()
+
+        if self._active_transaction:
+            summary = await run(self._active_transaction)
+        elif self.driver:
+            async with self._open_session() as session:
+                summary = await run(session)
+        else:
+            raise ValueError("No driver has been set")
+
+        plan = summary.profile if profile else summary.plan
+        return QueryPlan.from_summary(plan, query=query)
+
     async def _run_cypher_query(
         self,
         session: AsyncSession | AsyncTransaction,
@@ -704,12 +921,30 @@ class AsyncDatabase:
     ) -> tuple[list | None, tuple[str, ...] | None]:
         try:
             # Retrieve the data
-            start = time.time()
+            start = time.perf_counter()
             if self._parallel_runtime:
                 query = "CYPHER runtime=parallel " + query
             response: AsyncResult = await session.run(query=query, parameters=params)
-            results, meta = [list(r.values()) async for r in response], response.keys()
-            end = time.time()
+            meta = response.keys()
+            if self._is_instrumented():
+                results, first_record_at = [], None
+                async for record in response:
+                    if first_record_at is None:
+                        first_record_at = time.perf_counter()
+                    results.append(list(record.values()))
+                summary = await response.consume()
+                self._emit_query_event(
+                    QueryEvent(
+                        query,
+                        params,
+                        time.perf_counter() - start,
+                        first_record_at and first_record_at - start,
+                        len(results),
+                        summary,
+                    )
+                )
+            else:
+                results = [list(r.values()) async for r in response]
 
             if resolve_objects:
                 # Do any automatic resolution required
@@ -739,18 +974,6 @@ class AsyncDatabase:
                 )
             raise
 
-        tte = end - start
-        if os.environ.get("NEOMODEL_CYPHER_DEBUG", False) and tte > float(
-            os.environ.get("NEOMODEL_SLOW_QUERIES", 0)
-        ):
-            logger.debug(
-                "query: "
-                + query
-                + "\nparams: "
-                + repr(params)
-                + f"\ntook: {tte:.2g}s\n"
-            )
-
         return results, meta
 
     async def _stream_cypher_query(
@@ -774,8 +997,10 @@ class AsyncDatabase:
         :param resolve_objects: Whether to resolve nodes to neomodel objects
         :yields: Tuple of (values_list, keys_tuple) for each record
         """
+        instrumented = self._is_instrumented()
+        record_count, first_record_at = 0, None
         try:
-            start = time.time()
+            start = time.perf_counter()
             if self._parallel_runtime:
                 query = "CYPHER runtime=parallel " + query
 
@@ -784,6 +1009,10 @@ class AsyncDatabase:
 
             # Stream results one record at a time
             async for record in response:
+                if instrumented:
+                    record_count += 1
+                    if first_record_at is None:
+                        first_record_at = time.perf_counter()
                 values = list(record.values())
 
                 if resolve_objects:
@@ -793,19 +1022,34 @@ class AsyncDatabase:
 
                 yield values, keys
 
-            end = time.time()
-            tte = end - start
-            if os.environ.get("NEOMODEL_CYPHER_DEBUG", False) and tte > float(
-                os.environ.get("NEOMODEL_SLOW_QUERIES", 0)
-            ):
-                logger.debug(
-                    "query: "
-                    + query
-                    + "\nparams: "
-                    + repr(params)
-                    + f"\ntook: {tte:.2g}s\n"
+            if instrumented:
+                summary = await response.consume()
+                self._emit_query_event(
+                    QueryEvent(
+                        query,
+                        params,
+                        time.perf_counter() - start,
+                        first_record_at and first_record_at - start,
+                        record_count,
+                        summary,
+                        streamed=True,
+                    )
                 )
 
+        except GeneratorExit:
+            # closed before the last record, no summary is available
+            if instrumented:
+                self._emit_query_event(
+                    QueryEvent(
+                        query,
+                        params,
+                        time.perf_counter() - start,
+                        first_record_at and first_record_at - start,
+                        record_count,
+                        streamed=True,
+                    )
+                )
+            raise
         except ClientError as e:
             if e.code == "Neo.ClientError.Schema.ConstraintValidationFailed":
                 if hasattr(e, "message") and e.message is not None:
@@ -820,6 +1064,116 @@ class AsyncDatabase:
             if exc_info[1] is not None and exc_info[2] is not None:
                 raise exc_info[1].with_traceback(exc_info[2])
 
+    async def _stream_query(
+        self,
+        query: str,
+        params: dict[str, Any],
+        handle_unique: bool = True,
+        resolve_objects: bool = False,
+        fetch_size: int | None = None,
+        access_mode: str | None = None,
+    ) -> AsyncIterator[tuple[list, tuple[str, ...]]]:
+        """
+        Stream the records of a query, see _stream_cypher_query.
+
+        The query runs in the active transaction if any. Otherwise a session is opened
+        in access_mode (WRITE by default) for the lifetime of the iterator and records
+        are pulled fetch_size at a time (config.fetch_size by default), so that memory
+        stays bounded whatever the size of the result. Closing the iterator before the
+        end closes the session, which discards the remaining records and releases the
+        connection.
+        """
+        if self._active_transaction:
+            async for row in self._stream_cypher_query(
+                self._active_transaction,
+                query,
+                params,
+                handle_unique=handle_unique,
+                resolve_objects=resolve_objects,
+            ):
+                yield row
+            return
+
+        if not self.driver:
+            await self._connect_from_config()
+        if not self.driver:
+            raise ValueError("No driver has been set")
+        async with self._open_session(
+            access_mode, fetch_size=fetch_size or get_config().fetch_size
+        ) as session:
+            async for row in self._stream_cypher_query(
+                session,
+                query,
+                params,
+                handle_unique=handle_unique,
+                resolve_objects=resolve_objects,
+            ):
+                yield row
+
+    async def _stream_columns(
+        self,
+        query: str,
+        params: dict[str, Any],
+        chunk_size: int | None = None,
+        access_mode: str | None = None,
+    ) -> AsyncIterator[tuple[list[list], tuple[str, ...]]]:
+        """
+        Stream the records of a query as columns, i.e. one list of values per field,
+        of at most chunk_size records (all of them by default), and the field names.
+        Nothing is returned when the query returns no records.
+        """
+        buffers: list[list] = []
+        keys: tuple[str, ...] = ()
+        records = self._stream_query(query, params, access_mode=access_mode)
+        async with aclosing(records):
+            async for values, keys in records:
+                if not buffers:
+                    buffers = [[] for _ in values]
+                for buffer, value in zip(buffers, values):
+                    buffer.append(value)
+                if chunk_size and len(buffers[0]) >= chunk_size:
+                    yield buffers, keys
+                    buffers = []
+        if buffers:
+            yield buffers, keys
+
+    async def cypher_query_arrow(
+        self,
+        query: str,
+        params: dict[str, Any] | None = None,
+        batch_size: int | None = None,
+        schema: Any = None,
+    ) -> AsyncIterator:
+        """
+        Runs a query on the database and streams the results as Apache Arrow record
+        batches. The values are gathered into one list per column and converted
+        column by column. Requires pyarrow to be installed.
+
+        :param query: A CYPHER query
+        :type: str
+        :param params: Dictionary of parameters
+        :type: dict
+        :param batch_size: maximum number of rows per batch, the fetch_size
+            configuration option by default
+        :type: int
+        :param schema: a pyarrow.Schema for the batches. By default the type of each
+            column is inferred from its first non null values, and the batches are
+            held back until the types of all the columns are known
+        :return: pyarrow.RecordBatch iterator, all the batches with the same schema
+        """
+        from neomodel.integration.arrow import RecordBatchBuilder
+
+        if batch_size is None:
+            batch_size = get_config().fetch_size
+        builder = RecordBatchBuilder(schema)
+        async for buffers, keys in self._stream_columns(
+            query, params or {}, batch_size if batch_size > 0 else None
+        ):
+            for batch in builder.add(buffers, names=keys):
+                yield batch
+        for batch in builder.finish():
+            yield batch
+
     async def get_id_method(self) -> str:
         db_version = await self.database_version
         if db_version is None:
@@ -841,6 +1195,119 @@ class AsyncDatabase:
             int(element_id) if db_version.startswith(VERSION_LEGACY_ID) else element_id
         )
 
+    async def save_all(
+        self, instances: Any, batch_size: int | None = None
+    ) -> list[Any]:
+        """
+        Save many node instances, of any classes, with one UNWIND statement per class
+        and operation instead of one query per node: unsaved nodes are created and
+        receive their element id, saved nodes are updated with their changed properties
+        (see StructuredNode.save). The pre_save and post_save hooks (and post_create
+        for new nodes) are called as with save(). Statements run in the active
+        transaction, or in a new one.
+
+        :param instances: the StructuredNode instances to save
+        :param batch_size: Optional, overrides the batch_size configuration option
+        :return: the instances
+        """
+        from neomodel.async_.node import AsyncStructuredNode
+
+        instances = list(instances)
+        batch_size = int(batch_size or get_config().batch_size)
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        for instance in instances:
+            if not isinstance(instance, AsyncStructuredNode):
+                raise TypeError(f"Expected a StructuredNode, got {instance!r}")
+            if getattr(instance, "deleted", False):
+                raise ValueError(
+                    f"{instance.__class__.__name__}.save() attempted on deleted node"
+                )
+
+        for instance in instances:
+            _exec_hook("pre_save", instance)
+
+        creates: dict[type, list[tuple[Any, dict[str, Any]]]] = {}
+        updates: dict[type, list[tuple[Any, dict[str, Any]]]] = {}
+        for instance in instances:
+            cls = instance.__class__
+            if not hasattr(instance, "element_id_property"):
+                params = cls.deflate(instance.__properties__, instance, skip_empty=True)
+                creates.setdefault(cls, []).append((instance, params))
+            elif instance._dirty is None:
+                params = cls.deflate(instance.__properties__, instance)
+                updates.setdefault(cls, []).append((instance, params))
+            else:
+                params = instance._deflate_changes()
+                if params:
+                    updates.setdefault(cls, []).append((instance, params))
+
+        if creates or updates:
+            # only update the instances once their statements succeeded, so that
+            # they don't keep the element ids of rolled back nodes
+            if self._active_transaction:
+                saved = await self._save_groups(creates, updates, batch_size)
+            else:
+                async with self.transaction:
+                    saved = await self._save_groups(creates, updates, batch_size)
+            for instance, element_id, params in saved:
+                if element_id is not None:
+                    instance.element_id_property = element_id
+                instance._mark_saved(params)
+
+        for group in creates.values():
+            for instance, _ in group:
+                _exec_hook("post_create", instance)
+        for instance in instances:
+            _exec_hook("post_save", instance)
+        return instances
+
+    async def _save_groups(
+        self,
+        creates: dict[type, list[tuple[Any, dict[str, Any]]]],
+        updates: dict[type, list[tuple[Any, dict[str, Any]]]],
+        batch_size: int,
+    ) -> list[tuple[Any, str | None, dict[str, Any]]]:
+        """
+        Run the statements of save_all(), returning each saved instance with its new
+        element id (None for updates) and the properties written.
+        """
+        saved: list[tuple[Any, str | None, dict[str, Any]]] = []
+        id_method = await self.get_id_method()
+        for cls, group in creates.items():
+            query = (
+                f"UNWIND $batch AS row CREATE (n:{cls.get_schema().label_string}) "
+                f"SET n = row RETURN {id_method}(n)"
+            )
+            for start in range(0, len(group), batch_size):
+                chunk = group[start : start + batch_size]
+                results, _ = await self.cypher_query(
+                    query, {"batch": [params for _, params in chunk]}
+                )
+                for (instance, params), row in zip(chunk, results):
+                    saved.append((instance, str(row[0]), params))
+
+        for cls, group in updates.items():
+            query = (
+                "UNWIND $batch AS row MATCH (n) "
+                f"WHERE {id_method}(n) = row.id SET n += row.props"
+            )
+            if any(instance._dirty is None for instance, _ in group):
+                # some nodes were not loaded from the database, set their labels
+                query += f" SET n:{cls.get_schema().label_string}"
+            for start in range(0, len(group), batch_size):
+                chunk = group[start : start + batch_size]
+                batch = [
+                    {
+                        "id": await self.parse_element_id(instance.element_id),
+                        "props": params,
+                    }
+                    for instance, params in chunk
+                ]
+                await self.cypher_query(query, {"batch": batch})
+                saved.extend((instance, None, params) for instance, params in chunk)
+        return saved
+
     async def list_indexes(self, exclude_token_lookup: bool = False) -> list[dict]:
         """Returns all indexes existing in the database
 
@@ -1052,12 +1519,11 @@ class AsyncDatabase:
                 )
             return
 
-        for name, property in cls.defined_properties(aliases=False, rels=False).items():
+        schema = cls.get_schema()
+        for name, property in schema.properties.items():
             await self._install_node(cls, name, property, quiet, _stdout)
 
-        for _, relationship in cls.defined_properties(
-            aliases=False, rels=True, properties=False
-        ).items():
+        for relationship in schema.relationships.values():
             await self._install_relationship(cls, relationship, quiet, _stdout)
 
     async def _create_node_index(
@@ -1364,10 +1830,8 @@ class AsyncDatabase:
         relationship_cls = relationship.definition["model"]
         if relationship_cls is not None:
             relationship_type = relationship.definition["relation_type"]
-            for prop_name, property in relationship_cls.defined_properties(
-                aliases=False, rels=False
-            ).items():
-                db_property = property.get_db_property_name(prop_name)
+            rel_schema = relationship_cls.get_schema()
+            for _, db_property, property in rel_schema.property_fields:
                 if property.index:
                     await self._create_relationship_index(
                         relationship_type=relationship_type,
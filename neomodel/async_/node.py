@@ -12,10 +12,17 @@ from neo4j.graph import Node
 
 from neomodel.async_.database import adb
 from neomodel.async_.property_manager import AsyncPropertyManager
+from neomodel.config import get_config
 from neomodel.constants import STREAMING_WARNING
-from neomodel.exceptions import DoesNotExist, NodeClassAlreadyDefined
+from neomodel.exceptions import DoesNotExist, NodeClassAlreadyDefined, RequiredProperty
 from neomodel.hooks import hooks
 from neomodel.properties import Property
+from neomodel.schema import (
+    ModelSchema,
+    compact_namespace,
+    install_display_methods,
+    install_property_slots,
+)
 from neomodel.util import _UnsavedNode, classproperty
 
 if TYPE_CHECKING:
@@ -30,6 +37,7 @@ class NodeMeta(type):
     __all_relationships__: tuple[tuple[str, Any], ...]
     __label__: str
     __optional_labels__: list[str]
+    __schema__: ModelSchema
 
     defined_properties: Callable[..., dict[str, Any]]
 
@@ -37,8 +45,12 @@ class NodeMeta(type):
         mcs: type, name: str, bases: tuple[type, ...], namespace: dict[str, Any]
     ) -> Any:
         namespace["DoesNotExist"] = type(name + "DoesNotExist", (DoesNotExist,), {})
-        cls: NodeMeta = type.__new__(mcs, name, bases, namespace)
+        class_namespace = dict(namespace)
+        slotted = compact_namespace(bases, class_namespace)
+        cls: NodeMeta = type.__new__(mcs, name, bases, class_namespace)
         cls.DoesNotExist._model_class = cls
+        install_property_slots(cls, slotted)
+        install_display_methods(cls)
 
         if hasattr(cls, "__abstract_node__"):
             delattr(cls, "__abstract_node__")
@@ -68,26 +80,15 @@ class NodeMeta(type):
                 if hasattr(value, "setup") and callable(value.setup):
                     value.setup()
 
-            # cache various groups of properies
-            cls.__required_properties__ = tuple(
-                name
-                for name, property in cls.defined_properties(
-                    aliases=False, rels=False
-                ).items()
-                if property.required or property.unique_index
-            )
-            cls.__all_properties__ = tuple(
-                cls.defined_properties(aliases=False, rels=False).items()
-            )
-            cls.__all_aliases__ = tuple(
-                cls.defined_properties(properties=False, rels=False).items()
-            )
-            cls.__all_relationships__ = tuple(
-                cls.defined_properties(aliases=False, properties=False).items()
-            )
-
             cls.__label__ = namespace.get("__label__", name)
             cls.__optional_labels__ = namespace.get("__optional_labels__", [])
+            cls.__schema__ = schema = cls._build_schema()
+
+            # cache various groups of properies
+            cls.__required_properties__ = schema.required_properties
+            cls.__all_properties__ = tuple(schema.properties.items())
+            cls.__all_aliases__ = tuple(schema.aliases.items())
+            cls.__all_relationships__ = tuple(schema.relationships.items())
 
             build_class_registry(cls)
 
@@ -143,17 +144,30 @@ class AsyncStructuredNode(NodeBase):
 
     __abstract_node__ = True
 
+    # change tracking, see save(): the names of the properties assigned since the node
+    # was loaded or saved (None when unknown), and the stored values of its mutable
+    # properties, by database property name
+    _dirty: set[str] | frozenset[str] | None = frozenset()
+    _db_values: dict[str, Any] | None = None
+
     # magic methods
 
     def __init__(self, *args: Any, **kwargs: Any):
         if "deleted" in kwargs:
             raise ValueError("deleted property is reserved for neomodel")
 
-        for key, val in self.__all_relationships__:
-            self.__dict__[key] = val.build_manager(self, key)
-
+        self.__dict__["_dirty"] = None
         super().__init__(*args, **kwargs)
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        dirty = self._dirty
+        if dirty is not None and name in self.__schema__.properties:
+            if not isinstance(dirty, set):
+                # the shared frozenset of unchanged nodes
+                dirty = self.__dict__["_dirty"] = set()
+            dirty.add(name)
+
     def __eq__(self, other: Any) -> bool:
         """
         Compare two node objects.
@@ -246,21 +260,22 @@ class AsyncStructuredNode(NodeBase):
         :rtype: tuple[str, dict[str, Any]]
         """
         query_params: dict[str, Any] = {"merge_params": merge_params}
+        schema = cls.get_schema()
 
         # Determine merge key and labels
         if merge_by:
             # Use custom merge keys
             merge_keys = merge_by["keys"]
-            merge_labels = merge_by.get("label", ":".join(cls.inherited_labels()))
+            merge_labels = merge_by.get("label", schema.label_string)
 
             n_merge_prm = ", ".join(f"{key}: params.create.{key}" for key in merge_keys)
         else:
             # Use default required properties
-            merge_labels = ":".join(cls.inherited_labels())
+            merge_labels = schema.label_string
             n_merge_prm = ", ".join(
                 (
-                    f"{getattr(cls, p).get_db_property_name(p)}: params.create.{getattr(cls, p).get_db_property_name(p)}"
-                    for p in cls.__required_properties__
+                    f"{schema.db_property_names[p]}: params.create.{schema.db_property_names[p]}"
+                    for p in schema.required_properties
                 )
             )
 
@@ -328,10 +343,16 @@ class AsyncStructuredNode(NodeBase):
         """
         Call to CREATE with parameters map. A new instance will be created and saved.
 
+        The nodes are sent in a single UNWIND statement, split in chunks of at most
+        batch_size items (see the batch_size configuration option).
+
         :param props: dict of properties to create the nodes.
         :type props: tuple
         :param lazy: False by default, specify True to get nodes with id only without the parameters.
         :type: bool
+        :param batch_size: Optional, overrides the batch_size configuration option for this call.
+        :type batch_size: int
+        :return: list of nodes, in the same order as props
         :rtype: list
         """
 
@@ -343,8 +364,14 @@ class AsyncStructuredNode(NodeBase):
             )
 
         lazy = kwargs.get("lazy", False)
+        batch_size = int(kwargs.get("batch_size") or get_config().batch_size)
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+
         # create mapped query
-        query = f"CREATE (n:{':'.join(cls.inherited_labels())} $create_params)"
+        query = (
+            f"UNWIND $batch AS p CREATE (n:{cls.get_schema().label_string}) SET n = p"
+        )
 
         # close query
         if lazy:
@@ -352,12 +379,13 @@ class AsyncStructuredNode(NodeBase):
         else:
             query += " RETURN n"
 
+        batch = [cls.deflate(p, obj=_UnsavedNode(), skip_empty=True) for p in props]
         results = []
-        for item in [
-            cls.deflate(p, obj=_UnsavedNode(), skip_empty=True) for p in props
-        ]:
-            node, _ = await adb.cypher_query(query, {"create_params": item})
-            results.extend(node[0])
+        for start in range(0, len(batch), batch_size):
+            chunk, _ = await adb.cypher_query(
+                query, {"batch": batch[start : start + batch_size]}
+            )
+            results.extend(row[0] for row in chunk)
 
         nodes = [cls.inflate(node) for node in results]
 
@@ -429,7 +457,10 @@ class AsyncStructuredNode(NodeBase):
             return [cls.inflate(r[0]) for r in results[0]]
 
     async def cypher(
-        self, query: str, params: dict[str, Any] | None = None
+        self,
+        query: str,
+        params: dict[str, Any] | None = None,
+        access_mode: str | None = None,
     ) -> tuple[list | None, tuple[str, ...] | None]:
         """
         Execute a cypher query with the param 'self' pre-populated with the nodes neo4j id.
@@ -438,6 +469,8 @@ class AsyncStructuredNode(NodeBase):
         :type: string
         :param params: query parameters
         :type: dict
+        :param access_mode: access mode of the session outside transactions, see db.cypher_query
+        :type: str
         :return: tuple containing a list of query results, and the meta information as a tuple
         :rtype: tuple
         """
@@ -447,7 +480,7 @@ class AsyncStructuredNode(NodeBase):
             raise ValueError("Can't run cypher operation on unsaved node")
         element_id = await adb.parse_element_id(self.element_id)
         _params.update({"self": element_id})
-        return await adb.cypher_query(query, _params)
+        return await adb.cypher_query(query, _params, access_mode=access_mode)
 
     @hooks
     async def delete(self) -> bool:
@@ -532,10 +565,25 @@ class AsyncStructuredNode(NodeBase):
             snode.element_id_property = graph_entity
         else:
             snode = super().inflate(graph_entity)
-            snode.element_id_property = graph_entity.element_id
+            snode.__dict__["element_id_property"] = graph_entity.element_id
 
         return snode
 
+    @classmethod
+    def _build_schema(cls: Any) -> ModelSchema:  # type: ignore[override]
+        labels = tuple(
+            scls.__label__
+            for scls in cls.mro()
+            if hasattr(scls, "__label__") and not hasattr(scls, "__abstract_node__")
+        )
+        optional_labels = tuple(
+            label
+            for scls in cls.mro()
+            for label in getattr(scls, "__optional_labels__", [])
+            if not hasattr(scls, "__abstract_node__")
+        )
+        return super()._build_schema(labels=labels, optional_labels=optional_labels)
+
     @classmethod
     def inherited_labels(cls: Any) -> list[str]:
         """
@@ -543,11 +591,7 @@ class AsyncStructuredNode(NodeBase):
 
         :return: list
         """
-        return [
-            scls.__label__
-            for scls in cls.mro()
-            if hasattr(scls, "__label__") and not hasattr(scls, "__abstract_node__")
-        ]
+        return list(cls.get_schema().labels)
 
     @classmethod
     def inherited_optional_labels(cls: Any) -> list[str]:
@@ -557,12 +601,7 @@ class AsyncStructuredNode(NodeBase):
         :return: list
         :rtype: list
         """
-        return [
-            label
-            for scls in cls.mro()
-            for label in getattr(scls, "__optional_labels__", [])
-            if not hasattr(scls, "__abstract_node__")
-        ]
+        return list(cls.get_schema().optional_labels)
 
     async def labels(self) -> list[str]:
         """
@@ -573,7 +612,8 @@ class AsyncStructuredNode(NodeBase):
         """
         self._pre_action_check("labels")
         result = await self.cypher(
-            f"MATCH (n) WHERE {await adb.get_id_method()}(n)=$self RETURN labels(n)"
+            f"MATCH (n) WHERE {await adb.get_id_method()}(n)=$self RETURN labels(n)",
+            access_mode=adb._read_access_mode(),
         )
         if result is None or result[0] is None:
             raise ValueError("Could not get labels, node may not exist")
@@ -596,7 +636,8 @@ class AsyncStructuredNode(NodeBase):
         self._pre_action_check("refresh")
         if hasattr(self, "element_id"):
             results = await self.cypher(
-                f"MATCH (n) WHERE {await adb.get_id_method()}(n)=$self RETURN n"
+                f"MATCH (n) WHERE {await adb.get_id_method()}(n)=$self RETURN n",
+                access_mode=adb._read_access_mode(),
             )
             request = results[0]
             if not request or not request[0]:
@@ -604,6 +645,7 @@ class AsyncStructuredNode(NodeBase):
             node = self.inflate(request[0][0])
             for key, val in node.__properties__.items():
                 setattr(self, key, val)
+            self._mark_saved(node.__dict__.get("_db_values"))
         else:
             raise ValueError("Can't refresh unsaved node")
 
@@ -618,18 +660,25 @@ class AsyncStructuredNode(NodeBase):
         # create or update instance node
         if hasattr(self, "element_id_property"):
             # update
-            params = self.deflate(self.__properties__, self)
+            if self._dirty is None:
+                # unknown state, write all the properties and labels
+                params = self.deflate(self.__properties__, self)
+                labels = self.get_schema().labels
+            else:
+                params = self._deflate_changes()
+                labels = ()
+                if not params:
+                    return self
             query = f"MATCH (n) WHERE {await adb.get_id_method()}(n)=$self\n"
 
             if params:
                 query += "SET "
                 query += ",\n".join([f"n.{key} = ${key}" for key in params])
                 query += "\n"
-            if self.inherited_labels():
-                query += "\n".join(
-                    [f"SET n:`{label}`" for label in self.inherited_labels()]
-                )
+            if labels:
+                query += "\n".join([f"SET n:`{label}`" for label in labels])
             await self.cypher(query, params)
+            self._mark_saved(params)
         elif hasattr(self, "deleted") and self.deleted:
             raise ValueError(
                 f"{self.__class__.__name__}.save() attempted on deleted node"
@@ -638,4 +687,44 @@ class AsyncStructuredNode(NodeBase):
             result = await self.create(self.__properties__)
             created_node = result[0]
             self.element_id_property = created_node.element_id
+            self._mark_saved(created_node.__dict__.get("_db_values"))
         return self
+
+    def _deflate_changes(self) -> dict[str, Any]:
+        """
+        Deflate the properties changed since the node was loaded or saved: the ones
+        assigned to, and the mutable ones (arrays, JSON) whose deflated value differs
+        from the stored one. Same semantics as deflate() for the selected properties.
+        """
+        schema = self.get_schema()
+        dirty = self._dirty or ()
+        db_values = self._db_values or {}
+        params: dict[str, Any] = {}
+        for name, db_property, property in schema.property_fields:
+            mutable = name in schema.mutable_properties
+            if name not in dirty and not mutable:
+                continue
+            value = getattr(self, name)
+            if value is not None:
+                value = property.deflate(value, self)
+            elif property.has_default:
+                value = property.deflate(property.default_value(), self)
+            elif property.required:
+                raise RequiredProperty(name, self.__class__)
+            if name in dirty or value != db_values.get(db_property):
+                params[db_property] = value
+        return params
+
+    def _mark_saved(self, db_values: dict[str, Any] | None) -> None:
+        """
+        Mark the node as unchanged, given the values of its mutable properties now
+        stored in the database (any deflated properties).
+        """
+        self.__dict__.pop("_dirty", None)
+        schema = self.get_schema()
+        if schema.mutable_properties and db_values:
+            stored = self.__dict__.setdefault("_db_values", {})
+            for name in schema.mutable_properties:
+                db_property = schema.db_property_names[name]
+                if db_property in db_values:
+                    stored[db_property] = db_values[db_property]
@@ -6,6 +6,11 @@ from neomodel.async_.database import adb
 from neomodel.async_.property_manager import AsyncPropertyManager
 from neomodel.hooks import hooks
 from neomodel.properties import Property
+from neomodel.schema import (
+    compact_namespace,
+    install_display_methods,
+    install_property_slots,
+)
 
 ELEMENT_ID_MIGRATION_NOTICE = "id is deprecated in Neo4j version 5, please migrate to element_id. If you use the id in a Cypher query, replace id() by elementId()."
 
@@ -14,7 +19,11 @@ class RelationshipMeta(type):
     def __new__(
         mcs: type, name: str, bases: tuple[type, ...], dct: dict[str, Any]
     ) -> Any:
-        inst: RelationshipMeta = type.__new__(mcs, name, bases, dct)
+        class_dct = dict(dct)
+        slotted = compact_namespace(bases, class_dct)
+        inst: RelationshipMeta = type.__new__(mcs, name, bases, class_dct)
+        install_property_slots(inst, slotted)
+        install_display_methods(inst)
         for key, value in dct.items():
             if issubclass(value.__class__, Property):
                 if key == "source" or key == "target":
@@ -136,6 +145,7 @@ class AsyncStructuredRel(StructuredRelBase):
                 )
             },
             resolve_objects=True,
+            access_mode=adb._read_access_mode(),
         )
         if results is None or results[0] is None or results[0][0] is None:
             raise ValueError(
@@ -161,6 +171,7 @@ class AsyncStructuredRel(StructuredRelBase):
                 )
             },
             resolve_objects=True,
+            access_mode=adb._read_access_mode(),
         )
         if results is None or results[0] is None or results[0][0] is None:
             raise ValueError(
@@ -0,0 +1,201 @@
+"""
+Fake driver running neomodel without a database, for tests and benchmarks.
+
+AsyncFakeDriver.record() wraps a real driver, and records each query run through it
+with its records, or its error, into a cassette. AsyncFakeDriver.replay() returns
+the records of the cassette instead of running the queries, optionally after a
+simulated network latency. Both keep the list of the queries run, e.g. to assert
+how many round trips an operation takes:
+
+    driver = AsyncFakeDriver.record(AsyncGraphDatabase.driver(url, auth=auth))
+    await adb.set_connection(driver=driver)
+    await run_scenario()
+    driver.cassette.save("test/cassettes/scenario.json")
+
+    driver = AsyncFakeDriver.replay("test/cassettes/scenario.json", latency=0.002)
+    await adb.set_connection(driver=driver)
+    await run_scenario()
+    assert len(driver.queries) == 12
+"""
+
+from typing import Any, AsyncIterator
+
+from neo4j import AsyncDriver, AsyncSession, AsyncTransaction, Record
+from neo4j.api import Bookmarks
+from neo4j.exceptions import Neo4jError
+
+from neomodel._async_compat.util import AsyncUtil
+from neomodel._cassette import Cassette
+
+
+class AsyncFakeResult:
+    """Result of a query, whose records have all been fetched."""
+
+    def __init__(self, keys: list[str], records: list[Record], summary: Any) -> None:
+        self._keys = tuple(keys)
+        self._records = records
+        self._summary = summary
+
+    def keys(self) -> tuple[str, ...]:
+        return self._keys
+
+    async def __aiter__(self) -> AsyncIterator[Record]:
+        for record in self._records:
+            yield record
+
+    async def consume(self) -> Any:
+        return self._summary
+
+
+class AsyncFakeTransaction:
+    def __init__(
+        self, driver: "AsyncFakeDriver", transaction: AsyncTransaction | None
+    ) -> None:
+        self._driver = driver
+        self._transaction = transaction
+
+    async def run(
+        self, query: str, parameters: dict[str, Any] | None = None, **kwargs: Any
+    ) -> AsyncFakeResult:
+        return await self._driver._run(self._transaction, query, parameters)
+
+    async def commit(self) -> None:
+        if self._transaction is not None:
+            await self._transaction.commit()
+        else:
+            await self._driver._round_trip()
+
+    async def rollback(self) -> None:
+        if self._transaction is not None:
+            await self._transaction.rollback()
+        else:
+            await self._driver._round_trip()
+
+    async def close(self) -> None:
+        if self._transaction is not None:
+            await self._transaction.close()
+
+
+class AsyncFakeSession:
+    def __init__(self, driver: "AsyncFakeDriver", session: AsyncSession | None) -> None:
+        self._driver = driver
+        self._session = session
+
+    async def __aenter__(self) -> "AsyncFakeSession":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def run(
+        self, query: str, parameters: dict[str, Any] | None = None, **kwargs: Any
+    ) -> AsyncFakeResult:
+        return await self._driver._run(self._session, query, parameters)
+
+    async def begin_transaction(self, **kwargs: Any) -> AsyncFakeTransaction:
+        transaction = None
+        if self._session is not None:
+            transaction = await self._session.begin_transaction(**kwargs)
+        else:
+            await self._driver._round_trip()
+        return AsyncFakeTransaction(self._driver, transaction)
+
+    async def last_bookmarks(self) -> Bookmarks:
+        if self._session is not None:
+            return await self._session.last_bookmarks()
+        return Bookmarks()
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+
+
+class AsyncFakeDriver:
+    """
+    Stand-in for an AsyncDriver, to pass to adb.set_connection(driver=...). Use
+    record() or replay() to create one.
+
+    :param cassette: the queries recorded, or to replay
+    :param driver: the real driver the queries are recorded from, None to replay
+    :param latency: seconds waited on each round trip when replaying
+    :param ordered: when replaying, whether the queries must be run in the order
+        they were recorded. Otherwise, each query is answered by the first recorded
+        query with the same text not replayed yet, e.g. for concurrent queries.
+    """
+
+    def __init__(
+        self,
+        cassette: Cassette,
+        driver: AsyncDriver | None = None,
+        latency: float = 0.0,
+        ordered: bool = True,
+    ) -> None:
+        self.cassette = cassette
+        # text of each query run, in order
+        self.queries: list[str] = []
+        self._driver = driver
+        self._latency = latency
+        # passed to the sessions when config.route_reads is set
+        self.execute_query_bookmark_manager = (
+            driver.execute_query_bookmark_manager if driver is not None else None
+        )
+        self._ordered = ordered
+
+    @classmethod
+    def record(cls, driver: AsyncDriver) -> "AsyncFakeDriver":
+        """Run the queries with driver, and record them into a new cassette."""
+        return cls(Cassette(), driver=driver)
+
+    @classmethod
+    def replay(
+        cls, cassette: Cassette | str, latency: float = 0.0, ordered: bool = True
+    ) -> "AsyncFakeDriver":
+        """
+        Answer the queries with the records of a cassette, or of the cassette saved
+        at the given path. Queries are matched on their text, not their parameters.
+        """
+        if isinstance(cassette, str):
+            cassette = Cassette.load(cassette)
+        return cls(cassette, latency=latency, ordered=ordered)
+
+    def session(self, **config: Any) -> AsyncFakeSession:
+        session = None
+        if self._driver is not None:
+            session = self._driver.session(**config)
+        return AsyncFakeSession(self, session)
+
+    async def close(self) -> None:
+        if self._driver is not None:
+            await self._driver.close()
+
+    async def _round_trip(self) -> None:
+        if self._latency:
+            await AsyncUtil.sleep(self._latency)
+
+    async def _run(
+        self,
+        runner: AsyncSession | AsyncTransaction | None,
+        query: str,
+        parameters: dict[str, Any] | None,
+    ) -> AsyncFakeResult:
+        self.queries.append(query)
+        if runner is None:
+            await self._round_trip()
+            return AsyncFakeResult(*self.cassette.replay(query, self._ordered))
+
+        try:
+            result = await runner.run(query, parameters)
+            records = [record async for record in result]
+            summary = await result.consume()
+        except Neo4jError as error:
+            self.cassette.record_error(query, parameters, error)
+            raise
+        keys = list(result.keys())
+        self.cassette.record(
+            query,
+            parameters,
+            keys,
+            [list(record.values()) for record in records],
+            summary,
+        )
+        return AsyncFakeResult(keys, records, summary)
@@ -148,6 +148,34 @@ class NeomodelConfig:
             "description": "Threshold in seconds for slow query logging (0 = disabled)",
         },
     )
+    batch_size: int = field(
+        default=1000,
+        metadata={
+            "env_var": "NEOMODEL_BATCH_SIZE",
+            "description": "Maximum number of items sent in a single batch statement",
+        },
+    )
+    fetch_size: int = field(
+        default=1000,
+        metadata={
+            "env_var": "NEOMODEL_FETCH_SIZE",
+            "description": "Number of records fetched at a time when streaming results (-1 = all)",
+        },
+    )
+    route_reads: bool = field(
+        default=False,
+        metadata={
+            "env_var": "NEOMODEL_ROUTE_READS",
+            "description": "Run the read queries of neomodel outside transactions in READ sessions, routed to cluster followers and read replicas",
+        },
+    )
+    n_plus_one_threshold: int = field(
+        default=0,
+        metadata={
+            "env_var": "NEOMODEL_N_PLUS_ONE_THRESHOLD",
+            "description": "Warn when the same query runs more than this many times in a transaction (0 = disabled)",
+        },
+    )
 
     def __post_init__(self):
         """Validate configuration after initialization."""
@@ -198,6 +226,15 @@ class NeomodelConfig:
         if self.slow_queries < 0:
             raise ValueError("slow_queries must be non-negative")
 
+        if self.batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+
+        if self.fetch_size <= 0 and self.fetch_size != -1:
+            raise ValueError("fetch_size must be positive, or -1 to fetch all records")
+
+        if self.n_plus_one_threshold < 0:
+            raise ValueError("n_plus_one_threshold must be non-negative")
+
     @classmethod
     def from_env(cls) -> "NeomodelConfig":
         """Create configuration from environment variables."""
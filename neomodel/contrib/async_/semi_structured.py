@@ -22,6 +22,10 @@ class AsyncSemiStructuredNode(AsyncStructuredNode):
 
     __abstract_node__ = True
 
+    # assignments to extra properties aren't tracked, so always write all the
+    # properties through deflate(), see AsyncStructuredNode.save()
+    _dirty = None
+
     @classmethod
     def inflate(cls, node):
         # Inflate all properties registered in the class definition
@@ -33,13 +37,8 @@ class AsyncSemiStructuredNode(AsyncStructuredNode):
             return snode
 
         # Inflate all extra properties not registered in the class definition
-        registered_db_property_names = {
-            property.get_db_property_name(name)
-            for name, property in cls.defined_properties(
-                aliases=False, rels=False
-            ).items()
-        }
-        extra_keys = node.keys() - registered_db_property_names
+        registered_db_property_names = cls.get_schema().attribute_names
+        extra_keys = node.keys() - registered_db_property_names.keys()
         for extra_key in extra_keys:
             value = node[extra_key]
             if hasattr(cls, extra_key):
@@ -54,8 +53,8 @@ class AsyncSemiStructuredNode(AsyncStructuredNode):
         deflated = super().deflate(node_props, obj, skip_empty=skip_empty)
 
         # Deflate all extra properties not registered in the class definition
-        registered_names = cls.defined_properties(aliases=False, rels=False).keys()
-        extra_keys = node_props.keys() - registered_names
+        registered_names = cls.get_schema().properties
+        extra_keys = node_props.keys() - registered_names.keys()
         for extra_key in extra_keys:
             value = node_props[extra_key]
             if hasattr(cls, extra_key):
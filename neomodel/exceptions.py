@@ -272,6 +272,13 @@ class FeatureNotSupported(NeomodelException):
         self.message = msg
 
 
+class NPlusOneWarning(UserWarning):
+    """
+    Warns that the same query ran many times in a block, e.g. a relationship
+    fetched for each node of a loop. See db.detect_n_plus_one().
+    """
+
+
 __all__ = (
     AttemptedCardinalityViolation.__name__,
     CardinalityViolation.__name__,
@@ -291,4 +298,5 @@ __all__ = (
     RelationshipClassNotDefined.__name__,
     RelationshipClassRedefined.__name__,
     FeatureNotSupported.__name__,
+    NPlusOneWarning.__name__,
 )
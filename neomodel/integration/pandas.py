@@ -18,14 +18,28 @@ Example:
 
     [2 rows x 2 columns]
 
+Node sets can also be exported directly, see :meth:`~neomodel.sync_.match.NodeSet.to_dataframe`:
+
+    >>> df = User.nodes.to_dataframe(columns=["email", "name"])
+
 """
 
+from collections.abc import Sequence
 from typing import Any
 from warnings import warn
 
+from neomodel.properties import (
+    BooleanProperty,
+    DateTimeProperty,
+    FloatProperty,
+    IntegerProperty,
+    Property,
+    StringProperty,
+)
+
 try:
     # noinspection PyPackageRequirements
-    from pandas import DataFrame, Series
+    from pandas import DataFrame, Series, to_datetime
 except ImportError:
     warn(
         "The neomodel.integration.pandas module expects pandas to be installed "
@@ -62,3 +76,45 @@ def to_series(
         return Series([record[field] for record in results], index=index)
     else:
         return Series([record[field] for record in results], index=index, dtype=dtype)
+
+
+def _column_to_series(values: list[Any], property: Property | None) -> Series:
+    """Convert a column of values, as stored in the database, to a Series
+    of the dtype matching the property."""
+    has_nulls = None in values
+    if isinstance(property, DateTimeProperty):
+        # stored as unix epochs, converted all at once
+        epochs = Series(values, dtype="float64")
+        return to_datetime(epochs, unit="s", utc=True).astype("datetime64[ns, UTC]")
+    if isinstance(property, BooleanProperty):
+        return Series(values, dtype="boolean" if has_nulls else "bool")
+    if isinstance(property, IntegerProperty):
+        return Series(values, dtype="Int64" if has_nulls else "int64")
+    if isinstance(property, FloatProperty):
+        return Series(values, dtype="float64")
+    if property is None or isinstance(property, StringProperty):
+        return Series(values)
+    inflate = property.inflate
+    return Series(
+        [value if value is None else inflate(value) for value in values],
+        dtype=object,
+    )
+
+
+def columns_to_dataframe(
+    names: Sequence[str],
+    columns: Sequence[list[Any]],
+    properties: Sequence[Property | None],
+) -> DataFrame:
+    """Build a DataFrame from columns of values as stored in the database.
+    Integer, float, boolean and datetime columns get the matching numpy or
+    pandas dtype (nullable if values are missing), other values are inflated
+    by their property.
+    """
+    return DataFrame(
+        {
+            name: _column_to_series(values, property)
+            for name, values, property in zip(names, columns, properties)
+        },
+        columns=list(names),
+    )
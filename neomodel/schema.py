@@ -0,0 +1,381 @@
+"""
+Precomputed per-class model schemas.
+
+A :class:`ModelSchema` is built once by ``NodeMeta`` / ``RelationshipMeta`` when a
+model class is created. It captures everything neomodel would otherwise recompute
+by walking the class ``__mro__`` on every call: the defined properties, aliases and
+relationship definitions, the attribute <-> database property name mappings, an
+index of relationship definitions by type and the node labels.
+
+It also hosts the code generation of the per-class inflate and deflate functions,
+which are unrolled from the schema so that no per-property bookkeeping is left at
+runtime, and the helpers used by the metaclasses to install the class level
+``get_<name>_display`` methods and the slots of compact classes.
+"""
+
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Callable, Mapping
+
+from neomodel.exceptions import RequiredProperty
+from neomodel.properties import AliasProperty, ArrayProperty, JSONProperty, Property
+
+
+def _empty_mapping() -> Mapping[str, Any]:
+    return MappingProxyType({})
+
+
+@dataclass(frozen=True)
+class ModelSchema:
+    """
+    Immutable description of a StructuredNode or StructuredRel class.
+
+    :param members: every property, alias and relationship definition, in definition order
+    :param properties: regular (non alias) properties, by attribute name
+    :param aliases: alias properties, by attribute name
+    :param relationships: relationship definitions, by attribute name
+    :param db_property_names: attribute name -> database property name
+    :param attribute_names: database property name -> attribute name
+    :param property_fields: (attribute name, database property name, property) triples
+    :param required_properties: names of the required or unique properties
+    :param mutable_properties: names of the properties whose values can be changed in place (arrays, JSON)
+    :param relationships_by_type: relationship definitions grouped by relation type
+    :param labels: inherited labels of a node class
+    :param optional_labels: inherited optional labels of a node class
+    """
+
+    members: Mapping[str, Any] = field(default_factory=_empty_mapping)
+    properties: Mapping[str, Property] = field(default_factory=_empty_mapping)
+    aliases: Mapping[str, AliasProperty] = field(default_factory=_empty_mapping)
+    relationships: Mapping[str, Any] = field(default_factory=_empty_mapping)
+    db_property_names: Mapping[str, str] = field(default_factory=_empty_mapping)
+    attribute_names: Mapping[str, str] = field(default_factory=_empty_mapping)
+    property_fields: tuple[tuple[str, str, Property], ...] = ()
+    required_properties: tuple[str, ...] = ()
+    mutable_properties: tuple[str, ...] = ()
+    relationships_by_type: Mapping[str, tuple[tuple[str, Any], ...]] = field(
+        default_factory=_empty_mapping
+    )
+    labels: tuple[str, ...] = ()
+    optional_labels: tuple[str, ...] = ()
+    label_string: str = field(init=False, default="")
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "label_string", ":".join(self.labels))
+
+    @classmethod
+    def build(
+        cls,
+        members: dict[str, Any],
+        is_relationship: Callable[[Any], bool],
+        labels: tuple[str, ...] = (),
+        optional_labels: tuple[str, ...] = (),
+    ) -> "ModelSchema":
+        """
+        Build a schema from the members collected along a class hierarchy.
+
+        :param members: attribute name -> Property or relationship definition
+        :param is_relationship: predicate identifying relationship definitions
+        :param labels: the inherited labels, for node classes
+        :param optional_labels: the inherited optional labels, for node classes
+        """
+        properties: dict[str, Property] = {}
+        aliases: dict[str, AliasProperty] = {}
+        relationships: dict[str, Any] = {}
+        by_type: dict[str, list[tuple[str, Any]]] = {}
+        for name, member in members.items():
+            if isinstance(member, AliasProperty):
+                aliases[name] = member
+            elif isinstance(member, Property):
+                properties[name] = member
+            elif is_relationship(member):
+                relationships[name] = member
+                by_type.setdefault(member.definition["relation_type"], []).append(
+                    (name, member)
+                )
+
+        db_property_names = {
+            name: property.get_db_property_name(name)
+            for name, property in properties.items()
+        }
+        return cls(
+            members=MappingProxyType(dict(members)),
+            properties=MappingProxyType(properties),
+            aliases=MappingProxyType(aliases),
+            relationships=MappingProxyType(relationships),
+            db_property_names=MappingProxyType(db_property_names),
+            attribute_names=MappingProxyType(
+                {db_name: name for name, db_name in db_property_names.items()}
+            ),
+            property_fields=tuple(
+                (name, db_property_names[name], property)
+                for name, property in properties.items()
+            ),
+            required_properties=tuple(
+                name
+                for name, property in properties.items()
+                if property.required or property.unique_index
+            ),
+            mutable_properties=tuple(
+                name
+                for name, property in properties.items()
+                if isinstance(property, (ArrayProperty, JSONProperty))
+            ),
+            relationships_by_type=MappingProxyType(
+                {key: tuple(value) for key, value in by_type.items()}
+            ),
+            labels=tuple(labels),
+            optional_labels=tuple(optional_labels),
+        )
+
+    def defined(
+        self, aliases: bool = True, properties: bool = True, rels: bool = True
+    ) -> dict[str, Any]:
+        """
+        Return a new dict of the selected members, in definition order.
+        Mirrors the arguments of ``PropertyManager.defined_properties``.
+        """
+        if aliases and properties and rels:
+            return dict(self.members)
+        return {
+            name: member
+            for name, member in self.members.items()
+            if (aliases and name in self.aliases)
+            or (properties and name in self.properties)
+            or (rels and name in self.relationships)
+        }
+
+    def lookup(self, name: str, rels: bool = True) -> Any | None:
+        """
+        Return the property, alias or (if rels) relationship definition for name.
+        """
+        member = self.members.get(name)
+        if member is not None and not rels and name in self.relationships:
+            return None
+        return member
+
+    def find_inverse(
+        self, relation_type: str, direction: int, node_class: Any
+    ) -> tuple[str, Any] | None:
+        """
+        Find the relationship definition which is the inverse of the given one,
+        i.e. same relation type, opposite direction and pointing to node_class.
+        """
+        for name, rel_def in self.relationships_by_type.get(relation_type, ()):
+            if rel_def.definition["direction"] == direction:
+                continue
+            if "node_class" not in rel_def.definition:
+                rel_def.lookup_node_class()
+            if rel_def.definition["node_class"] == node_class:
+                return name, rel_def
+        return None
+
+
+def display_for(key: str) -> Any:
+    def display_choice(self: Any) -> Any:
+        return getattr(self.__class__, key).choices[getattr(self, key)]
+
+    display_choice.__name__ = display_choice.__qualname__ = f"get_{key}_display"
+    return display_choice
+
+
+def install_display_methods(cls: Any) -> None:
+    """
+    Add a get_<name>_display method to cls for each property with choices it defines
+    or inherits, from base classes and plain Python mixins alike, unless the class
+    already has that method.
+    """
+    seen: set[str] = set()
+    for klass in cls.__mro__:
+        for name, member in list(vars(klass).items()):
+            if name in seen:
+                continue
+            seen.add(name)
+            if isinstance(member, PropertySlot):
+                member = member.property
+            if isinstance(member, Property) and getattr(member, "choices", None):
+                method = f"get_{name}_display"
+                if not hasattr(cls, method):
+                    setattr(cls, method, display_for(name))
+
+
+class PropertySlot:
+    """
+    Stands in for a Property of a compact class (``__compact__ = True``), whose values
+    are stored in ``__slots__`` rather than in the instance ``__dict__``.
+    Accessed on the class it returns the Property, like a regular class attribute.
+    """
+
+    __slots__ = ("property", "member")
+
+    def __init__(self, property: Property, member: Any) -> None:
+        self.property = property
+        self.member = member
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        if instance is None:
+            return self.property
+        return self.member.__get__(instance, owner)
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        self.member.__set__(instance, value)
+
+    def __delete__(self, instance: Any) -> None:
+        self.member.__delete__(instance)
+
+
+def compact_namespace(
+    bases: tuple[type, ...], namespace: dict[str, Any]
+) -> dict[str, Property]:
+    """
+    Prepare the namespace of a class about to be created: if the class is compact,
+    move its (non alias) properties into ``__slots__``.
+    Returns the moved properties, to be passed to install_property_slots once the
+    class exists.
+    """
+    compact = namespace.get(
+        "__compact__", any(getattr(base, "__compact__", False) for base in bases)
+    )
+    if not compact:
+        return {}
+    inherited: set[str] = set()
+    for base in bases:
+        inherited.update(getattr(base, "__compact_fields__", ()))
+    properties = {
+        name: member
+        for name, member in namespace.items()
+        if isinstance(member, Property) and not isinstance(member, AliasProperty)
+    }
+    for name in properties:
+        del namespace[name]
+    namespace["__slots__"] = tuple(
+        name for name in properties if name not in inherited
+    ) + tuple(namespace.get("__slots__", ()))
+    namespace["__compact_fields__"] = frozenset(inherited.union(properties))
+    return properties
+
+
+def slot_member(cls: Any, name: str) -> Any:
+    """
+    Return the slot member descriptor storing the property name of a compact class.
+    """
+    for klass in cls.__mro__:
+        member = vars(klass).get(name)
+        if member is not None:
+            return member.member if isinstance(member, PropertySlot) else member
+    raise AttributeError(name)
+
+
+def install_property_slots(cls: Any, properties: Mapping[str, Property]) -> None:
+    """
+    Wrap the slots created for the properties of a compact class in PropertySlot.
+    """
+    for name, property in properties.items():
+        member = slot_member(cls, name)
+        if name in vars(cls):
+            # slots are created in sorted order, re-add them in definition order
+            delattr(cls, name)
+        setattr(cls, name, PropertySlot(property, member))
+
+
+def _has_stock_init(cls: Any) -> bool:
+    """
+    True if neither __init__ nor __setattr__ have been overridden outside neomodel,
+    in which case instances can be populated without calling __init__.
+    """
+    for method in ("__init__", "__setattr__"):
+        for klass in cls.__mro__:
+            if method in vars(klass):
+                if klass is not object and not klass.__module__.startswith("neomodel."):
+                    return False
+                break
+    return True
+
+
+def compile_inflater(cls: Any, schema: ModelSchema) -> Callable[[Any], Any]:
+    """
+    Generate the function that builds an instance of cls from a graph entity
+    (a neo4j.graph.Node, neo4j.graph.Relationship or any mapping of database properties).
+
+    The generated code is unrolled for the properties of cls. When the class uses the
+    stock neomodel __init__, the instance is populated directly, doing the work of
+    PropertyManager.__init__ (and StructuredNode.__init__) inline. Otherwise the
+    inflated values are passed as keyword arguments to cls.
+
+    Relationship managers and get_<name>_display methods are not created here: the
+    former are built on first access, the latter live on the class.
+    """
+    fast = _has_stock_init(cls)
+    slotted = getattr(cls, "__compact_fields__", frozenset()) if fast else ()
+    namespace: dict[str, Any] = {"cls": cls, "new": object.__new__}
+    lines = [
+        "def inflate(graph_entity):",
+        "    props = getattr(graph_entity, '_properties', graph_entity)",
+    ]
+    if fast:
+        lines += ["    self = new(cls)", "    attrs = self.__dict__"]
+    else:
+        lines.append("    attrs = {}")
+
+    for i, (name, db_property, property) in enumerate(schema.property_fields):
+        namespace[f"prop_{i}"] = property
+        namespace[f"inflate_{i}"] = property.inflate
+        default = f"prop_{i}.default_value()" if property.has_default else "None"
+        lines += [
+            f"    value = props.get({db_property!r})",
+            "    if value is not None:",
+            f"        value = inflate_{i}(value, graph_entity)",
+            "    if value is None:",
+            f"        value = {default}",
+        ]
+        if name in slotted:
+            namespace[f"store_{i}"] = slot_member(cls, name).__set__
+            lines.append(f"    store_{i}(self, value)")
+        else:
+            lines.append(f"    attrs[{name!r}] = value")
+
+    if fast and schema.mutable_properties and hasattr(cls, "_db_values"):
+        # keep the stored values of mutable properties to detect in place changes
+        db_values = ", ".join(
+            f"{schema.db_property_names[name]!r}: props.get({schema.db_property_names[name]!r})"
+            for name in schema.mutable_properties
+        )
+        lines.append(f"    attrs['_db_values'] = {{{db_values}}}")
+    lines.append("    return self" if fast else "    return cls(**attrs)")
+    exec(compile("\n".join(lines), f"<{cls.__name__}.inflate>", "exec"), namespace)
+    return namespace["inflate"]
+
+
+def compile_deflater(cls: Any, schema: ModelSchema) -> Callable[..., dict[str, Any]]:
+    """
+    Generate the function that deflates a dict of attribute values of cls into a dict
+    of database properties, with the same semantics as PropertyManager.deflate.
+    """
+    namespace: dict[str, Any] = {"cls": cls, "RequiredProperty": RequiredProperty}
+    lines = [
+        "def deflate(properties, obj=None, skip_empty=False):",
+        "    deflated = {}",
+    ]
+    for i, (name, db_property, property) in enumerate(schema.property_fields):
+        namespace[f"prop_{i}"] = property
+        namespace[f"deflate_{i}"] = property.deflate
+        lines += [
+            f"    value = properties.get({name!r})",
+            "    if value is not None:",
+            f"        deflated[{db_property!r}] = deflate_{i}(value, obj)",
+        ]
+        if property.has_default:
+            lines += [
+                "    else:",
+                f"        deflated[{db_property!r}] = deflate_{i}(prop_{i}.default_value(), obj)",
+            ]
+        elif property.required:
+            lines += ["    else:", f"        raise RequiredProperty({name!r}, cls)"]
+        else:
+            lines += [
+                "    elif not skip_empty:",
+                f"        deflated[{db_property!r}] = None",
+            ]
+    lines.append("    return deflated")
+    exec(compile("\n".join(lines), f"<{cls.__name__}.deflate>", "exec"), namespace)
+    return namespace["deflate"]
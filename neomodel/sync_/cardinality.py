@@ -1,6 +1,5 @@
 from typing import TYPE_CHECKING, Any, Optional
 
-from neomodel.config import get_config
 from neomodel.exceptions import AttemptedCardinalityViolation, CardinalityViolation
 from neomodel.sync_.relationship_manager import (  # pylint:disable=unused-import
     RelationshipManager,
@@ -15,18 +14,7 @@ class ZeroOrOne(RelationshipManager):
     """A relationship to zero or one node."""
 
     description = "zero or one relationship"
-
-    def check_cardinality(self, node: "StructuredNode") -> None:
-        if self.__len__():
-            detailed_description = str(self)
-            if get_config().soft_cardinality_check:
-                print(
-                    f"Cardinality violation detected : Node already has {detailed_description}, should not connect more. Soft check is enabled so the relationship will be created."
-                )
-            else:
-                raise AttemptedCardinalityViolation(
-                    f"Node already has {detailed_description}. Use reconnect() to replace the existing relationship."
-                )
+    max_connections = 1
 
     def single(self) -> Optional["StructuredNode"]:
         """
@@ -109,18 +97,7 @@ class One(RelationshipManager):
     """
 
     description = "one relationship"
-
-    def check_cardinality(self, node: "StructuredNode") -> None:
-        if self.__len__():
-            detailed_description = str(self)
-            if get_config().soft_cardinality_check:
-                print(
-                    f"Cardinality violation detected : Node already has {detailed_description}, should not connect more. Soft check is enabled so the relationship will be created."
-                )
-            else:
-                raise AttemptedCardinalityViolation(
-                    f"Node already has {detailed_description}. Use reconnect() to replace the existing relationship."
-                )
+    max_connections = 1
 
     def single(self) -> "StructuredNode":
         """
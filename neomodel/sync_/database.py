@@ -6,6 +6,7 @@ import logging
 import os
 import sys
 import time
+from contextlib import closing
 from contextvars import ContextVar
 from typing import TYPE_CHECKING, Any, Callable, Iterator, TextIO
 from urllib.parse import quote, unquote, urlparse
@@ -54,14 +55,20 @@ from neomodel.exceptions import (
     RelationshipClassNotDefined,
     UniqueProperty,
 )
+from neomodel.hooks import _exec_hook
 from neomodel.properties import FulltextIndex, Property, VectorIndex
-from neomodel.util import version_tag_to_integer
+from neomodel.util import QueryEvent, QueryPlan, version_tag_to_integer
 
 # The imports inside this block are only for type checking tools (like mypy or IDEs) to help with code hints and error checking.
 # These imports are ignored when the code actually runs, so they don't affect runtime performance or cause circular import problems.
 if TYPE_CHECKING:
     from neomodel.sync_.node import StructuredNode  # type: ignore
-    from neomodel.sync_.transaction import ImpersonationHandler, TransactionProxy
+    from neomodel.sync_.transaction import (
+        ImpersonationHandler,
+        NPlusOneDetector,
+        QueryCounter,
+        TransactionProxy,
+    )
 
 logger = logging.getLogger(__name__)
 
@@ -84,11 +91,7 @@ def ensure_connection(func: Callable) -> Callable:
             _db = self
 
         if not _db.driver:
-            config = get_config()
-            if hasattr(config, "database_url") and config.database_url:
-                _db.set_connection(url=config.database_url)
-            elif hasattr(config, "driver") and config.driver:
-                _db.set_connection(driver=config.driver)
+            _db._connect_from_config()
 
         return func(self, *args, **kwargs)
 
@@ -154,6 +157,17 @@ class Database:
         self.__parallel_runtime: ContextVar[bool | None] = ContextVar(
             "_parallel_runtime", default=False
         )
+        self.__identity_map: ContextVar[dict[str, Any] | None] = ContextVar(
+            "_identity_map", default=None
+        )
+        self.__query_counters: ContextVar[tuple["QueryCounter", ...]] = ContextVar(
+            "_query_counters", default=()
+        )
+        self.__n_plus_one_detector: ContextVar["NPlusOneDetector | None"] = ContextVar(
+            "_n_plus_one_detector", default=None
+        )
+        # Shared by all contexts, see add_query_listener
+        self._query_listeners: list[Callable[[QueryEvent], Any]] = []
 
         # Mark the singleton as initialized
         Database._initialized = True
@@ -248,6 +262,30 @@ class Database:
     def _database_edition(self, value: str | None) -> None:
         self.__database_edition.set(value)
 
+    @property
+    def _identity_map(self) -> dict[str, Any] | None:
+        return self.__identity_map.get()
+
+    @_identity_map.setter
+    def _identity_map(self, value: dict[str, Any] | None) -> None:
+        self.__identity_map.set(value)
+
+    @property
+    def _query_counters(self) -> tuple["QueryCounter", ...]:
+        return self.__query_counters.get()
+
+    @_query_counters.setter
+    def _query_counters(self, value: tuple["QueryCounter", ...]) -> None:
+        self.__query_counters.set(value)
+
+    @property
+    def _n_plus_one_detector(self) -> "NPlusOneDetector | None":
+        return self.__n_plus_one_detector.get()
+
+    @_n_plus_one_detector.setter
+    def _n_plus_one_detector(self, value: "NPlusOneDetector | None") -> None:
+        self.__n_plus_one_detector.set(value)
+
     @property
     def impersonated_user(self) -> str | None:
         return self.__impersonated_user.get()
@@ -264,6 +302,16 @@ class Database:
     def _parallel_runtime(self, value: bool | None) -> None:
         self.__parallel_runtime.set(value)
 
+    def _connect_from_config(self) -> None:
+        """
+        Connect using the database_url or driver of the configuration, if any.
+        """
+        config = get_config()
+        if hasattr(config, "database_url") and config.database_url:
+            self.set_connection(url=config.database_url)
+        elif hasattr(config, "driver") and config.driver:
+            self.set_connection(driver=config.driver)
+
     def set_connection(
         self, url: str | None = None, driver: Driver | None = None
     ) -> None:
@@ -419,6 +467,54 @@ class Database:
             self, access_mode=ACCESS_MODE_READ, parallel_runtime=True
         )
 
+    def session_cache(self) -> "SessionCache":
+        """
+        Within this context manager, a node appearing several times in query results
+        (in several rows, paths or queries) is resolved to the same instance, inflated
+        only the first time. Nodes are identified by their element_id.
+
+        Returns:
+            SessionCache: Context manager enabling the identity map
+        """
+        from neomodel.sync_.transaction import SessionCache  # type: ignore
+
+        return SessionCache(self)
+
+    def assert_max_queries(self, max_queries: int) -> "QueryCounter":
+        """
+        Within this context manager, the queries run are recorded, including by the
+        tasks or threads started in it, and an AssertionError listing them is raised
+        on exit if there were more than max_queries. The QueryEvent of each query
+        is kept in the queries attribute of the context manager.
+
+        Returns:
+            QueryCounter: Context manager counting the queries
+        """
+        from neomodel.sync_.transaction import QueryCounter  # type: ignore
+
+        return QueryCounter(self, max_queries)
+
+    def detect_n_plus_one(self, threshold: int | None = None) -> "NPlusOneDetector":
+        """
+        Within this context manager, an NPlusOneWarning is emitted when the same
+        query, literal values aside, runs more than threshold times, e.g. when a
+        relationship is fetched for each node of a loop. The warning points at the
+        code which ran the query. Set config.n_plus_one_threshold to detect them in
+        every transaction block instead.
+
+        Args:
+            threshold (int): Number of times a query can run, by default
+                config.n_plus_one_threshold, or 10 if it is not set
+
+        Returns:
+            NPlusOneDetector: Context manager detecting the repeated queries
+        """
+        from neomodel.sync_.transaction import NPlusOneDetector  # type: ignore
+
+        if threshold is None:
+            threshold = get_config().n_plus_one_threshold or 10
+        return NPlusOneDetector(self, threshold)
+
     def impersonate(self, user: str) -> "ImpersonationHandler":
         """All queries executed within this context manager will be executed as impersonated user
 
@@ -450,12 +546,8 @@ class Database:
 
         assert self.driver is not None, "Driver has not been created"
 
-        self._session = self.driver.session(
-            default_access_mode=access_mode,
-            database=self._database_name,
-            impersonated_user=self.impersonated_user,
-            **parameters,
-        )
+        parameters.setdefault("fetch_size", get_config().fetch_size)
+        self._session = self._open_session(access_mode, **parameters)
 
         assert self._session is not None, "Session has not been created"
         self._active_transaction = self._session.begin_transaction()
@@ -522,6 +614,28 @@ class Database:
             # The database server is not running yet
             pass
 
+    def _resolve_node(self, node: Node) -> Any:
+        """
+        Inflate a Node into an instance of the class registered for its labels.
+        """
+        _labels = frozenset(node.labels)
+        if _labels in self._NODE_CLASS_REGISTRY:
+            return self._NODE_CLASS_REGISTRY[_labels].inflate(node)
+        elif (
+            self._database_name is not None
+            and self._database_name in self._DB_SPECIFIC_CLASS_REGISTRY
+            and _labels in self._DB_SPECIFIC_CLASS_REGISTRY[self._database_name]
+        ):
+            return self._DB_SPECIFIC_CLASS_REGISTRY[self._database_name][
+                _labels
+            ].inflate(node)
+        else:
+            raise NodeClassNotDefined(
+                node,
+                self._NODE_CLASS_REGISTRY,
+                self._DB_SPECIFIC_CLASS_REGISTRY,
+            )
+
     def _object_resolution(self, object_to_resolve: Any) -> Any:
         """
         Performs in place automatic object resolution on a result
@@ -550,23 +664,15 @@ class Database:
         # Consequently, the type checking was changed for both
         # Node, Relationship objects
         if isinstance(object_to_resolve, Node):
-            _labels = frozenset(object_to_resolve.labels)
-            if _labels in self._NODE_CLASS_REGISTRY:
-                return self._NODE_CLASS_REGISTRY[_labels].inflate(object_to_resolve)
-            elif (
-                self._database_name is not None
-                and self._database_name in self._DB_SPECIFIC_CLASS_REGISTRY
-                and _labels in self._DB_SPECIFIC_CLASS_REGISTRY[self._database_name]
-            ):
-                return self._DB_SPECIFIC_CLASS_REGISTRY[self._database_name][
-                    _labels
-                ].inflate(object_to_resolve)
-            else:
-                raise NodeClassNotDefined(
-                    object_to_resolve,
-                    self._NODE_CLASS_REGISTRY,
-                    self._DB_SPECIFIC_CLASS_REGISTRY,
-                )
+            identity_map = self._identity_map
+            if identity_map is not None:
+                # resolve each node only once, see session_cache
+                node = identity_map.get(object_to_resolve.element_id)
+                if node is None:
+                    node = self._resolve_node(object_to_resolve)
+                    identity_map[object_to_resolve.element_id] = node
+                return node
+            return self._resolve_node(object_to_resolve)
 
         if isinstance(object_to_resolve, Relationship):
             rel_type = frozenset([object_to_resolve.type])
@@ -631,6 +737,76 @@ class Database:
 
         return result_list
 
+    def _open_session(
+        self, access_mode: str | None = None, **parameters: Any
+    ) -> Session:
+        assert self.driver is not None, "Driver has not been created"
+        if get_config().route_reads:
+            # chain all the sessions with bookmarks, so that reads routed to another
+            # member of the cluster see the writes made before them
+            parameters.setdefault(
+                "bookmark_manager", self.driver.execute_query_bookmark_manager
+            )
+        return self.driver.session(
+            default_access_mode=access_mode or ACCESS_MODE_WRITE,
+            database=self._database_name,
+            impersonated_user=self.impersonated_user,
+            **parameters,
+        )
+
+    def _read_access_mode(self, access_mode: str | None = None) -> str:
+        """
+        Access mode of the read-only queries run by neomodel outside transactions:
+        access_mode if given, otherwise READ if config.route_reads is set, so that
+        the cluster routes them to its followers and read replicas, or else WRITE.
+        """
+        if access_mode is not None:
+            return access_mode
+        return ACCESS_MODE_READ if get_config().route_reads else ACCESS_MODE_WRITE
+
+    def add_query_listener(self, listener: Callable[[QueryEvent], Any]) -> None:
+        """
+        Register a function called with a QueryEvent after each query run by neomodel,
+        including streamed ones, e.g. to log or measure them. Listeners are called in
+        the thread or task which ran the query, and their errors are logged and ignored.
+        """
+        self._query_listeners.append(listener)
+
+    def remove_query_listener(self, listener: Callable[[QueryEvent], Any]) -> None:
+        self._query_listeners.remove(listener)
+
+    def _is_instrumented(self) -> bool:
+        config = get_config()
+        return bool(
+            self._query_listeners
+            or config.cypher_debug
+            or config.slow_queries
+            or self._query_counters
+            or self._n_plus_one_detector
+        )
+
+    def _emit_query_event(self, event: QueryEvent) -> None:
+        config = get_config()
+        if (
+            config.cypher_debug or config.slow_queries
+        ) and event.duration >= config.slow_queries:
+            # params are only formatted if the message is emitted
+            logger.debug(
+                "query: %s\nparams: %r\ntook: %.2gs\n",
+                event.query,
+                event.params,
+                event.duration,
+            )
+        for counter in self._query_counters:
+            counter.queries.append(event)
+        if self._n_plus_one_detector is not None:
+            self._n_plus_one_detector.add(event.query)
+        for listener in self._query_listeners:
+            try:
+                listener(event)
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.exception("Query listener %r failed", listener)
+
     @ensure_connection
     def cypher_query(
         self,
@@ -639,6 +815,7 @@ class Database:
         handle_unique: bool = True,
         retry_on_session_expire: bool = False,
         resolve_objects: bool = False,
+        access_mode: str | None = None,
     ) -> tuple[list | None, tuple[str, ...] | None]:
         """
         Runs a query on the database and returns a list of results and their headers.
@@ -654,6 +831,9 @@ class Database:
         :type: bool
         :param resolve_objects: Whether to attempt to resolve the returned nodes to data model objects automatically
         :type: bool
+        :param access_mode: Access mode of the session when no transaction is active, READ to route a read-only
+        query to the followers and read replicas of a cluster. WRITE by default.
+        :type: str
 
         :return: A tuple containing a list of results and a tuple of headers.
         """
@@ -672,10 +852,7 @@ class Database:
         else:
             # Otherwise create a new session in a with to dispose of it after it has been run
             if self.driver:
-                with self.driver.session(
-                    database=self._database_name,
-                    impersonated_user=self.impersonated_user,
-                ) as session:
+                with self._open_session(access_mode) as session:
                     results, meta = self._run_cypher_query(
                         session,
                         query,
@@ -689,6 +866,44 @@ class Database:
 
         return results, meta
 
+    @ensure_connection
+    def explain_query(
+        self,
+        query: str,
+        params: dict[str, Any] | None = None,
+        profile: bool = False,
+    ) -> QueryPlan:
+        """
+        Returns the execution plan of a query, prefixed with EXPLAIN, without running
+        it. With profile, the query is run prefixed with PROFILE instead, and the plan
+        holds the actual number of rows and database hits of each operator. The
+        query runs in the current transaction if any.
+
+        :param query: A CYPHER query
+        :type: str
+        :param params: Dictionary of parameters
+        :type: dict
+        :param profile: Whether to run the query to profile it
+        :type: bool
+        :return: the plan tree of the query
+        """
+        prefix = "PROFILE" if profile else "EXPLAIN"
+
+        def run(session: Session | Transaction) -> Any:
+            response = session.run(query=f"{prefix} {query}", parameters=params or {})
+            return response.consume()
+
+        if self._active_transaction:
+            summary = run(self._active_transaction)
+        elif self.driver:
+            with self._open_session() as session:
+                summary = run(session)
+        else:
+            raise ValueError("No driver has been set")
+
+        plan = summary.profile if profile else summary.plan
+        return QueryPlan.from_summary(plan, query=query)
+
     def _run_cypher_query(
         self,
         session: Session | Transaction,
@@ -700,12 +915,30 @@ class Database:
     ) -> tuple[list | None, tuple[str, ...] | None]:
         try:
             # Retrieve the data
-            start = time.time()
+            start = time.perf_counter()
             if self._parallel_runtime:
                 query = "CYPHER runtime=parallel " + query
             response: Result = session.run(query=query, parameters=params)
-            results, meta = [list(r.values()) for r in response], response.keys()
-            end = time.time()
+            meta = response.keys()
+            if self._is_instrumented():
+                results, first_record_at = [], None
+                for record in response:
+                    if first_record_at is None:
+                        first_record_at = time.perf_counter()
+                    results.append(list(record.values()))
+                summary = response.consume()
+                self._emit_query_event(
+                    QueryEvent(
+                        query,
+                        params,
+                        time.perf_counter() - start,
+                        first_record_at and first_record_at - start,
+                        len(results),
+                        summary,
+                    )
+                )
+            else:
+                results = [list(r.values()) for r in response]
 
             if resolve_objects:
                 # Do any automatic resolution required
@@ -735,18 +968,6 @@ class Database:
                 )
             raise
 
-        tte = end - start
-        if os.environ.get("NEOMODEL_CYPHER_DEBUG", False) and tte > float(
-            os.environ.get("NEOMODEL_SLOW_QUERIES", 0)
-        ):
-            logger.debug(
-                "query: "
-                + query
-                + "\nparams: "
-                + repr(params)
-                + f"\ntook: {tte:.2g}s\n"
-            )
-
         return results, meta
 
     def _stream_cypher_query(
@@ -770,8 +991,10 @@ class Database:
         :param resolve_objects: Whether to resolve nodes to neomodel objects
         :yields: Tuple of (values_list, keys_tuple) for each record
         """
+        instrumented = self._is_instrumented()
+        record_count, first_record_at = 0, None
         try:
-            start = time.time()
+            start = time.perf_counter()
             if self._parallel_runtime:
                 query = "CYPHER runtime=parallel " + query
 
@@ -780,6 +1003,10 @@ class Database:
 
             # Stream results one record at a time
             for record in response:
+                if instrumented:
+                    record_count += 1
+                    if first_record_at is None:
+                        first_record_at = time.perf_counter()
                 values = list(record.values())
 
                 if resolve_objects:
@@ -789,19 +1016,34 @@ class Database:
 
                 yield values, keys
 
-            end = time.time()
-            tte = end - start
-            if os.environ.get("NEOMODEL_CYPHER_DEBUG", False) and tte > float(
-                os.environ.get("NEOMODEL_SLOW_QUERIES", 0)
-            ):
-                logger.debug(
-                    "query: "
-                    + query
-                    + "\nparams: "
-                    + repr(params)
-                    + f"\ntook: {tte:.2g}s\n"
+            if instrumented:
+                summary = response.consume()
+                self._emit_query_event(
+                    QueryEvent(
+                        query,
+                        params,
+                        time.perf_counter() - start,
+                        first_record_at and first_record_at - start,
+                        record_count,
+                        summary,
+                        streamed=True,
+                    )
                 )
 
+        except GeneratorExit:
+            # closed before the last record, no summary is available
+            if instrumented:
+                self._emit_query_event(
+                    QueryEvent(
+                        query,
+                        params,
+                        time.perf_counter() - start,
+                        first_record_at and first_record_at - start,
+                        record_count,
+                        streamed=True,
+                    )
+                )
+            raise
         except ClientError as e:
             if e.code == "Neo.ClientError.Schema.ConstraintValidationFailed":
                 if hasattr(e, "message") and e.message is not None:
@@ -816,6 +1058,116 @@ class Database:
             if exc_info[1] is not None and exc_info[2] is not None:
                 raise exc_info[1].with_traceback(exc_info[2])
 
+    def _stream_query(
+        self,
+        query: str,
+        params: dict[str, Any],
+        handle_unique: bool = True,
+        resolve_objects: bool = False,
+        fetch_size: int | None = None,
+        access_mode: str | None = None,
+    ) -> Iterator[tuple[list, tuple[str, ...]]]:
+        """
+        Stream the records of a query, see _stream_cypher_query.
+
+        The query runs in the active transaction if any. Otherwise a session is opened
+        in access_mode (WRITE by default) for the lifetime of the iterator and records
+        are pulled fetch_size at a time (config.fetch_size by default), so that memory
+        stays bounded whatever the size of the result. Closing the iterator before the
+        end closes the session, which discards the remaining records and releases the
+        connection.
+        """
+        if self._active_transaction:
+            for row in self._stream_cypher_query(
+                self._active_transaction,
+                query,
+                params,
+                handle_unique=handle_unique,
+                resolve_objects=resolve_objects,
+            ):
+                yield row
+            return
+
+        if not self.driver:
+            self._connect_from_config()
+        if not self.driver:
+            raise ValueError("No driver has been set")
+        with self._open_session(
+            access_mode, fetch_size=fetch_size or get_config().fetch_size
+        ) as session:
+            for row in self._stream_cypher_query(
+                session,
+                query,
+                params,
+                handle_unique=handle_unique,
+                resolve_objects=resolve_objects,
+            ):
+                yield row
+
+    def _stream_columns(
+        self,
+        query: str,
+        params: dict[str, Any],
+        chunk_size: int | None = None,
+        access_mode: str | None = None,
+    ) -> Iterator[tuple[list[list], tuple[str, ...]]]:
+        """
+        Stream the records of a query as columns, i.e. one list of values per field,
+        of at most chunk_size records (all of them by default), and the field names.
+        Nothing is returned when the query returns no records.
+        """
+        buffers: list[list] = []
+        keys: tuple[str, ...] = ()
+        records = self._stream_query(query, params, access_mode=access_mode)
+        with closing(records):
+            for values, keys in records:
+                if not buffers:
+                    buffers = [[] for _ in values]
+                for buffer, value in zip(buffers, values):
+                    buffer.append(value)
+                if chunk_size and len(buffers[0]) >= chunk_size:
+                    yield buffers, keys
+                    buffers = []
+        if buffers:
+            yield buffers, keys
+
+    def cypher_query_arrow(
+        self,
+        query: str,
+        params: dict[str, Any] | None = None,
+        batch_size: int | None = None,
+        schema: Any = None,
+    ) -> Iterator:
+        """
+        Runs a query on the database and streams the results as Apache Arrow record
+        batches. The values are gathered into one list per column and converted
+        column by column. Requires pyarrow to be installed.
+
+        :param query: A CYPHER query
+        :type: str
+        :param params: Dictionary of parameters
+        :type: dict
+        :param batch_size: maximum number of rows per batch, the fetch_size
+            configuration option by default
+        :type: int
+        :param schema: a pyarrow.Schema for the batches. By default the type of each
+            column is inferred from its first non null values, and the batches are
+            held back until the types of all the columns are known
+        :return: pyarrow.RecordBatch iterator, all the batches with the same schema
+        """
+        from neomodel.integration.arrow import RecordBatchBuilder
+
+        if batch_size is None:
+            batch_size = get_config().fetch_size
+        builder = RecordBatchBuilder(schema)
+        for buffers, keys in self._stream_columns(
+            query, params or {}, batch_size if batch_size > 0 else None
+        ):
+            for batch in builder.add(buffers, names=keys):
+                yield batch
+        for batch in builder.finish():
+            yield batch
+
     def get_id_method(self) -> str:
         db_version = self.database_version
         if db_version is None:
@@ -837,6 +1189,117 @@ class Database:
             int(element_id) if db_version.startswith(VERSION_LEGACY_ID) else element_id
         )
 
+    def save_all(self, instances: Any, batch_size: int | None = None) -> list[Any]:
+        """
+        Save many node instances, of any classes, with one UNWIND statement per class
+        and operation instead of one query per node: unsaved nodes are created and
+        receive their element id, saved nodes are updated with their changed properties
+        (see StructuredNode.save). The pre_save and post_save hooks (and post_create
+        for new nodes) are called as with save(). Statements run in the active
+        transaction, or in a new one.
+
+        :param instances: the StructuredNode instances to save
+        :param batch_size: Optional, overrides the batch_size configuration option
+        :return: the instances
+        """
+        from neomodel.sync_.node import StructuredNode
+
+        instances = list(instances)
+        batch_size = int(batch_size or get_config().batch_size)
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        for instance in instances:
+            if not isinstance(instance, StructuredNode):
+                raise TypeError(f"Expected a StructuredNode, got {instance!r}")
+            if getattr(instance, "deleted", False):
+                raise ValueError(
+                    f"{instance.__class__.__name__}.save() attempted on deleted node"
+                )
+
+        for instance in instances:
+            _exec_hook("pre_save", instance)
+
+        creates: dict[type, list[tuple[Any, dict[str, Any]]]] = {}
+        updates: dict[type, list[tuple[Any, dict[str, Any]]]] = {}
+        for instance in instances:
+            cls = instance.__class__
+            if not hasattr(instance, "element_id_property"):
+                params = cls.deflate(instance.__properties__, instance, skip_empty=True)
+                creates.setdefault(cls, []).append((instance, params))
+            elif instance._dirty is None:
+                params = cls.deflate(instance.__properties__, instance)
+                updates.setdefault(cls, []).append((instance, params))
+            else:
+                params = instance._deflate_changes()
+                if params:
+                    updates.setdefault(cls, []).append((instance, params))
+
+        if creates or updates:
+            # only update the instances once their statements succeeded, so that
+            # they don't keep the element ids of rolled back nodes
+            if self._active_transaction:
+                saved = self._save_groups(creates, updates, batch_size)
+            else:
+                with self.transaction:
+                    saved = self._save_groups(creates, updates, batch_size)
+            for instance, element_id, params in saved:
+                if element_id is not None:
+                    instance.element_id_property = element_id
+                instance._mark_saved(params)
+
+        for group in creates.values():
+            for instance, _ in group:
+                _exec_hook("post_create", instance)
+        for instance in instances:
+            _exec_hook("post_save", instance)
+        return instances
+
+    def _save_groups(
+        self,
+        creates: dict[type, list[tuple[Any, dict[str, Any]]]],
+        updates: dict[type, list[tuple[Any, dict[str, Any]]]],
+        batch_size: int,
+    ) -> list[tuple[Any, str | None, dict[str, Any]]]:
+        """
+        Run the statements of save_all(), returning each saved instance with its new
+        element id (None for updates) and the properties written.
+        """
+        saved: list[tuple[Any, str | None, dict[str, Any]]] = []
+        id_method = self.get_id_method()
+        for cls, group in creates.items():
+            query = (
+                f"UNWIND $batch AS row CREATE (n:{cls.get_schema().label_string}) "
+                f"SET n = row RETURN {id_method}(n)"
+            )
+            for start in range(0, len(group), batch_size):
+                chunk = group[start : start + batch_size]
+                results, _ = self.cypher_query(
+                    query, {"batch": [params for _, params in chunk]}
+                )
+                for (instance, params), row in zip(chunk, results):
+                    saved.append((instance, str(row[0]), params))
+
+        for cls, group in updates.items():
+            query = (
+                "UNWIND $batch AS row MATCH (n) "
+                f"WHERE {id_method}(n) = row.id SET n += row.props"
+            )
+            if any(instance._dirty is None for instance, _ in group):
+                # some nodes were not loaded from the database, set their labels
+                query += f" SET n:{cls.get_schema().label_string}"
+            for start in range(0, len(group), batch_size):
+                chunk = group[start : start + batch_size]
+                batch = [
+                    {
+                        "id": self.parse_element_id(instance.element_id),
+                        "props": params,
+                    }
+                    for instance, params in chunk
+                ]
+                self.cypher_query(query, {"batch": batch})
+                saved.extend((instance, None, params) for instance, params in chunk)
+        return saved
+
     def list_indexes(self, exclude_token_lookup: bool = False) -> list[dict]:
         """Returns all indexes existing in the database
 
@@ -1044,12 +1507,11 @@ class Database:
                 )
             return
 
-        for name, property in cls.defined_properties(aliases=False, rels=False).items():
+        schema = cls.get_schema()
+        for name, property in schema.properties.items():
             self._install_node(cls, name, property, quiet, _stdout)
 
-        for _, relationship in cls.defined_properties(
-            aliases=False, rels=True, properties=False
-        ).items():
+        for relationship in schema.relationships.values():
             self._install_relationship(cls, relationship, quiet, _stdout)
 
     def _create_node_index(
@@ -1354,10 +1816,8 @@ class Database:
         relationship_cls = relationship.definition["model"]
         if relationship_cls is not None:
             relationship_type = relationship.definition["relation_type"]
-            for prop_name, property in relationship_cls.defined_properties(
-                aliases=False, rels=False
-            ).items():
-                db_property = property.get_db_property_name(prop_name)
+            rel_schema = relationship_cls.get_schema()
+            for _, db_property, property in rel_schema.property_fields:
                 if property.index:
                     self._create_relationship_index(
                         relationship_type=relationship_type,
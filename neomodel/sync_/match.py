@@ -1,10 +1,18 @@
+import base64
+import copy
 import inspect
+import json
 import re
 import string
+from contextlib import closing
 from dataclasses import dataclass
 from typing import Any, Iterator, Optional, Union
 
+import neo4j.time
+
 from neomodel._async_compat.util import Util
+from neomodel.config import get_config
+from neomodel.constants import ACCESS_MODE_READ, ACCESS_MODE_WRITE
 from neomodel.exceptions import MultipleNodesReturned
 from neomodel.match_q import Q, QBase
 from neomodel.properties import AliasProperty, ArrayProperty, Property
@@ -14,7 +22,7 @@ from neomodel.sync_.database import db
 from neomodel.sync_.node import StructuredNode
 from neomodel.sync_.relationship import StructuredRel
 from neomodel.typing import Subquery, Transformation
-from neomodel.util import RelationshipDirection
+from neomodel.util import Param, QueryPlan, RelationshipDirection
 
 CYPHER_ACTIONS_WITH_SIDE_EFFECT_EXPR = re.compile(r"(?i:MERGE|CREATE|DELETE|DETACH)")
 
@@ -203,22 +211,22 @@ OPERATOR_TABLE.update(_REGEX_OPERATOR_TABLE)
 path_split_regex = re.compile(r"__(?!_)|\|")
 
 
-def install_traversals(cls: type[StructuredNode], node_set: "NodeSet") -> None:
+_checked_traversal_names: set[tuple[type, type]] = set()
+
+
+def _check_traversal_names(
+    node_set_cls: type["NodeSet"], cls: type[StructuredNode]
+) -> None:
     """
-    For a StructuredNode class install Traversal objects for each
-    relationship definition on a NodeSet instance
+    Check that none of the relationship definitions of a StructuredNode class
+    conflicts with an attribute of the NodeSet class its traversals are installed on.
     """
-    rels = cls.defined_properties(rels=True, aliases=False, properties=False)
-
-    for key in rels.keys():
-        if hasattr(node_set, key):
+    if (node_set_cls, cls) in _checked_traversal_names:
+        return
+    for key in cls.get_schema().relationships:
+        if key in ("source", "source_class") or hasattr(node_set_cls, key):
             raise ValueError(f"Cannot install traversal '{key}' exists on NodeSet")
-
-        rel = getattr(cls, key)
-        rel.lookup_node_class()
-
-        traversal = Traversal(source=node_set, name=key, definition=rel.definition)
-        setattr(node_set, key, traversal)
+    _checked_traversal_names.add((node_set_cls, cls))
 
 
 def _handle_special_operators(
@@ -253,6 +261,41 @@ def _handle_special_operators(
     return deflated_value, operator, prop
 
 
+@dataclass
+class _ParamBinding:
+    """A Param used as a filter value, with the function deflating its bound value."""
+
+    param: Param
+    deflate: Any
+
+    def bind(self, values: dict[str, Any]) -> Any:
+        return self.deflate(values[self.param.name])
+
+
+def _deflate_param(
+    cls: type[StructuredNode],
+    property_obj: Property,
+    key: str,
+    param: Param,
+    operator: str,
+    prop: str,
+) -> tuple[_ParamBinding, str, str]:
+    def deflate(value: Any, operator: str = operator, prop: str = prop) -> Any:
+        return _deflate_value(cls, property_obj, key, value, operator, prop)[0]
+
+    # the operator and property as they will be once the value is deflated
+    if isinstance(property_obj, AliasProperty):
+        prop = property_obj.aliased_to()
+    elif operator == _SPECIAL_OPERATOR_ISNULL:
+        raise ValueError(f"A Param can not be used for isnull operation on {key}")
+    elif operator == _SPECIAL_OPERATOR_IN and isinstance(property_obj, ArrayProperty):
+        operator = _SPECIAL_OPERATOR_ARRAY_IN
+    elif operator in _REGEX_OPERATOR_TABLE.values():
+        operator = _SPECIAL_OPERATOR_REGEX
+
+    return _ParamBinding(param, deflate), operator, prop
+
+
 def _deflate_value(
     cls: type[StructuredNode],
     property_obj: Property,
@@ -260,7 +303,9 @@ def _deflate_value(
     value: str,
     operator: str,
     prop: str,
-) -> tuple[str, str, str]:
+) -> tuple[Any, str, str]:
+    if isinstance(value, Param):
+        return _deflate_param(cls, property_obj, key, value, operator, prop)
     if isinstance(property_obj, AliasProperty):
         prop = property_obj.aliased_to()
         deflated_value = getattr(cls, prop).deflate(value)
@@ -306,18 +351,17 @@ def _process_filter_key(
     ) = _initialize_filter_args_variables(cls, key)
 
     for part in re.split(path_split_regex, key):
-        defined_props = current_class.defined_properties(rels=True)
-        # update defined props dictionary with relationship properties if
-        # we are filtering by property
+        member = None
+        # relationship properties take precedence if we are filtering by property
         if is_rel_property and current_rel_model:
-            defined_props.update(current_rel_model.defined_properties(rels=True))
-        if part in defined_props:
-            if isinstance(
-                defined_props[part], relationship_manager.RelationshipDefinition
-            ):
-                defined_props[part].lookup_node_class()
-                current_class = defined_props[part].definition["node_class"]
-                current_rel_model = defined_props[part].definition["model"]
+            member = current_rel_model.get_schema().members.get(part)
+        if member is None:
+            member = current_class.get_schema().members.get(part)
+        if member is not None:
+            if isinstance(member, relationship_manager.RelationshipDefinition):
+                member.lookup_node_class()
+                current_class = member.definition["node_class"]
+                current_rel_model = member.definition["model"]
         elif part in OPERATOR_TABLE:
             operator = OPERATOR_TABLE[part]
             prop, _ = prop.rsplit("__", 1)
@@ -363,7 +407,7 @@ def process_has_args(
     """
     loop through has parameters check they correspond to class rels defined
     """
-    rel_definitions = cls.defined_properties(properties=False, rels=True, aliases=False)
+    rel_definitions = cls.get_schema().relationships
 
     match, dont_match = {}, {}
 
@@ -442,6 +486,61 @@ class QueryAST:
         self.mixed_filters: bool = False
 
 
+def _prefetch_relationship(
+    nodes: list, name: str, access_mode: str | None = None
+) -> list:
+    """
+    Fetch the nodes related to each of nodes through the relationship called name,
+    with one query per relationship definition, and cache them on the relationship
+    managers of nodes.
+
+    :return: the related nodes
+    """
+    groups: dict[int, tuple[Any, list]] = {}
+    for node in nodes:
+        relationship = node.get_schema().relationships[name]
+        groups.setdefault(id(relationship), (relationship, []))[1].append(node)
+
+    id_method = db.get_id_method()
+    related_nodes: list = []
+    for relationship, group in groups.values():
+        relationship.lookup_node_class()
+        definition = relationship.definition
+        pattern = _rel_helper(
+            lhs="us",
+            rhs=f"(them:{definition['node_class'].__label__})",
+            relation_type=definition["relation_type"],
+            direction=definition["direction"],
+        )
+        ids = [db.parse_element_id(node.element_id) for node in group]
+        results, _ = db.cypher_query(
+            f"MATCH (us) WHERE {id_method}(us) IN $ids "
+            f"MATCH {pattern} RETURN {id_method}(us), them",
+            {"ids": list(dict.fromkeys(ids))},
+            resolve_objects=True,
+            access_mode=db._read_access_mode(access_mode),
+        )
+        related: dict[Any, list] = {}
+        for source_id, node in results:
+            related.setdefault(source_id, []).append(node)
+            related_nodes.append(node)
+        for node_id, node in zip(ids, group):
+            getattr(node, name)._prefetched = related.get(node_id, [])
+    return related_nodes
+
+
+def _prefetch(
+    nodes: list, paths: dict[str, dict], access_mode: str | None = None
+) -> None:
+    """
+    Prefetch the relationship paths, as a tree of relationship names, of nodes.
+    """
+    for name, nested_paths in paths.items():
+        related_nodes = _prefetch_relationship(nodes, name, access_mode)
+        if nested_paths and related_nodes:
+            _prefetch(related_nodes, nested_paths, access_mode)
+
+
 class QueryBuilder:
     def __init__(
         self, node_set: "BaseSet", subquery_namespace: str | None = None
@@ -453,6 +552,11 @@ class QueryBuilder:
         self._relation_identifier_count: int = 0
         self._node_identifier_count: int = 0
         self._subquery_namespace: str | None = subquery_namespace
+        # whether Param placeholders are allowed, set by AsyncPreparedQuery
+        self._prepared = False
+        # variable of the nodes of the node set, set by build_ast(). Unlike
+        # return_clause, it is also a single variable with a vector or fulltext filter
+        self._source_ident: str | None = None
 
     def build_ast(self) -> "QueryBuilder":
         if isinstance(self.node_set, NodeSet) and hasattr(
@@ -475,7 +579,11 @@ class QueryBuilder:
         ):
             self.build_fulltext_query()
 
-        self.build_source(self.node_set)
+        self._source_ident = self.build_source(self.node_set)
+
+        partition = getattr(self.node_set, "_partition", None)
+        if partition is not None:
+            self.build_partition_filter(*partition)
 
         if hasattr(self.node_set, "skip"):
             self._ast.skip = self.node_set.skip
@@ -540,7 +648,10 @@ class QueryBuilder:
                 is_rel_property = "|" in elm
                 if "__" not in elm and not is_rel_property:
                     prop = elm.split(" ")[0] if " " in elm else elm
-                    if prop not in source.source_class.defined_properties(rels=False):
+                    if (
+                        source.source_class.get_schema().lookup(prop, rels=False)
+                        is None
+                    ):
                         raise ValueError(
                             f"No such property {prop} on {source.source_class.__name__}. "
                             f"Note that Neo4j internals like id or element_id are not allowed "
@@ -810,6 +921,18 @@ class QueryBuilder:
             place_holder = f"{self._subquery_namespace}_{place_holder}"
         return place_holder
 
+    def _register_param(self, key: str, value: Any) -> str:
+        """
+        Register a value which is not part of the query shape (pagination, search vector...)
+        as a query parameter. Unlike filter place holders, the name is stable so that queries
+        with the same shape always produce the same Cypher text, and hit the query plan cache.
+        """
+        place_holder = key
+        if self._subquery_namespace:
+            place_holder = f"{self._subquery_namespace}_{place_holder}"
+        self._query_params[place_holder] = value
+        return place_holder
+
     def _parse_path(
         self, source_class: type[StructuredNode], prop: str
     ) -> tuple[str, str, Any, bool]:
@@ -872,9 +995,11 @@ class QueryBuilder:
                 ) = self._parse_path(source_class, prop)
             operator, val = op_and_val
             if not is_rel_filter:
-                prop = target_class.defined_properties(rels=False)[
-                    prop
-                ].get_db_property_name(prop)
+                prop = (
+                    target_class.get_schema()
+                    .lookup(prop, rels=False)
+                    .get_db_property_name(prop)
+                )
             statement = self._finalize_filter_statement(operator, ident, prop, val)
             target.append((statement, is_optional_relation))
 
@@ -1008,38 +1133,52 @@ class QueryBuilder:
             query += self._ast.lookup
 
         if self._ast.vector_index_query:
+            vector_query = self._ast.vector_index_query
+            vector = self._register_param("vector_query_vector", vector_query.vector)
+            topk = self._register_param("vector_query_topk", vector_query.topk)
             query += f"""CALL () {{ 
-                CALL db.index.vector.queryNodes("{self._ast.vector_index_query.index_name}", {self._ast.vector_index_query.topk}, {self._ast.vector_index_query.vector}) 
-                YIELD node AS {self._ast.vector_index_query.node_set_label}, score """
+                CALL db.index.vector.queryNodes("{vector_query.index_name}", ${topk}, ${vector}) 
+                YIELD node AS {vector_query.node_set_label}, score """
 
-            if self._ast.vector_index_query.threshold:
+            if vector_query.threshold:
+                threshold = self._register_param(
+                    "vector_query_threshold", vector_query.threshold
+                )
                 query += f"""
-                WHERE score >= {self._ast.vector_index_query.threshold}
+                WHERE score >= ${threshold}
                 """
 
             query += f"""
-                RETURN {self._ast.vector_index_query.node_set_label}, score 
+                RETURN {vector_query.node_set_label}, score 
             }}"""
 
             # This ensures that we bring the context of the new nodeSet and score along with us for metadata filtering
-            query += f""" WITH {self._ast.vector_index_query.node_set_label}, score"""
+            query += f""" WITH {vector_query.node_set_label}, score"""
 
         if self._ast.fulltext_index_query:
+            fulltext_query = self._ast.fulltext_index_query
+            query_string = self._register_param(
+                "fulltext_query_string", fulltext_query.query_string
+            )
+            topk = self._register_param("fulltext_query_topk", fulltext_query.topk)
             query += f"""CALL () {{
-                CALL db.index.fulltext.queryNodes("{self._ast.fulltext_index_query.index_name}", "{self._ast.fulltext_index_query.query_string}")
-                YIELD node AS {self._ast.fulltext_index_query.node_set_label}, score"""
+                CALL db.index.fulltext.queryNodes("{fulltext_query.index_name}", ${query_string})
+                YIELD node AS {fulltext_query.node_set_label}, score"""
 
-            if self._ast.fulltext_index_query.threshold:
+            if fulltext_query.threshold:
+                threshold = self._register_param(
+                    "fulltext_query_threshold", fulltext_query.threshold
+                )
                 query += f"""
-                WHERE score >= {self._ast.fulltext_index_query.threshold}
+                WHERE score >= ${threshold}
                 """
 
             query += f"""
-                RETURN {self._ast.fulltext_index_query.node_set_label}, score LIMIT {self._ast.fulltext_index_query.topk}
+                RETURN {fulltext_query.node_set_label}, score LIMIT ${topk}
             }}
                 """
             # This ensures that we bring the context of the new nodeSet and score along with us for metadata filtering
-            query += f""" WITH {self._ast.fulltext_index_query.node_set_label}, score"""
+            query += f""" WITH {fulltext_query.node_set_label}, score"""
 
         # Instead of using only one MATCH statement for every relation
         # to follow, we use one MATCH per relation (to avoid cartesian
@@ -1162,23 +1301,137 @@ class QueryBuilder:
         # If we return a count with pagination, pagination has to happen before RETURN
         # It will then be included in the WITH clause already
         if self._ast.skip and not self._ast.is_count:
-            query += f" SKIP {self._ast.skip}"
+            query += f" SKIP ${self._register_param('skip', self._ast.skip)}"
 
         if self._ast.limit and not self._ast.is_count:
-            query += f" LIMIT {self._ast.limit}"
+            query += f" LIMIT ${self._register_param('limit', self._ast.limit)}"
 
+        if not self._prepared and not self._subquery_namespace:
+            for value in self._query_params.values():
+                if isinstance(value, _ParamBinding):
+                    value = value.param
+                if isinstance(value, Param):
+                    raise ValueError(
+                        f"Param placeholders need NodeSet.prepare(), got {value!r}"
+                    )
         return query
 
+    def build_values(self, fields: tuple[str, ...]) -> list[Property]:
+        """
+        Return the given properties of the nodes, or of the nodes along traversal
+        paths (e.g. 'employer__name'), instead of the nodes themselves.
+
+        :return: the property definitions of the fields
+        """
+        source_class = self.node_set.source_class
+        projections = []
+        properties = []
+        for field in fields:
+            ident, target_class, name = self._source_ident, source_class, field
+            if "__" in field:
+                path, name = field.rsplit("__", 1)
+                result = self.lookup_query_variable(path)
+                if result:
+                    ident, target_class, _ = result
+                else:
+                    ident, target_class = self.build_traversal_from_path(
+                        Path(
+                            value=path,
+                            optional=True,
+                            include_nodes_in_return=False,
+                            include_rels_in_return=False,
+                        ),
+                        source_class,
+                    )
+            schema = target_class.get_schema()
+            if name not in schema.properties:
+                raise ValueError(
+                    f"No property called '{name}' on {target_class.__name__}"
+                )
+            projections.append(f"{ident}.{schema.db_property_names[name]} AS {field}")
+            properties.append(schema.properties[name])
+
+        self._ast.return_clause = ", ".join(projections)
+        self._ast.additional_return = None
+        return properties
+
+    def build_keyset_filter(
+        self, keys: list[tuple[str, bool]], values: list[Any]
+    ) -> None:
+        """
+        Only match the nodes ordered after the given values of the ordering keys,
+        as (property name, descending) pairs.
+        """
+        ident = self._source_ident
+        db_property_names = self.node_set.source_class.get_schema().db_property_names
+        clauses = []
+        equalities: list[str] = []
+        for index, ((name, descending), value) in enumerate(zip(keys, values)):
+            prop = f"{ident}.{db_property_names[name]}"
+            place_holder = self._register_param(f"after_{index}", value)
+            operator = "<" if descending else ">"
+            clauses.append(
+                " AND ".join(equalities + [f"{prop} {operator} ${place_holder}"])
+            )
+            if not equalities:
+                # the range on the first key lets the planner seek its index
+                first_range = f"{prop} {operator}= ${place_holder}"
+            equalities.append(f"{prop} = ${place_holder}")
+        if len(clauses) > 1:
+            self._ast.where.append(
+                f"{first_range} AND ({' OR '.join(f'({c})' for c in clauses)})"
+            )
+        else:
+            self._ast.where.append(clauses[0])
+
+    def _partition_key(self, by: str | None) -> str:
+        ident = self._source_ident
+        return f"{ident}.{by}" if by else f"id({ident})"
+
+    def build_partition_filter(self, by: str | None, lower: Any, upper: Any) -> None:
+        """
+        Only match the nodes whose internal id, or database property by, is in the
+        range [lower, upper). A None bound leaves the range open on that side, and
+        the nodes without the property belong to the partition without lower bound.
+        """
+        key = self._partition_key(by)
+        clauses = []
+        if lower is not None:
+            place_holder = self._register_param("partition_lower", lower)
+            clauses.append(f"{key} >= ${place_holder}")
+        if upper is not None:
+            place_holder = self._register_param("partition_upper", upper)
+            clause = f"{key} < ${place_holder}"
+            if by and lower is None:
+                clause = f"({clause} OR {key} IS NULL)"
+            clauses.append(clause)
+        if clauses:
+            self._ast.where.append(" AND ".join(clauses))
+
+    def _partition_bounds(self, by: str | None) -> tuple[Any, Any]:
+        key = self._partition_key(by)
+        self._ast.return_clause = f"min({key}), max({key})"
+        # drop order_by and additional_return, as in _count
+        self._ast.order_by = None
+        self._ast.additional_return = None
+        query = self.build_query()
+        results, _ = db.cypher_query(
+            query, self._query_params, access_mode=self._read_access_mode()
+        )
+        return results[0][0], results[0][1]
+
     def _count(self) -> int:
         self._ast.is_count = True
         # If we return a count with pagination, pagination has to happen before RETURN
         # Like : WITH my_var SKIP 10 LIMIT 10 RETURN count(my_var)
         self._ast.with_clause = f"{self._ast.return_clause}"
         if self._ast.skip:
-            self._ast.with_clause += f" SKIP {self._ast.skip}"
+            skip = self._register_param("skip", self._ast.skip)
+            self._ast.with_clause += f" SKIP ${skip}"
 
         if self._ast.limit:
-            self._ast.with_clause += f" LIMIT {self._ast.limit}"
+            limit = self._register_param("limit", self._ast.limit)
+            self._ast.with_clause += f" LIMIT ${limit}"
 
         self._ast.return_clause = f"count({self._ast.return_clause})"
         # drop order_by, results in an invalid query
@@ -1186,7 +1439,9 @@ class QueryBuilder:
         # drop additional_return to avoid unexpected result
         self._ast.additional_return = None
         query = self.build_query()
-        results, _ = db.cypher_query(query, self._query_params)
+        results, _ = db.cypher_query(
+            query, self._query_params, access_mode=self._read_access_mode()
+        )
         return int(results[0][0])
 
     def _contains(self, node_element_id: str | int | None) -> bool:
@@ -1203,87 +1458,140 @@ class QueryBuilder:
 
     def _execute(self, lazy: bool = False, dict_output: bool = False) -> Any:
         if lazy:
-            # inject id() into return or return_set
-            if self._ast.return_clause:
-                self._ast.return_clause = (
-                    f"{db.get_id_method()}({self._ast.return_clause})"
-                )
-            else:
-                if self._ast.additional_return is not None:
-                    self._ast.additional_return = [
-                        f"{db.get_id_method()}({item})"
-                        for item in self._ast.additional_return
-                    ]
+            self._return_ids()
         query = self.build_query()
-
-        # Use streaming for async code to avoid loading all results into memory
-        if Util.is_async_code:
-            # Helper to process streaming results
-            def process_stream(stream_iterator):
-                first_result = True
-                result_has_single_column = False
-                for values, prop_names in stream_iterator:
-                    if first_result:
-                        # Determine format on first result
-                        result_has_single_column = len(values) == 1
-                        first_result = False
-
-                    if dict_output:
-                        yield dict(zip(prop_names, values))
-                    elif result_has_single_column:
-                        yield values[0]
-                    else:
-                        yield values
-
-            # Stream results one by one from the database
-            if db._active_transaction:
-                # Use current transaction if active
-                stream = db._stream_cypher_query(
-                    db._active_transaction,
-                    query,
-                    self._query_params,
-                    handle_unique=True,
-                    resolve_objects=True,
-                )
-                for item in process_stream(stream):
-                    yield item
-            else:
-                # Create a session for streaming
-                # Note: We need to keep the session open during iteration
-                with db.driver.session(
-                    database=db._database_name,
-                    impersonated_user=db.impersonated_user,
-                ) as session:
-                    stream = db._stream_cypher_query(
-                        session,
-                        query,
-                        self._query_params,
-                        handle_unique=True,
-                        resolve_objects=True,
-                    )
-                    for item in process_stream(stream):
+        results = self._execute_query(query, self._query_params, dict_output)
+        prefetch = getattr(self.node_set, "_prefetch", None)
+        if prefetch and not lazy and not dict_output:
+            results = self._prefetch_batches(results, prefetch)
+        with closing(results):
+            for item in results:
+                yield item
+
+    def _prefetch_batches(self, results: Iterator, paths: dict[str, dict]) -> Iterator:
+        # Prefetch the relationships of the result nodes batch_size nodes at a time,
+        # so that streamed results are still never loaded into memory all at once
+        batch_size = get_config().batch_size
+        batch: list = []
+        with closing(results):
+            for item in results:
+                batch.append(item)
+                if len(batch) >= batch_size:
+                    self._prefetch_batch(batch, paths)
+                    for item in batch:
                         yield item
+                    batch = []
+        if batch:
+            self._prefetch_batch(batch, paths)
+            for item in batch:
+                yield item
+
+    def _prefetch_batch(self, batch: list, paths: dict[str, dict]) -> None:
+        source_class = self.node_set.source_class
+        nodes = []
+        for item in batch:
+            if isinstance(item, list) and item:
+                item = item[0]
+            if isinstance(item, source_class):
+                nodes.append(item)
+        if nodes:
+            _prefetch(nodes, paths, self._read_access_mode())
+
+    def _read_access_mode(self) -> str:
+        # set by NodeSet.access_mode(), see AsyncDatabase._read_access_mode
+        return db._read_access_mode(getattr(self.node_set, "_access_mode", None))
+
+    def _return_ids(self) -> None:
+        # inject id() into return or return_set
+        if self._ast.return_clause:
+            self._ast.return_clause = f"{db.get_id_method()}({self._ast.return_clause})"
         else:
-            # Sync code path: use traditional approach (fetch all results)
-            results, prop_names = db.cypher_query(
-                query,
-                self._query_params,
-                resolve_objects=True,
-            )
-            if dict_output:
-                for item in results:
-                    yield dict(zip(prop_names, item))
-                return
-            # The following is not as elegant as it could be but had to be copied from the
-            # version prior to cypher_query with the resolve_objects capability.
-            # It seems that certain calls are only supposed to be focusing to the first
-            # result item returned (?)
-            if results and len(results[0]) == 1:
-                for n in results:
-                    yield n[0]
-            else:
-                for result in results:
-                    yield result
+            if self._ast.additional_return is not None:
+                self._ast.additional_return = [
+                    f"{db.get_id_method()}({item})"
+                    for item in self._ast.additional_return
+                ]
+
+    def _execute_query(
+        self, query: str, params: dict[str, Any], dict_output: bool = False
+    ) -> Any:
+        # Stream the records, so that results are never loaded into memory all at once,
+        # and close the stream as soon as this generator is closed, which closes the
+        # session rather than waiting for the stream to be garbage collected
+        result_has_single_column = None
+        records = db._stream_query(
+            query,
+            params,
+            handle_unique=True,
+            resolve_objects=True,
+            access_mode=self._read_access_mode(),
+        )
+        with closing(records):
+            for values, prop_names in records:
+                if dict_output:
+                    yield dict(zip(prop_names, values))
+                    continue
+                if result_has_single_column is None:
+                    # certain calls only focus on the first item of each record
+                    result_has_single_column = len(values) == 1
+                if result_has_single_column:
+                    yield values[0]
+                else:
+                    yield values
+
+
+@dataclass
+class Page:
+    """A page of results of NodeSet.paginate()."""
+
+    items: list
+    # opaque cursor of the next page, None on the last page
+    next_cursor: str | None = None
+
+
+# temporal values of pagination cursors, encoded as {"$<name>": "<ISO format>"}
+_CURSOR_TEMPORAL_TYPES = {
+    "$datetime": neo4j.time.DateTime,
+    "$date": neo4j.time.Date,
+    "$time": neo4j.time.Time,
+}
+
+
+def _encode_cursor_value(value: Any) -> Any:
+    for tag, temporal_type in _CURSOR_TEMPORAL_TYPES.items():
+        if isinstance(value, temporal_type):
+            return {tag: value.iso_format()}
+    raise ValueError(f"Cannot paginate by a property stored as {type(value).__name__}")
+
+
+def _decode_cursor_value(value: dict) -> Any:
+    if len(value) == 1:
+        tag, iso_value = next(iter(value.items()))
+        if tag in _CURSOR_TEMPORAL_TYPES:
+            return _CURSOR_TEMPORAL_TYPES[tag].from_iso_format(iso_value)
+    raise ValueError(f"Invalid pagination cursor value {value!r}")
+
+
+def _encode_cursor(keys: list[str], values: list[Any]) -> str:
+    payload = json.dumps(
+        [keys, values], separators=(",", ":"), default=_encode_cursor_value
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def _decode_cursor(cursor: str, keys: list[str]) -> list[Any]:
+    try:
+        cursor_keys, values = json.loads(
+            base64.urlsafe_b64decode(cursor.encode()),
+            object_hook=_decode_cursor_value,
+        )
+    except (ValueError, TypeError) as exc:
+        raise ValueError(f"Invalid pagination cursor {cursor!r}") from exc
+    if cursor_keys != keys or len(values) != len(keys):
+        raise ValueError(
+            f"Pagination cursor {cursor!r} was not created for the ordering {keys}"
+        )
+    return values
 
 
 @dataclass
@@ -1331,14 +1639,18 @@ class BaseSet:
 
         This provides true iteration without loading all results into memory first.
         For large result sets, this is much more memory efficient than using all().
+        Closing the iterator closes the underlying session straight away, so wrap it in
+        contextlib.closing() to release the session as soon as the loop is left early.
 
         Example:
             for node in Coffee.nodes:
                 print(node.name)  # Process each node as it arrives
         """
         ast = self.query_cls(self).build_ast()
-        for item in ast._execute():
-            yield item
+        results = ast._execute()
+        with closing(results):
+            for item in results:
+                yield item
 
     def __len__(self) -> int:
         ast = self.query_cls(self).build_ast()
@@ -1549,8 +1861,8 @@ class NodeSet(BaseSet):
         else:
             raise ValueError("Bad source for nodeset " + repr(source))
 
-        # setup Traversal objects using relationship definitions
-        install_traversals(self.source_class, self)
+        # Traversal objects are created on first access, see __getattr__
+        _check_traversal_names(type(self), self.source_class)
 
         self.filters: list = []
         self.q_filters = Q()
@@ -1565,12 +1877,60 @@ class NodeSet(BaseSet):
         self._subqueries: list[Subquery] = []
         self._intermediate_transforms: list = []
         self._unique_variables: list[str] = []
+        # relationship paths to prefetch, as a tree of relationship names
+        self._prefetch: dict[str, dict] = {}
+        # (db property or None for the internal id, lower, upper) set by partitions()
+        self._partition: tuple[str | None, Any, Any] | None = None
+        # session access mode of the queries run outside transactions, see access_mode()
+        self._access_mode: str | None = None
         self.vector_query: VectorFilter | None = None
         self.fulltext_query: FulltextFilter | None = None
 
     def __await__(self) -> Any:
         return self.all().__await__()  # type: ignore[attr-defined]
 
+    def __getattr__(self, name: str) -> "Traversal":
+        """
+        Create the Traversal object of a relationship definition of the source class
+        on first access, and cache it on the node set.
+        """
+        source_class = self.__dict__.get("source_class")
+        relationship = None
+        if source_class is not None and not name.startswith("__"):
+            relationship = source_class.get_schema().relationships.get(name)
+        if relationship is None:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+
+        relationship.lookup_node_class()
+        traversal = Traversal(
+            source=self, name=name, definition=relationship.definition
+        )
+        setattr(self, name, traversal)
+        return traversal
+
+    def _clone(self) -> "NodeSet":
+        """
+        Return a copy of the node set which can be refined without changing this one.
+        """
+        clone = copy.copy(self)
+        for name, value in vars(self).items():
+            if isinstance(value, Traversal):
+                # cached traversals start from this node set, see __getattr__
+                delattr(clone, name)
+        clone.filters = list(self.filters)
+        clone.order_by_elements = list(self.order_by_elements)
+        clone.must_match = dict(self.must_match)
+        clone.dont_match = dict(self.dont_match)
+        clone.relations_to_fetch = list(self.relations_to_fetch)
+        clone._extra_results = list(self._extra_results)
+        clone._subqueries = list(self._subqueries)
+        clone._intermediate_transforms = list(self._intermediate_transforms)
+        clone._unique_variables = list(self._unique_variables)
+        clone._prefetch = copy.deepcopy(self._prefetch)
+        return clone
+
     def _get(
         self, limit: int | None = None, lazy: bool = False, **kwargs: dict[str, Any]
     ) -> list:
@@ -1740,8 +2100,8 @@ class NodeSet(BaseSet):
                 else:
                     desc = False
 
-                if prop in self.source_class.defined_properties(rels=False):
-                    property_obj = getattr(self.source_class, prop)
+                property_obj = self.source_class.get_schema().lookup(prop, rels=False)
+                if property_obj is not None:
                     if isinstance(property_obj, AliasProperty):
                         prop = property_obj.aliased_to()
 
@@ -1749,6 +2109,180 @@ class NodeSet(BaseSet):
 
         return self
 
+    def paginate(
+        self, order_by: str | list[str], after: str | None = None, size: int = 100
+    ) -> Page:
+        """
+        Return a page of nodes, using keyset pagination: the nodes following the
+        ones of the previous page are matched with a WHERE clause on the ordering
+        properties, e.g. WHERE n.uid > $after ORDER BY n.uid LIMIT $size. Unlike
+        slicing (SKIP / LIMIT), fetching a page doesn't get slower with its depth
+        when the ordering properties are indexed.
+
+        Example:
+            page = Person.nodes.paginate(order_by=["-created", "uid"], size=50)
+            while page.next_cursor:
+                page = Person.nodes.paginate(
+                    order_by=["-created", "uid"], after=page.next_cursor, size=50
+                )
+
+        :param order_by: property name, or list of property names, to order by.
+            Prepend with minus to order descending. The properties must be set on
+            every node and, together, be unique, e.g. end with a unique property.
+        :param after: next_cursor of the previous page, None for the first page
+        :param size: number of nodes per page
+        :return: Page with the nodes and the cursor of the next page
+        """
+        if size <= 0:
+            raise ValueError("size must be positive")
+        keys = [order_by] if isinstance(order_by, str) else list(order_by)
+        schema = self.source_class.get_schema()
+        fields = []
+        for key in keys:
+            name = key[1:] if key.startswith("-") else key
+            if name not in schema.properties:
+                raise ValueError(
+                    f"No property called '{name}' on {self.source_class.__name__}"
+                )
+            if isinstance(schema.properties[name], ArrayProperty):
+                raise ValueError(f"Cannot paginate by array property '{name}'")
+            fields.append((name, key.startswith("-")))
+
+        node_set = self._clone()
+        node_set.order_by(None)
+        node_set.order_by(
+            *(
+                RawCypher(
+                    f"$n.{schema.db_property_names[name]}{' DESC' if desc else ''}"
+                )
+                for name, desc in fields
+            )
+        )
+        # fetch one more node to know whether there is a next page
+        node_set.limit = size + 1
+        qbuilder = node_set.query_cls(node_set).build_ast()
+        if after is not None:
+            qbuilder.build_keyset_filter(fields, _decode_cursor(after, keys))
+        items = [item for item in qbuilder._execute()]
+
+        next_cursor = None
+        if len(items) > size:
+            items = items[:size]
+            last = items[-1][0] if isinstance(items[-1], list) else items[-1]
+            values = [
+                schema.properties[name].deflate(getattr(last, name), last)
+                for name, _ in fields
+            ]
+            next_cursor = _encode_cursor(keys, values)
+        return Page(items, next_cursor)
+
+    def explain(self) -> QueryPlan:
+        """
+        Return the execution plan of the query of the node set, without running it.
+        The plan tells whether the filters use indexes, e.g. in tests:
+
+            plan = Person.nodes.filter(email="a@b.c").explain()
+            plan.assert_uses_index()
+
+        :return: the plan tree, with the query text in its query attribute
+        """
+        qbuilder = self.query_cls(self).build_ast()
+        return db.explain_query(qbuilder.build_query(), qbuilder._query_params)
+
+    def profile(self) -> QueryPlan:
+        """
+        Run the query of the node set and return its execution plan, with the actual
+        number of rows and database hits of each operator. The results are discarded.
+
+        :return: the plan tree, with the query text in its query attribute
+        """
+        qbuilder = self.query_cls(self).build_ast()
+        return db.explain_query(
+            qbuilder.build_query(), qbuilder._query_params, profile=True
+        )
+
+    def partitions(self, n: int, by: str | None = None) -> list["NodeSet"]:
+        """
+        Split the node set into at most n node sets matching disjoint ranges of the
+        internal node id, or of the numeric property by, which should be indexed.
+        The ranges are computed from the min and max values, so they hold about the
+        same number of nodes when the values are evenly distributed.
+
+        Example:
+            for partition in Person.nodes.filter(active=True).partitions(4):
+                ...
+
+        :param n: number of partitions
+        :param by: property name to partition by, the internal id by default
+        :return: list of node sets, which together match the nodes of this one
+        """
+        if n <= 0:
+            raise ValueError("n must be positive")
+        if getattr(self, "skip", None) or getattr(self, "limit", None):
+            raise ValueError("Cannot partition a sliced node set")
+        db_property = None
+        if by is not None:
+            schema = self.source_class.get_schema()
+            if by not in schema.properties:
+                raise ValueError(
+                    f"No property called '{by}' on {self.source_class.__name__}"
+                )
+            db_property = schema.db_property_names[by]
+
+        qbuilder = self.query_cls(self).build_ast()
+        lowest, highest = qbuilder._partition_bounds(db_property)
+        if lowest is None:
+            # no node has the property
+            bounds = []
+        elif not all(
+            isinstance(value, (int, float)) and not isinstance(value, bool)
+            for value in (lowest, highest)
+        ):
+            raise ValueError(f"Cannot partition by non numeric property '{by}'")
+        elif isinstance(lowest, int) and isinstance(highest, int):
+            span = highest - lowest + 1
+            bounds = [lowest + span * i // n for i in range(1, n)]
+        else:
+            bounds = [lowest + (highest - lowest) * i / n for i in range(1, n)]
+        # narrow ranges can't be split in n
+        bounds = sorted({bound for bound in bounds if bound > lowest})
+
+        # the first and last ranges are open, to match the nodes created meanwhile
+        edges = [None, *bounds, None]
+        partitions = []
+        for lower, upper in zip(edges, edges[1:]):
+            partition = self._clone()
+            partition._partition = (db_property, lower, upper)
+            partitions.append(partition)
+        return partitions
+
+    def parallel_iter(self, workers: int = 4, by: str | None = None) -> Iterator:
+        """
+        Iterate over the nodes, splitting the scan into partitions (see partitions())
+        which are streamed concurrently, each in its own session. That way the scan
+        uses several connections of the pool and several server threads. The results
+        of the partitions are interleaved, so any ordering is lost.
+
+        Partitions are streamed by asyncio tasks, or by threads in the synchronous
+        API. Inside a transaction, which can't be shared, they are streamed one after
+        the other.
+
+        Example:
+            for person in Person.nodes.parallel_iter(workers=8):
+                ...
+
+        :param workers: number of partitions streamed concurrently
+        :param by: property name to partition by, the internal id by default
+        """
+        partitions = self.partitions(workers, by)
+        if db._active_transaction is not None:
+            for partition in partitions:
+                for item in partition:
+                    yield item
+            return
+        for item in Util.merge(partitions):
+            yield item
+
     def _register_relation_to_fetch(
         self, relation_def: Any, alias: str | None = None
     ) -> "Path":
@@ -1779,6 +2313,185 @@ class NodeSet(BaseSet):
         self.relations_to_fetch = relations
         return self
 
+    def values(self, *fields: str) -> Iterator[dict[str, Any]]:
+        """
+        Stream dicts of the given properties of the nodes, without inflating the
+        nodes. Only these properties are returned by the query.
+
+        Example:
+            for row in Person.nodes.values("name", "employer__name"):
+                print(row["name"], row["employer__name"])
+
+        :param fields: property names, prefixed by a traversal path like
+            'employer__' for the properties of related nodes (None when there
+            isn't any). All the properties of the nodes by default.
+        :return: dicts of property names to inflated values
+        """
+        fields = fields or tuple(self.source_class.get_schema().properties)
+        for row in self._values(fields):
+            yield dict(zip(fields, row))
+
+    def values_list(self, *fields: str, flat: bool = False) -> Iterator:
+        """
+        Stream tuples of the given properties of the nodes, see values().
+
+        :param fields: property names, prefixed by a traversal path like
+            'employer__' for the properties of related nodes.
+        :param flat: stream the values of a single field instead of tuples
+        :return: tuples of inflated values
+        """
+        if flat and len(fields) != 1:
+            raise ValueError("values_list() with flat=True expects a single field")
+        fields = fields or tuple(self.source_class.get_schema().properties)
+        for row in self._values(fields):
+            yield row[0] if flat else row
+
+    def to_dataframe(
+        self, columns: list[str] | None = None, chunk_size: int | None = None
+    ) -> Any:
+        """
+        Export properties of the nodes to a pandas DataFrame, see values(). The
+        values are streamed into one list per column, without creating nodes or
+        rows, and each column gets the dtype matching its property: int64,
+        float64, bool or datetime64[ns, UTC] (nullable dtypes if values are
+        missing). Requires pandas to be installed.
+
+        :param columns: property names, prefixed by a traversal path like
+            'employer__' for the properties of related nodes. All the properties
+            of the nodes by default.
+        :param chunk_size: if set, an iterator over DataFrames of at most
+            chunk_size rows is returned instead of a single DataFrame
+        :return: DataFrame
+        """
+        if chunk_size is not None and chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        if chunk_size is None:
+            return self._to_dataframe(columns)
+        return self._dataframes(columns, chunk_size)
+
+    def _to_dataframe(self, columns: list[str] | None) -> Any:
+        # a single DataFrame is built once all the records are read
+        return [df for df in self._dataframes(columns, None, empty=True)][0]
+
+    def _dataframes(
+        self, columns: list[str] | None, chunk_size: int | None, empty: bool = False
+    ) -> Iterator:
+        from neomodel.integration.pandas import columns_to_dataframe
+
+        for fields, buffers, properties in self._columns(columns, chunk_size, empty):
+            yield columns_to_dataframe(fields, buffers, properties)
+
+    def to_arrow_batches(
+        self, columns: list[str] | None = None, batch_size: int | None = None
+    ) -> Iterator:
+        """
+        Stream properties of the nodes as Apache Arrow record batches, see values().
+        The values are streamed into one list per column, without creating nodes
+        or rows, and the schema of the batches is derived from the properties.
+        Requires pyarrow to be installed.
+
+        :param columns: property names, prefixed by a traversal path like
+            'employer__' for the properties of related nodes. All the properties
+            of the nodes by default.
+        :param batch_size: maximum number of rows per batch, the fetch_size
+            configuration option by default
+        :return: pyarrow.RecordBatch iterator
+        """
+        from neomodel.integration.arrow import RecordBatchBuilder, schema_for
+
+        if batch_size is None:
+            batch_size = get_config().fetch_size
+        builder = None
+        for fields, buffers, properties in self._columns(
+            columns, batch_size if batch_size > 0 else None
+        ):
+            if builder is None:
+                builder = RecordBatchBuilder(schema_for(fields, properties), properties)
+            for batch in builder.add(buffers):
+                yield batch
+        if builder is not None:
+            for batch in builder.finish():
+                yield batch
+
+    def _columns(
+        self, columns: list[str] | None, chunk_size: int | None, empty: bool = False
+    ) -> Iterator[tuple[tuple[str, ...], list[list], list[Property]]]:
+        fields = tuple(columns or self.source_class.get_schema().properties)
+        qbuilder = self.query_cls(self).build_ast()
+        properties = qbuilder.build_values(fields)
+        query = qbuilder.build_query()
+        for buffers, _ in db._stream_columns(
+            query,
+            qbuilder._query_params,
+            chunk_size,
+            access_mode=qbuilder._read_access_mode(),
+        ):
+            empty = False
+            yield fields, buffers, properties
+        if empty:
+            yield fields, [[] for _ in fields], properties
+
+    def _values(self, fields: tuple[str, ...]) -> Iterator[tuple]:
+        qbuilder = self.query_cls(self).build_ast()
+        inflaters = [property.inflate for property in qbuilder.build_values(fields)]
+        query = qbuilder.build_query()
+        records = db._stream_query(
+            query, qbuilder._query_params, access_mode=qbuilder._read_access_mode()
+        )
+        with closing(records):
+            for values, _ in records:
+                yield tuple(
+                    value if value is None else inflate(value)
+                    for inflate, value in zip(inflaters, values)
+                )
+
+    def prefetch(self, *paths: str) -> "NodeSet":
+        """
+        Fetch the nodes related to the results through each relationship path, with
+        one additional query per relationship, so that the relationship managers of
+        the results return them without querying the database.
+
+        Example:
+            for person in Person.nodes.prefetch("friends", "employer__address"):
+                friends = person.friends.all()
+                employer = person.employer.single()
+
+        :param paths: relationship names, with '__' to follow the relationships of
+            the related nodes
+        :return: self
+        """
+        for path in paths:
+            source_class = self.source_class
+            tree = self._prefetch
+            for name in path.split("__"):
+                relationship = source_class.get_schema().relationships.get(name)
+                if relationship is None:
+                    raise ValueError(
+                        f"No relationship called '{name}' on {source_class.__name__}"
+                    )
+                relationship.lookup_node_class()
+                source_class = relationship.definition["node_class"]
+                tree = tree.setdefault(name, {})
+        return self
+
+    def access_mode(self, access_mode: str) -> "NodeSet":
+        """
+        Run the queries of the node set outside transactions in sessions of this
+        access mode, whatever config.route_reads is: READ to route them to the
+        followers and read replicas of a cluster, WRITE to read from its leader,
+        e.g. right after a write made without bookmarks.
+
+        :param access_mode: READ or WRITE
+        :return: self
+        """
+        if access_mode not in (ACCESS_MODE_READ, ACCESS_MODE_WRITE):
+            raise ValueError(
+                f"Access mode must be {ACCESS_MODE_READ} or {ACCESS_MODE_WRITE}, "
+                f"got {access_mode!r}"
+            )
+        self._access_mode = access_mode
+        return self
+
     def annotate(self, *vars: tuple, **aliased_vars: tuple) -> "NodeSet":
         """Annotate node set results with extra variables."""
 
@@ -1937,6 +2650,24 @@ class NodeSet(BaseSet):
         )
         return self
 
+    def prepare(self) -> "PreparedQuery":
+        """
+        Compile the query of this node set once, to run it many times with different values.
+
+        Values that change between executions are declared with :class:`~neomodel.util.Param`
+        placeholders, and bound when executing the prepared query::
+
+            by_name = Person.nodes.filter(name=Param("name")).order_by("age").prepare()
+            people = by_name.all(name="Jim")
+            for person in by_name.bind(name="Bob"):
+                ...
+
+        The node set must not be modified afterwards.
+
+        :return: a prepared query
+        """
+        return PreparedQuery(self)
+
 
 class Traversal(BaseSet):
     """
@@ -2013,3 +2744,122 @@ class Traversal(BaseSet):
             if output:
                 self.filters.append(output)
         return self
+
+
+class PreparedQuery:
+    """
+    A node set query compiled once, see :meth:`NodeSet.prepare`.
+
+    The Cypher text is built on first use for each variant of the query (all, first, get,
+    lazy or not) and cached. Executing it only binds the parameters.
+    """
+
+    def __init__(self, node_set: NodeSet, values: dict[str, Any] | None = None):
+        self.node_set = node_set
+        self.values = values or {}
+        self._compiled: dict[tuple[bool, int | None], tuple[str, dict[str, Any]]] = {}
+
+    def bind(self, **values: Any) -> "PreparedQuery":
+        """
+        Return a copy of this prepared query with the given parameter values bound.
+        Iterating over it streams the results.
+        """
+        bound = PreparedQuery(self.node_set, {**self.values, **values})
+        bound._compiled = self._compiled
+        return bound
+
+    def _compile(self, lazy: bool, limit: int | None) -> tuple[str, dict[str, Any]]:
+        variant = (lazy, limit)
+        if variant not in self._compiled:
+            # built from a copy, as the query may be shared between threads or tasks
+            node_set = self.node_set._clone()
+            if limit:
+                node_set.limit = limit
+            qbuilder = node_set.query_cls(node_set)
+            qbuilder._prepared = True
+            qbuilder.build_ast()
+            if lazy:
+                qbuilder._return_ids()
+            self._compiled[variant] = (qbuilder.build_query(), qbuilder._query_params)
+        return self._compiled[variant]
+
+    def _bind_params(
+        self, params: dict[str, Any], values: dict[str, Any]
+    ) -> dict[str, Any]:
+        values = {**self.values, **values}
+        bound = {}
+        for place_holder, value in params.items():
+            try:
+                if isinstance(value, _ParamBinding):
+                    value = value.bind(values)
+                elif isinstance(value, Param):
+                    value = values[value.name]
+            except KeyError as e:
+                raise ValueError(f"Missing value for parameter {e}") from e
+            bound[place_holder] = value
+        return bound
+
+    def _execute(
+        self, values: dict[str, Any], lazy: bool = False, limit: int | None = None
+    ) -> Any:
+        query, params = self._compile(lazy, limit)
+        qbuilder = self.node_set.query_cls(self.node_set)
+        results = qbuilder._execute_query(query, self._bind_params(params, values))
+        with closing(results):
+            for item in results:
+                yield item
+
+    def all(self, lazy: bool = False, **values: Any) -> list:
+        """
+        Return all nodes matching the prepared query.
+
+        :param lazy: False by default, specify True to get nodes with id only without the parameters.
+        :param values: the values of the Param placeholders
+        :return: list of nodes
+        :rtype: list
+        """
+        return [node for node in self._execute(values, lazy)]
+
+    def __iter__(self) -> Iterator:
+        results = self._execute({})
+        with closing(results):
+            for item in results:
+                yield item
+
+    def get(self, lazy: bool = False, **values: Any) -> Any:
+        """
+        Retrieve the single node matching the prepared query.
+
+        :param values: the values of the Param placeholders
+        :return: node
+        """
+        result = [node for node in self._execute(values, lazy, limit=2)]
+        if len(result) > 1:
+            raise MultipleNodesReturned(repr(values))
+        if not result:
+            raise self.node_set.source_class.DoesNotExist(repr(values))
+        return result[0]
+
+    def first(self, **values: Any) -> Any:
+        """
+        Retrieve the first node matching the prepared query.
+
+        :param values: the values of the Param placeholders
+        :return: node
+        """
+        result = [node for node in self._execute(values, limit=1)]
+        if result:
+            return result[0]
+        raise self.node_set.source_class.DoesNotExist(repr(values))
+
+    def first_or_none(self, **values: Any) -> Any:
+        """
+        Retrieve the first node matching the prepared query or return none.
+
+        :param values: the values of the Param placeholders
+        :return: node or none
+        """
+        try:
+            return self.first(**values)
+        except self.node_set.source_class.DoesNotExist:
+            return None
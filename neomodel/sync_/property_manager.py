@@ -1,17 +1,14 @@
-import types
 from typing import Any
 
 from neo4j.graph import Node, Relationship
 
-from neomodel.exceptions import RequiredProperty
 from neomodel.properties import AliasProperty, Property
-
-
-def display_for(key: str) -> Any:
-    def display_choice(self: Any) -> Any:
-        return getattr(self.__class__, key).choices[getattr(self, key)]
-
-    return display_choice
+from neomodel.schema import (
+    ModelSchema,
+    PropertySlot,
+    compile_deflater,
+    compile_inflater,
+)
 
 
 class PropertyManager:
@@ -19,11 +16,11 @@ class PropertyManager:
     Common methods for handling properties on node and relationship objects.
     """
 
+    __schema__: ModelSchema
+
     def __init__(self, **kwargs: dict[str, Any]) -> None:
-        properties = getattr(self, "__all_properties__", None)
-        if properties is None:
-            properties = self.defined_properties(rels=False, aliases=False).items()
-        for name, property in properties:
+        schema = self.get_schema()
+        for name, property in schema.properties.items():
             if kwargs.get(name) is None:
                 if getattr(property, "has_default", False):
                     setattr(self, name, property.default_value())
@@ -32,22 +29,10 @@ class PropertyManager:
             else:
                 setattr(self, name, kwargs[name])
 
-            if getattr(property, "choices", None):
-                setattr(
-                    self,
-                    f"get_{name}_display",
-                    types.MethodType(display_for(name), self),
-                )
-
             if name in kwargs:
                 del kwargs[name]
 
-        aliases = getattr(self, "__all_aliases__", None)
-        if aliases is None:
-            aliases = self.defined_properties(
-                aliases=True, rels=False, properties=False
-            ).items()
-        for name, property in aliases:
+        for name, property in schema.aliases.items():
             if name in kwargs:
                 setattr(self, name, kwargs[name])
                 del kwargs[name]
@@ -60,9 +45,17 @@ class PropertyManager:
     def __properties__(self) -> dict[str, Any]:
         from neomodel.sync_.relationship_manager import RelationshipManager
 
+        values = {}
+        # compact classes keep their property values in slots
+        for name in getattr(self, "__compact_fields__", ()):
+            try:
+                values[name] = getattr(self, name)
+            except AttributeError:
+                pass
+        values.update(vars(self))
         return dict(
             (name, value)
-            for name, value in vars(self).items()
+            for name, value in values.items()
             if not name.startswith("_")
             and not callable(value)
             and not isinstance(
@@ -87,18 +80,11 @@ class PropertyManager:
 
         Ignores any properties that are not defined as python attributes in the class definition.
         """
-        deflated = {}
-        for name, property in cls.defined_properties(aliases=False, rels=False).items():
-            db_property = property.get_db_property_name(name)
-            if properties.get(name) is not None:
-                deflated[db_property] = property.deflate(properties[name], obj)
-            elif property.has_default:
-                deflated[db_property] = property.deflate(property.default_value(), obj)
-            elif property.required:
-                raise RequiredProperty(name, cls)
-            elif not skip_empty:
-                deflated[db_property] = None
-        return deflated
+        deflater = cls.__dict__.get("__deflater__")
+        if deflater is None:
+            deflater = compile_deflater(cls, cls.get_schema())
+            setattr(cls, "__deflater__", deflater)
+        return deflater(properties, obj, skip_empty)
 
     @classmethod
     def inflate(cls: Any, graph_entity: Node | Relationship) -> Any:
@@ -107,39 +93,53 @@ class PropertyManager:
         of cls.
         Includes mapping from database property name (see Property.db_property) -> python class attribute name.
         Ignores any properties that are not defined as python attributes in the class definition.
+
+        The work is done by a function generated once per class, see neomodel.schema.compile_inflater.
         """
-        inflated = {}
-        for name, property in cls.defined_properties(aliases=False, rels=False).items():
-            db_property = property.get_db_property_name(name)
-            if db_property in graph_entity:
-                inflated[name] = property.inflate(
-                    graph_entity[db_property], graph_entity
-                )
-            elif property.has_default:
-                inflated[name] = property.default_value()
-            else:
-                inflated[name] = None
-        return cls(**inflated)
+        inflater = cls.__dict__.get("__inflater__")
+        if inflater is None:
+            inflater = compile_inflater(cls, cls.get_schema())
+            setattr(cls, "__inflater__", inflater)
+        return inflater(graph_entity)
 
     @classmethod
-    def defined_properties(
-        cls: Any, aliases: bool = True, properties: bool = True, rels: bool = True
-    ) -> dict[str, Any]:
+    def get_schema(cls) -> ModelSchema:
+        """
+        Return the schema of this class. It is built once, either by NodeMeta
+        or on first use, and cached on the class itself.
+        """
+        schema = cls.__dict__.get("__schema__")
+        if schema is None:
+            schema = cls._build_schema()
+            setattr(cls, "__schema__", schema)
+        return schema
+
+    @classmethod
+    def _build_schema(
+        cls: Any,
+        labels: tuple[str, ...] = (),
+        optional_labels: tuple[str, ...] = (),
+    ) -> ModelSchema:
         from neomodel.sync_.relationship_manager import RelationshipDefinition
 
-        props = {}
+        members: dict[str, Any] = {}
         for baseclass in reversed(cls.__mro__):
-            props.update(
-                dict(
-                    (name, property)
-                    for name, property in vars(baseclass).items()
-                    if (aliases and isinstance(property, AliasProperty))
-                    or (
-                        properties
-                        and isinstance(property, Property)
-                        and not isinstance(property, AliasProperty)
-                    )
-                    or (rels and isinstance(property, RelationshipDefinition))
-                )
+            members.update(
+                (name, member.property if isinstance(member, PropertySlot) else member)
+                for name, member in vars(baseclass).items()
+                if isinstance(member, (Property, PropertySlot, RelationshipDefinition))
             )
-        return props
+        return ModelSchema.build(
+            members,
+            lambda member: isinstance(member, RelationshipDefinition),
+            labels=labels,
+            optional_labels=optional_labels,
+        )
+
+    @classmethod
+    def defined_properties(
+        cls: Any, aliases: bool = True, properties: bool = True, rels: bool = True
+    ) -> dict[str, Any]:
+        return cls.get_schema().defined(
+            aliases=aliases, properties=properties, rels=rels
+        )
@@ -4,6 +4,11 @@ from neo4j.graph import Relationship
 
 from neomodel.hooks import hooks
 from neomodel.properties import Property
+from neomodel.schema import (
+    compact_namespace,
+    install_display_methods,
+    install_property_slots,
+)
 from neomodel.sync_.database import db
 from neomodel.sync_.property_manager import PropertyManager
 
@@ -14,7 +19,11 @@ class RelationshipMeta(type):
     def __new__(
         mcs: type, name: str, bases: tuple[type, ...], dct: dict[str, Any]
     ) -> Any:
-        inst: RelationshipMeta = type.__new__(mcs, name, bases, dct)
+        class_dct = dict(dct)
+        slotted = compact_namespace(bases, class_dct)
+        inst: RelationshipMeta = type.__new__(mcs, name, bases, class_dct)
+        install_property_slots(inst, slotted)
+        install_display_methods(inst)
         for key, value in dct.items():
             if issubclass(value.__class__, Property):
                 if key == "source" or key == "target":
@@ -132,6 +141,7 @@ class StructuredRel(StructuredRelBase):
             """,
             {"start_node_element_id": db.parse_element_id(self._start_node_element_id)},
             resolve_objects=True,
+            access_mode=db._read_access_mode(),
         )
         if results is None or results[0] is None or results[0][0] is None:
             raise ValueError(
@@ -153,6 +163,7 @@ class StructuredRel(StructuredRelBase):
             """,
             {"end_node_element_id": db.parse_element_id(self._end_node_element_id)},
             resolve_objects=True,
+            access_mode=db._read_access_mode(),
         )
         if results is None or results[0] is None or results[0][0] is None:
             raise ValueError(
@@ -2,9 +2,14 @@ import functools
 import inspect
 import sys
 from importlib import import_module
-from typing import TYPE_CHECKING, Any, Callable, Iterator, Optional
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Optional
 
-from neomodel.exceptions import NotConnected, RelationshipClassRedefined
+from neomodel.config import get_config
+from neomodel.exceptions import (
+    AttemptedCardinalityViolation,
+    NotConnected,
+    RelationshipClassRedefined,
+)
 from neomodel.sync_.database import db
 from neomodel.sync_.match import (
     NodeSet,
@@ -44,6 +49,14 @@ def is_direct_subclass(obj: Any, classinfo: Any) -> bool:
     return False
 
 
+# takes a write lock on the nodes, held until the end of the transaction, so that
+# concurrent statements counting their relationships run one after the other
+def _lock_nodes(*idents: str) -> str:
+    props = [f"{ident}.__neomodel_lock" for ident in idents]
+    assignments = ", ".join(f"{prop} = true" for prop in props)
+    return f"SET {assignments} REMOVE {', '.join(props)} "
+
+
 class RelationshipManager(object):
     """
     Base class for all relationships managed through neomodel.
@@ -56,6 +69,10 @@ class RelationshipManager(object):
     name: str
     definition: dict
     description: str = "relationship"
+    # maximum number of related nodes, enforced by connect() and connect_many()
+    max_connections: int | None = None
+    # related nodes fetched by NodeSet.prefetch(), until the relationship is changed
+    _prefetched: list | None = None
 
     def __init__(self, source: Any, key: str, definition: dict):
         self.source = source
@@ -106,26 +123,25 @@ class RelationshipManager(object):
         :type: dict
         :return:
         """
+        self._prefetched = None
         self._check_node(node)
         self.check_cardinality(node)
 
         # Check for cardinality on the remote end.
-        for rel_name, rel_def in node.defined_properties(
-            rels=True, aliases=False, properties=False
-        ).items():
-            # In order to find the inverse relationship, we need to check
-            # that the relationship type is the same, the direction is
-            # opposite, and the node class is the same as the source.
-            if (
-                rel_def.definition["relation_type"] == self.definition["relation_type"]
-                and rel_def.definition["direction"] != self.definition["direction"]
-                and rel_def.definition["node_class"] == self.source_class
-            ):
-                # If we have found the inverse relationship, we need to check
-                # its cardinality.
-                inverse_rel = getattr(node, rel_name)
-                inverse_rel.check_cardinality(self.source)
-                break
+        # In order to find the inverse relationship, we need to check
+        # that the relationship type is the same, the direction is
+        # opposite, and the node class is the same as the source.
+        inverse = node.get_schema().find_inverse(
+            self.definition["relation_type"],
+            self.definition["direction"],
+            self.source_class,
+        )
+        inverse_rel = None
+        if inverse is not None:
+            # If we have found the inverse relationship, we need to check
+            # its cardinality.
+            inverse_rel = getattr(node, inverse[0])
+            inverse_rel.check_cardinality(self.source)
 
         if not self.definition["model"] and properties:
             raise NotImplementedError(
@@ -159,19 +175,55 @@ class RelationshipManager(object):
             relation_properties=rel_prop,
             **self.definition,
         )
-        q = (
-            f"MATCH (them), (us) WHERE {db.get_id_method()}(them)=$them and {db.get_id_method()}(us)=$self "
-            "MERGE" + new_rel
-        )
+        match = f"MATCH (them), (us) WHERE {db.get_id_method()}(them)=$them and {db.get_id_method()}(us)=$self "
+        q = match + "MERGE" + new_rel
 
         params["them"] = db.parse_element_id(node.element_id)
 
-        if not rel_model:
+        # Limited cardinalities are checked by the statement creating the
+        # relationship, which only merges it when no limit would be exceeded.
+        # It locks both nodes before counting their relationships, so that
+        # concurrent connects can't both pass the check.
+        source_count, inverse_count = self._connection_counts()
+        limits = []
+        if self.max_connections is not None:
+            limits.append((self, f"{source_count} >= {self.max_connections}"))
+        if inverse_rel is not None and inverse_rel.max_connections is not None:
+            limits.append(
+                (inverse_rel, f"{inverse_count} >= {inverse_rel.max_connections}")
+            )
+
+        if limits:
+            q = (
+                match
+                + _lock_nodes("us", "them")
+                + f"WITH us, them, [{', '.join(check for _, check in limits)}] AS violations "
+                "CALL { WITH us, them, violations "
+                "WITH us, them WHERE $soft OR NOT true IN violations "
+                f"MERGE {new_rel} RETURN collect(r) AS rels }} "
+                "RETURN violations, rels"
+            )
+            params["soft"] = get_config().soft_cardinality_check
+            results, _ = self.source.cypher(q, params)
+            if not results:
+                return None
+            violations, rels = results[0]
+            for (manager, _), violation in zip(limits, violations):
+                if violation:
+                    manager._cardinality_violation(
+                        f"Node already has {manager}",
+                        "Use reconnect() to replace the existing relationship.",
+                    )
+            if not rel_model:
+                return None
+            rel_ = rels[0]
+        elif not rel_model:
             self.source.cypher(q, params)
             return None
+        else:
+            results = self.source.cypher(q + " RETURN r", params)
+            rel_ = results[0][0][0]
 
-        results = self.source.cypher(q + " RETURN r", params)
-        rel_ = results[0][0][0]
         rel_instance = self._set_start_end_cls(rel_model.inflate(rel_), node)
 
         if hasattr(rel_instance, "post_save"):
@@ -179,6 +231,204 @@ class RelationshipManager(object):
 
         return rel_instance
 
+    def _connection_counts(self) -> tuple[str, str]:
+        """
+        Cypher expressions counting the relationships of us to nodes of the target
+        class, and of them to nodes of the source class.
+        """
+        relation = {
+            "relation_type": self.definition["relation_type"],
+            "direction": self.definition["direction"],
+        }
+        source_labels = self.source_class.get_schema().label_string
+        target_labels = self.definition["node_class"].get_schema().label_string
+        source_count = _rel_helper(lhs="us", rhs=f"(:{target_labels})", **relation)
+        inverse_count = _rel_helper(lhs=f"(:{source_labels})", rhs="them", **relation)
+        return f"size([{source_count} | 1])", f"size([{inverse_count} | 1])"
+
+    def _cardinality_violation(self, message: str, hint: str | None = None) -> None:
+        """
+        Raise AttemptedCardinalityViolation, or only report it when the
+        soft_cardinality_check option is enabled.
+        """
+        if get_config().soft_cardinality_check:
+            print(
+                f"Cardinality violation detected : {message}, should not connect more. Soft check is enabled so the relationship will be created."
+            )
+        elif hint:
+            raise AttemptedCardinalityViolation(f"{message}. {hint}")
+        else:
+            raise AttemptedCardinalityViolation(message)
+
+    @check_source
+    def connect_many(
+        self,
+        nodes: Iterable["StructuredNode"],
+        properties: dict[str, Any] | list[dict[str, Any]] | None = None,
+        batch_size: int | None = None,
+    ) -> list[StructuredRel] | None:
+        """
+        Connect many nodes, with a single UNWIND ... MERGE statement instead of the
+        queries connect() runs for each node.
+
+        The relationship properties are validated and deflated client side. The same
+        statement checks the cardinality of the relationship and of its inverse on the
+        connected nodes, after locking them: if it would be violated, nothing is
+        connected and AttemptedCardinalityViolation is raised (soft_cardinality_check
+        only reports it).
+        A statement is sent per batch_size nodes (see the batch_size configuration
+        option) and per set of non null relationship properties, all in the active
+        transaction, or in a new one.
+
+        :param nodes: the nodes to connect
+        :param properties: for the new relationships, either a dict for all of them or
+            a list of dicts, one per node
+        :param batch_size: Optional, overrides the batch_size configuration option
+        :return: the relationships, in the order of nodes, if the relationship has a model
+        """
+        self._prefetched = None
+        nodes = list(nodes)
+        if isinstance(properties, list):
+            if len(properties) != len(nodes):
+                raise ValueError("Expected one dict of properties per node")
+            rows_properties = properties
+        else:
+            rows_properties = [properties] * len(nodes)
+        rel_model = self.definition["model"]
+        if not rel_model and any(rows_properties):
+            raise NotImplementedError(
+                "Relationship properties without using a relationship model "
+                "is no longer supported."
+            )
+        batch_size = int(batch_size or get_config().batch_size)
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+
+        if self.max_connections is not None and len(nodes) > self.max_connections:
+            self._cardinality_violation(
+                f"Connecting {len(nodes)} nodes to a {self.description}"
+            )
+
+        # group the rows by the set of relationship properties to merge on
+        groups: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+        inverse_limits: dict[type, int | None] = {}
+        for index, (node, props) in enumerate(zip(nodes, rows_properties)):
+            self._check_node(node)
+            rel_props = {}
+            if rel_model:
+                tmp = rel_model(**props) if props else rel_model()
+                rel_props = {
+                    key: value
+                    for key, value in rel_model.deflate(tmp.__properties__).items()
+                    if value is not None
+                }
+                if hasattr(tmp, "pre_save"):
+                    tmp.pre_save()
+            node_class = node.__class__
+            if node_class not in inverse_limits:
+                inverse = node_class.get_schema().find_inverse(
+                    self.definition["relation_type"],
+                    self.definition["direction"],
+                    self.source_class,
+                )
+                inverse_limits[node_class] = (
+                    inverse[1].manager.max_connections if inverse else None
+                )
+            groups.setdefault(tuple(rel_props), []).append(
+                {
+                    "index": index,
+                    "them": db.parse_element_id(node.element_id),
+                    "limit": inverse_limits[node_class],
+                    "props": rel_props,
+                }
+            )
+
+        if db._active_transaction:
+            rels = self._merge_groups(groups, batch_size)
+        else:
+            # a violation in any statement rolls back the previous ones
+            with db.transaction:
+                rels = self._merge_groups(groups, batch_size)
+
+        if not rel_model:
+            return None
+        rel_instances = []
+        for index in sorted(rels):
+            rel_instance = self._set_start_end_cls(
+                rel_model.inflate(rels[index]), nodes[index]
+            )
+            if hasattr(rel_instance, "post_save"):
+                rel_instance.post_save()
+            rel_instances.append(rel_instance)
+        return rel_instances
+
+    def _merge_groups(
+        self, groups: dict[tuple[str, ...], list[dict[str, Any]]], batch_size: int
+    ) -> dict[int, Any]:
+        """
+        Run the statements of connect_many(), returning the new relationships by
+        index of the connected node.
+        """
+        id_method = db.get_id_method()
+        source_count, inverse_count = self._connection_counts()
+        if self.max_connections is None:
+            source_count = "0"
+
+        rels: dict[int, Any] = {}
+        for keys, rows in groups.items():
+            new_rel = _rel_merge_helper(
+                lhs="us",
+                rhs="them",
+                ident="r",
+                relation_properties={key: f"row.props.{key}" for key in keys},
+                **self.definition,
+            )
+            # lock the nodes before counting their relationships, see connect()
+            query = (
+                f"MATCH (us) WHERE {id_method}(us)=$self "
+                + _lock_nodes("us")
+                + "WITH us UNWIND $rows AS row "
+                f"MATCH (them) WHERE {id_method}(them)=row.them "
+                + _lock_nodes("them")
+                + "WITH us, them, row, CASE WHEN row.limit IS NULL THEN false "
+                f"ELSE {inverse_count} >= row.limit END AS violation "
+                "WITH us, collect({index: row.index, them: them, props: row.props, "
+                "violation: violation}) AS rows "
+                f"WITH us, rows, {source_count} + size(rows) AS source_count, "
+                f"[row IN rows WHERE row.violation | {id_method}(row.them)] AS violations "
+                "CALL { WITH us, rows, source_count, violations "
+                "WITH us, rows WHERE $soft OR (size(violations) = 0 "
+                "AND ($max IS NULL OR source_count <= $max)) "
+                "UNWIND rows AS row WITH us, row, row.them AS them "
+                f"MERGE {new_rel} RETURN collect([row.index, r]) AS rels }} "
+                "RETURN source_count, violations, rels"
+            )
+            for start in range(0, len(rows), batch_size):
+                results, _ = self.source.cypher(
+                    query,
+                    {
+                        "rows": rows[start : start + batch_size],
+                        "max": self.max_connections,
+                        "soft": get_config().soft_cardinality_check,
+                    },
+                )
+                if not results:
+                    continue
+                count, violations, created = results[0]
+                if self.max_connections is not None and count > self.max_connections:
+                    self._cardinality_violation(
+                        f"Node already has {self}",
+                        "Use reconnect() to replace the existing relationship.",
+                    )
+                if violations:
+                    self._cardinality_violation(
+                        f"Nodes {', '.join(map(str, violations))} already have the "
+                        f"maximum number of {self.definition['relation_type']} "
+                        f"relationships to a {self.source_class.__name__}"
+                    )
+                rels.update((index, rel) for index, rel in created)
+        return rels
+
     @check_source
     def replace(
         self, node: "StructuredNode", properties: dict[str, Any] | None = None
@@ -209,7 +459,11 @@ class RelationshipManager(object):
             + my_rel
             + f" WHERE {db.get_id_method()}(them)=$them and {db.get_id_method()}(us)=$self RETURN r LIMIT 1"
         )
-        results = self.source.cypher(q, {"them": db.parse_element_id(node.element_id)})
+        results = self.source.cypher(
+            q,
+            {"them": db.parse_element_id(node.element_id)},
+            access_mode=db._read_access_mode(),
+        )
         rels = results[0]
         if not rels:
             return None
@@ -230,7 +484,11 @@ class RelationshipManager(object):
 
         my_rel = _rel_helper(lhs="us", rhs="them", ident="r", **self.definition)
         q = f"MATCH {my_rel} WHERE {db.get_id_method()}(them)=$them and {db.get_id_method()}(us)=$self RETURN r "
-        results = self.source.cypher(q, {"them": db.parse_element_id(node.element_id)})
+        results = self.source.cypher(
+            q,
+            {"them": db.parse_element_id(node.element_id)},
+            access_mode=db._read_access_mode(),
+        )
         rels = results[0]
         if not rels:
             return []
@@ -262,6 +520,7 @@ class RelationshipManager(object):
         :param new_node:
         :return: None
         """
+        self._prefetched = None
 
         self._check_node(old_node)
         self._check_node(new_node)
@@ -308,6 +567,7 @@ class RelationshipManager(object):
         :param node:
         :return:
         """
+        self._prefetched = None
         rel = _rel_helper(lhs="a", rhs="b", ident="r", **self.definition)
         q = f"""
                 MATCH (a), (b) WHERE {db.get_id_method()}(a)=$self and {db.get_id_method()}(b)=$them
@@ -322,6 +582,7 @@ class RelationshipManager(object):
 
         :return:
         """
+        self._prefetched = None
         rhs = "b:" + self.definition["node_class"].__label__
         rel = _rel_helper(lhs="a", rhs=rhs, ident="r", **self.definition)
         q = f"MATCH (a) WHERE {db.get_id_method()}(a)=$self MATCH " + rel + " DELETE r"
@@ -414,24 +675,41 @@ class RelationshipManager(object):
 
         :return: list
         """
+        if self._prefetched is not None:
+            return list(self._prefetched)
         return self._new_traversal().all()
 
     def __iter__(self) -> Iterator:
-        return self._new_traversal().__iter__()
+        if self._prefetched is not None:
+            for node in self._prefetched:
+                yield node
+            return
+        for node in self._new_traversal():
+            yield node
 
     def __len__(self) -> int:
+        if self._prefetched is not None:
+            return len(self._prefetched)
         return self._new_traversal().__len__()
 
     def __bool__(self) -> bool:
+        if self._prefetched is not None:
+            return bool(self._prefetched)
         return self._new_traversal().__bool__()
 
     def __nonzero__(self) -> bool:
-        return self._new_traversal().__nonzero__()
+        return self.__bool__()
 
     def __contains__(self, obj: Any) -> bool:
+        if self._prefetched is not None and isinstance(obj, StructuredNode):
+            if obj.element_id is None:
+                raise ValueError("Unsaved node: " + repr(obj))
+            return any(node.element_id == obj.element_id for node in self._prefetched)
         return self._new_traversal().__contains__(obj)
 
     def __getitem__(self, key: int | slice) -> Any:
+        if self._prefetched is not None and isinstance(key, int):
+            return self._prefetched[key]
         return self._new_traversal().__getitem__(key)
 
 
@@ -504,6 +782,9 @@ class RelationshipDefinition:
             raise ValueError("model must be a StructuredRel")
 
     def lookup_node_class(self) -> None:
+        if "node_class" in self.definition:
+            # already resolved
+            return
         if not isinstance(self._raw_class, str):
             self.definition["node_class"] = self._raw_class
         else:
@@ -544,6 +825,29 @@ class RelationshipDefinition:
         self.lookup_node_class()
         return self.manager(source, name, self.definition)
 
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._attribute_name = name
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        """
+        Build the relationship manager of a node on first access and cache it on
+        the instance, so that nodes only pay for the relationships they use.
+        Accessed on the class, the definition itself is returned.
+        """
+        if instance is None:
+            return self
+        name = getattr(self, "_attribute_name", None)
+        if name is None:
+            # assigned after class creation, find it in the schema
+            name = next(
+                key
+                for key, rel in type(instance).get_schema().relationships.items()
+                if rel is self
+            )
+        manager = self.build_manager(instance, name)
+        instance.__dict__[name] = manager
+        return manager
+
 
 def validate_relationship(relationship: Any, rel_props: Any) -> None:
     """
@@ -0,0 +1,199 @@
+"""
+Fake driver running neomodel without a database, for tests and benchmarks.
+
+FakeDriver.record() wraps a real driver, and records each query run through it
+with its records, or its error, into a cassette. FakeDriver.replay() returns
+the records of the cassette instead of running the queries, optionally after a
+simulated network latency. Both keep the list of the queries run, e.g. to assert
+how many round trips an operation takes:
+
+    driver = FakeDriver.record(GraphDatabase.driver(url, auth=auth))
+    db.set_connection(driver=driver)
+    run_scenario()
+    driver.cassette.save("test/cassettes/scenario.json")
+
+    driver = FakeDriver.replay("test/cassettes/scenario.json", latency=0.002)
+    db.set_connection(driver=driver)
+    run_scenario()
+    assert len(driver.queries) == 12
+"""
+
+from typing import Any, Iterator
+
+from neo4j import Driver, Record, Session, Transaction
+from neo4j.api import Bookmarks
+from neo4j.exceptions import Neo4jError
+
+from neomodel._async_compat.util import Util
+from neomodel._cassette import Cassette
+
+
+class FakeResult:
+    """Result of a query, whose records have all been fetched."""
+
+    def __init__(self, keys: list[str], records: list[Record], summary: Any) -> None:
+        self._keys = tuple(keys)
+        self._records = records
+        self._summary = summary
+
+    def keys(self) -> tuple[str, ...]:
+        return self._keys
+
+    def __iter__(self) -> Iterator[Record]:
+        for record in self._records:
+            yield record
+
+    def consume(self) -> Any:
+        return self._summary
+
+
+class FakeTransaction:
+    def __init__(self, driver: "FakeDriver", transaction: Transaction | None) -> None:
+        self._driver = driver
+        self._transaction = transaction
+
+    def run(
+        self, query: str, parameters: dict[str, Any] | None = None, **kwargs: Any
+    ) -> FakeResult:
+        return self._driver._run(self._transaction, query, parameters)
+
+    def commit(self) -> None:
+        if self._transaction is not None:
+            self._transaction.commit()
+        else:
+            self._driver._round_trip()
+
+    def rollback(self) -> None:
+        if self._transaction is not None:
+            self._transaction.rollback()
+        else:
+            self._driver._round_trip()
+
+    def close(self) -> None:
+        if self._transaction is not None:
+            self._transaction.close()
+
+
+class FakeSession:
+    def __init__(self, driver: "FakeDriver", session: Session | None) -> None:
+        self._driver = driver
+        self._session = session
+
+    def __enter__(self) -> "FakeSession":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def run(
+        self, query: str, parameters: dict[str, Any] | None = None, **kwargs: Any
+    ) -> FakeResult:
+        return self._driver._run(self._session, query, parameters)
+
+    def begin_transaction(self, **kwargs: Any) -> FakeTransaction:
+        transaction = None
+        if self._session is not None:
+            transaction = self._session.begin_transaction(**kwargs)
+        else:
+            self._driver._round_trip()
+        return FakeTransaction(self._driver, transaction)
+
+    def last_bookmarks(self) -> Bookmarks:
+        if self._session is not None:
+            return self._session.last_bookmarks()
+        return Bookmarks()
+
+    def close(self) -> None:
+        if self._session is not None:
+            self._session.close()
+
+
+class FakeDriver:
+    """
+    Stand-in for an Driver, to pass to db.set_connection(driver=...). Use
+    record() or replay() to create one.
+
+    :param cassette: the queries recorded, or to replay
+    :param driver: the real driver the queries are recorded from, None to replay
+    :param latency: seconds waited on each round trip when replaying
+    :param ordered: when replaying, whether the queries must be run in the order
+        they were recorded. Otherwise, each query is answered by the first recorded
+        query with the same text not replayed yet, e.g. for concurrent queries.
+    """
+
+    def __init__(
+        self,
+        cassette: Cassette,
+        driver: Driver | None = None,
+        latency: float = 0.0,
+        ordered: bool = True,
+    ) -> None:
+        self.cassette = cassette
+        # text of each query run, in order
+        self.queries: list[str] = []
+        self._driver = driver
+        self._latency = latency
+        # passed to the sessions when config.route_reads is set
+        self.execute_query_bookmark_manager = (
+            driver.execute_query_bookmark_manager if driver is not None else None
+        )
+        self._ordered = ordered
+
+    @classmethod
+    def record(cls, driver: Driver) -> "FakeDriver":
+        """Run the queries with driver, and record them into a new cassette."""
+        return cls(Cassette(), driver=driver)
+
+    @classmethod
+    def replay(
+        cls, cassette: Cassette | str, latency: float = 0.0, ordered: bool = True
+    ) -> "FakeDriver":
+        """
+        Answer the queries with the records of a cassette, or of the cassette saved
+        at the given path. Queries are matched on their text, not their parameters.
+        """
+        if isinstance(cassette, str):
+            cassette = Cassette.load(cassette)
+        return cls(cassette, latency=latency, ordered=ordered)
+
+    def session(self, **config: Any) -> FakeSession:
+        session = None
+        if self._driver is not None:
+            session = self._driver.session(**config)
+        return FakeSession(self, session)
+
+    def close(self) -> None:
+        if self._driver is not None:
+            self._driver.close()
+
+    def _round_trip(self) -> None:
+        if self._latency:
+            Util.sleep(self._latency)
+
+    def _run(
+        self,
+        runner: Session | Transaction | None,
+        query: str,
+        parameters: dict[str, Any] | None,
+    ) -> FakeResult:
+        self.queries.append(query)
+        if runner is None:
+            self._round_trip()
+            return FakeResult(*self.cassette.replay(query, self._ordered))
+
+        try:
+            result = runner.run(query, parameters)
+            records = [record for record in result]
+            summary = result.consume()
+        except Neo4jError as error:
+            self.cassette.record_error(query, parameters, error)
+            raise
+        keys = list(result.keys())
+        self.cassette.record(
+            query,
+            parameters,
+            keys,
+            [list(record.values()) for record in records],
+            summary,
+        )
+        return FakeResult(keys, records, summary)
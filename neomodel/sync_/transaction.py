@@ -11,9 +11,11 @@ from neo4j.api import Bookmarks
 from neo4j.exceptions import ClientError
 
 from neomodel._async_compat.util import Util
+from neomodel.config import get_config
 from neomodel.constants import NOT_COROUTINE_ERROR
-from neomodel.exceptions import UniqueProperty
+from neomodel.exceptions import NPlusOneWarning, UniqueProperty
 from neomodel.sync_.database import Database
+from neomodel.util import QueryEvent, get_call_site, query_template
 
 
 class TransactionProxy:
@@ -22,12 +24,16 @@ class TransactionProxy:
         db: Database,
         access_mode: str | None = None,
         parallel_runtime: bool | None = False,
+        session_cache: bool = False,
     ):
         self.db: Database = db
         self.access_mode: str | None = access_mode
         self.parallel_runtime: bool | None = parallel_runtime
+        self.session_cache: bool = session_cache
         self.bookmarks: Bookmarks | None = None
         self.last_bookmarks: Bookmarks | None = None
+        self._session_cache: SessionCache | None = None
+        self._n_plus_one_detector: NPlusOneDetector | None = None
 
     def __enter__(self) -> "TransactionProxy":
         if self.parallel_runtime and not self.db.parallel_runtime_available():
@@ -40,10 +46,21 @@ class TransactionProxy:
         self.db._parallel_runtime = self.parallel_runtime
         self.db.begin(access_mode=self.access_mode, bookmarks=self.bookmarks)
         self.bookmarks = None
+        if self.session_cache:
+            self._session_cache = SessionCache(self.db).__enter__()
+        threshold = get_config().n_plus_one_threshold
+        if threshold:
+            self._n_plus_one_detector = NPlusOneDetector(self.db, threshold).__enter__()
         return self
 
     def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
         self.db._parallel_runtime = False
+        if self._session_cache is not None:
+            self._session_cache.__exit__(exc_type, exc_value, traceback)
+            self._session_cache = None
+        if self._n_plus_one_detector is not None:
+            self._n_plus_one_detector.__exit__(exc_type, exc_value, traceback)
+            self._n_plus_one_detector = None
         if exc_value:
             self.db.rollback()
 
@@ -71,6 +88,19 @@ class TransactionProxy:
     def with_bookmark(self) -> "BookmarkingAsyncTransactionProxy":
         return BookmarkingAsyncTransactionProxy(self.db, self.access_mode)
 
+    @property
+    def with_session_cache(self) -> "TransactionProxy":
+        """
+        The same transaction, resolving each node to a single instance, see
+        Database.session_cache.
+        """
+        return TransactionProxy(
+            self.db,
+            self.access_mode,
+            parallel_runtime=self.parallel_runtime,
+            session_cache=True,
+        )
+
 
 class BookmarkingAsyncTransactionProxy(TransactionProxy):
     def __call__(self, func: Callable) -> Callable:
@@ -89,6 +119,106 @@ class BookmarkingAsyncTransactionProxy(TransactionProxy):
         return wrapper
 
 
+class SessionCache:
+    """
+    Identity map of the nodes resolved from query results, keyed by element_id.
+    Nested blocks share the map of the outermost one.
+    """
+
+    def __init__(self, db: Database):
+        self.db = db
+        self.owner = False
+
+    def __enter__(self) -> "SessionCache":
+        if self.db._identity_map is None:
+            self.db._identity_map = {}
+            self.owner = True
+        return self
+
+    def __exit__(
+        self, exception_type: Any, exception_value: Any, exception_traceback: Any
+    ) -> None:
+        if self.owner:
+            self.db._identity_map = None
+            self.owner = False
+
+
+class QueryCounter:
+    """
+    Records the queries run in a block, including by the tasks or threads started
+    in it, and raises an AssertionError listing them on exit if there were more
+    than max_queries.
+    """
+
+    def __init__(self, db: Database, max_queries: int):
+        self.db = db
+        self.max_queries = max_queries
+        self.queries: list[QueryEvent] = []
+
+    def __enter__(self) -> "QueryCounter":
+        self.db._query_counters = self.db._query_counters + (self,)
+        return self
+
+    def __exit__(
+        self, exception_type: Any, exception_value: Any, exception_traceback: Any
+    ) -> None:
+        self.db._query_counters = tuple(
+            counter for counter in self.db._query_counters if counter is not self
+        )
+        if exception_type is None and len(self.queries) > self.max_queries:
+            queries = "\n".join(
+                f"{index}. {event.query}"
+                for index, event in enumerate(self.queries, start=1)
+            )
+            raise AssertionError(
+                f"{len(self.queries)} queries run, expected at most "
+                f"{self.max_queries}:\n{queries}"
+            )
+
+
+class NPlusOneDetector:
+    """
+    Warns with an NPlusOneWarning when the same query, literal values aside, runs
+    more than threshold times in a block, pointing at the code which ran it.
+    Each query is only reported once. Nested blocks share the counts of the
+    outermost one.
+    """
+
+    def __init__(self, db: Database, threshold: int):
+        self.db = db
+        self.threshold = threshold
+        self.counts: dict[str, int] = {}
+        self.owner = False
+
+    def __enter__(self) -> "NPlusOneDetector":
+        if self.db._n_plus_one_detector is None:
+            self.db._n_plus_one_detector = self
+            self.owner = True
+        return self
+
+    def __exit__(
+        self, exception_type: Any, exception_value: Any, exception_traceback: Any
+    ) -> None:
+        if self.owner:
+            self.db._n_plus_one_detector = None
+            self.owner = False
+
+    def add(self, query: str) -> None:
+        template = query_template(query)
+        count = self.counts.get(template, 0) + 1
+        self.counts[template] = count
+        if count != self.threshold + 1:
+            return
+        frame = get_call_site()
+        warnings.warn_explicit(
+            f"Query run more than {self.threshold} times, consider fetching the "
+            f"related nodes in a single query (N+1 queries): {template}",
+            NPlusOneWarning,
+            frame.f_code.co_filename if frame else "<unknown>",
+            frame.f_lineno if frame else 0,
+        )
+
+
 class ImpersonationHandler:
     def __init__(self, db: Database, impersonated_user: str):
         self.db = db
@@ -0,0 +1,8 @@
+"""
+Fake drivers recording queries run against a database, and replaying them without
+it, see neomodel.async_.testing.
+"""
+
+from neomodel._cassette import Cassette, CassetteMismatch
+from neomodel.async_.testing import AsyncFakeDriver
+from neomodel.sync_.testing import FakeDriver
@@ -1,8 +1,13 @@
+import re
+import sys
 import warnings
+from dataclasses import dataclass, field
 from enum import IntEnum
+from functools import cached_property
 from types import FrameType
-from typing import Any, Callable
+from typing import Any, Callable, Iterator
 
+from neo4j import ResultSummary
 from neo4j.graph import Entity
 
 
@@ -14,6 +19,189 @@ class RelationshipDirection(IntEnum):
     EITHER = 0
 
 
+class Param:
+    """
+    Named placeholder for a value bound when a prepared query is executed.
+
+    Can be used as a filter value, e.g. ``Person.nodes.filter(name=Param("name")).prepare()``.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __repr__(self) -> str:
+        return f"Param({self.name!r})"
+
+
+@dataclass
+class QueryEvent:
+    """
+    Execution details of a query, passed to the listeners registered with
+    ``db.add_query_listener()``. Times are in seconds.
+    """
+
+    query: str
+    params: dict[str, Any]
+    # from sending the query to fetching its last record. For streamed queries,
+    # this includes the time spent processing the records between fetches
+    duration: float
+    # from sending the query to fetching its first record, None without records
+    time_to_first_record: float | None
+    record_count: int
+    # None when a streamed query is closed before its last record
+    summary: ResultSummary | None = None
+    streamed: bool = False
+
+    @property
+    def param_count(self) -> int:
+        """Number of parameters, see param_size for the size of their values."""
+        return len(self.params)
+
+    @cached_property
+    def param_size(self) -> int:
+        """
+        Number of values in the parameters, counting each element of the lists and
+        dicts they hold, e.g. each field of the rows of an UNWIND. It is only computed
+        when accessed.
+        """
+        return _count_values(self.params.values())
+
+    @property
+    def result_available_after(self) -> int | None:
+        """Milliseconds taken by the server before the first record was available."""
+        return self.summary.result_available_after if self.summary else None
+
+    @property
+    def result_consumed_after(self) -> int | None:
+        """Milliseconds taken by the server to consume the records."""
+        return self.summary.result_consumed_after if self.summary else None
+
+    @property
+    def db_hits(self) -> int | None:
+        """Total database hits of a profiled query (PROFILE ...), None otherwise."""
+        if self.summary is None or not self.summary.profile:
+            return None
+        return QueryPlan.from_summary(self.summary.profile).total_db_hits
+
+
+def _count_values(values: Any) -> int:
+    count = 0
+    for value in values:
+        if isinstance(value, dict):
+            count += _count_values(value.values())
+        elif isinstance(value, (list, tuple)):
+            count += _count_values(value)
+        else:
+            count += 1
+    return count
+
+
+# operators reading all the nodes or relationships, or all those of a label or type
+_FULL_SCAN_OPERATORS = frozenset(
+    {
+        "AllNodesScan",
+        "NodeByLabelScan",
+        "PartitionedAllNodesScan",
+        "PartitionedNodeByLabelScan",
+        "DirectedAllRelationshipsScan",
+        "UndirectedAllRelationshipsScan",
+        "DirectedRelationshipTypeScan",
+        "UndirectedRelationshipTypeScan",
+    }
+)
+
+
+@dataclass
+class QueryPlan:
+    """
+    Operator of the execution plan of a query, with its child operators, as returned
+    by ``NodeSet.explain()`` and ``NodeSet.profile()``. rows and db_hits are only
+    known for profiled queries.
+    """
+
+    operator: str
+    details: str = ""
+    identifiers: list[str] = field(default_factory=list)
+    estimated_rows: float | None = None
+    rows: int | None = None
+    db_hits: int | None = None
+    arguments: dict[str, Any] = field(default_factory=dict)
+    children: list["QueryPlan"] = field(default_factory=list)
+    # the query text, on the root operator only
+    query: str | None = None
+
+    @classmethod
+    def from_summary(cls, plan: dict, query: str | None = None) -> "QueryPlan":
+        """Build the plan from ResultSummary.plan or ResultSummary.profile."""
+        arguments = plan.get("args", {})
+        return cls(
+            # drop the runtime suffix, e.g. NodeByLabelScan@neo4j
+            operator=plan["operatorType"].split("@")[0],
+            details=arguments.get("Details", ""),
+            identifiers=list(plan.get("identifiers", [])),
+            estimated_rows=arguments.get("EstimatedRows"),
+            rows=plan.get("rows"),
+            db_hits=plan.get("dbHits"),
+            arguments=arguments,
+            children=[cls.from_summary(child) for child in plan.get("children", [])],
+            query=query,
+        )
+
+    def walk(self) -> Iterator["QueryPlan"]:
+        """Iterate over this operator and all its descendants, depth first."""
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+    @property
+    def operators(self) -> list[str]:
+        return [operator.operator for operator in self.walk()]
+
+    @property
+    def total_db_hits(self) -> int | None:
+        if self.db_hits is None:
+            return None
+        return sum(operator.db_hits or 0 for operator in self.walk())
+
+    @property
+    def full_scans(self) -> list["QueryPlan"]:
+        """Operators reading all the nodes, or all the nodes of a label."""
+        return [op for op in self.walk() if op.operator in _FULL_SCAN_OPERATORS]
+
+    @property
+    def index_operators(self) -> list["QueryPlan"]:
+        """Operators using an index, to seek or to scan it."""
+        return [op for op in self.walk() if "Index" in op.operator]
+
+    def assert_uses_index(self) -> None:
+        """
+        Raise an AssertionError if the plan scans all the nodes, or all the nodes
+        of a label, instead of using an index. Meant to be used in tests.
+        """
+        if self.full_scans:
+            scans = ", ".join(f"{op.operator} ({op.details})" for op in self.full_scans)
+            raise AssertionError(f"Query plan scans without index: {scans}\n{self}")
+
+    def __str__(self) -> str:
+        lines = []
+
+        def render(operator: "QueryPlan", depth: int) -> None:
+            line = f"{'  ' * depth}+{operator.operator}"
+            if operator.details:
+                line += f" {operator.details}"
+            if operator.estimated_rows is not None:
+                line += f" (estimated rows: {operator.estimated_rows:g}"
+                if operator.rows is not None:
+                    line += f", rows: {operator.rows}, db hits: {operator.db_hits}"
+                line += ")"
+            lines.append(line)
+            for child in operator.children:
+                render(child, depth + 1)
+
+        render(self, 0)
+        return "\n".join(lines)
+
+
 def deprecated(message: str) -> Callable:
     # pylint:disable=invalid-name
     def f__(f: Callable) -> Callable:
@@ -64,6 +252,38 @@ def enumerate_traceback(initial_frame: FrameType | None = None) -> Any:
         depth += 1
 
 
+# first package of the modules skipped to find the call site of a query
+_INTERNAL_PACKAGES = frozenset(
+    ("neomodel", "neo4j", "asyncio", "contextlib", "concurrent", "threading")
+)
+# string and number literals of a query
+_QUERY_LITERALS = re.compile(
+    r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"|\b\d+(?:\.\d+)?\b"
+)
+
+
+def query_template(query: str) -> str:
+    """
+    The query with its literal values replaced by ?, and its whitespace collapsed,
+    so that queries only differing by the values they inline are identical.
+    """
+    return " ".join(_QUERY_LITERALS.sub("?", query).split())
+
+
+def get_call_site(initial_frame: FrameType | None = None) -> FrameType | None:
+    """
+    The first frame up the stack outside neomodel, the driver and the standard
+    library modules running it, i.e. the code of the application which ran a query.
+    """
+    if initial_frame is None:
+        initial_frame = sys._getframe(1)
+    for _, frame in enumerate_traceback(initial_frame):
+        module = frame.f_globals.get("__name__", "")
+        if module.partition(".")[0] not in _INTERNAL_PACKAGES:
+            return frame
+    return None
+
+
 def version_tag_to_integer(version_tag: str) -> int:
     """
     Converts a version string to an integer representation to allow for quick comparisons between versions.
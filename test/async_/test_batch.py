@@ -62,6 +62,92 @@ async def test_batch_create():
     assert await Customer.nodes.get(email="jim1@aol.com")
 
 
+@mark_async_test
+async def test_batch_create_chunks():
+    props = [{"email": f"chunk{i}@aol.com", "age": i} for i in range(25)]
+    users = await Customer.create(*props, batch_size=10)
+    assert [u.age for u in users] == list(range(25))
+    assert all(u.element_id for u in users)
+    assert len(await Customer.nodes.filter(email__startswith="chunk")) == 25
+
+    lazy_users = await Customer.create(
+        {"email": "lazy1@aol.com", "age": 1},
+        {"email": "lazy2@aol.com", "age": 2},
+        lazy=True,
+        batch_size=1,
+    )
+    assert len(lazy_users) == 2
+    assert lazy_users[1].age is None
+    assert (await Customer.nodes.get(email="lazy2@aol.com")) == lazy_users[1]
+
+    assert await Customer.create() == []
+
+
+class HookedCustomer(AsyncStructuredNode):
+    email = StringProperty(unique_index=True, required=True)
+    age = IntegerProperty()
+    hooks: list = []
+
+    def pre_save(self):
+        HookedCustomer.hooks.append(("pre_save", self.email))
+
+    def post_create(self):
+        HookedCustomer.hooks.append(("post_create", self.email))
+
+    def post_save(self):
+        HookedCustomer.hooks.append(("post_save", self.email))
+
+
+@mark_async_test
+async def test_save_all(mocker):
+    saved = await Customer.create(
+        {"email": "save1@aol.com", "age": 1}, {"email": "save2@aol.com", "age": 2}
+    )
+    saved[0].age = 10
+    new_customer = Customer(email="save3@aol.com", age=3)
+    hooked = HookedCustomer(email="hooked@aol.com")
+    cypher_query = mocker.spy(adb, "cypher_query")
+
+    result = await adb.save_all([*saved, new_customer, hooked], batch_size=1)
+
+    assert result == [*saved, new_customer, hooked]
+    # two creates and one update, the unchanged node is skipped
+    assert cypher_query.call_count == 3
+    assert new_customer.element_id and hooked.element_id
+    assert HookedCustomer.hooks == [
+        ("pre_save", "hooked@aol.com"),
+        ("post_create", "hooked@aol.com"),
+        ("post_save", "hooked@aol.com"),
+    ]
+    assert (await Customer.nodes.get(email="save1@aol.com")).age == 10
+    assert (await Customer.nodes.get(email="save3@aol.com")) == new_customer
+
+    new_customer.age = 30
+    await adb.save_all([new_customer])
+    assert (await Customer.nodes.get(email="save3@aol.com")).age == 30
+
+    with raises(TypeError):
+        await adb.save_all([{"email": "not a node"}])
+
+
+@mark_async_test
+async def test_save_all_rollback():
+    await Customer(email="taken@aol.com").save()
+    fresh = Customer(email="fresh@aol.com", age=1)
+    taken = Customer(email="taken@aol.com", age=2)
+
+    with raises(UniqueProperty):
+        await adb.save_all([fresh, taken], batch_size=1)
+
+    # the first chunk was rolled back with the transaction
+    assert not hasattr(fresh, "element_id_property")
+    assert fresh._dirty is None
+    assert await Customer.nodes.get_or_none(email="fresh@aol.com") is None
+
+    await adb.save_all([fresh])
+    assert (await Customer.nodes.get(email="fresh@aol.com")) == fresh
+
+
 @mark_async_test
 async def test_batch_create_or_update():
     users = await Customer.create_or_update(
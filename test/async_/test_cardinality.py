@@ -378,3 +378,69 @@ async def test_bidirectional_cardinality_validation():
     assert "Soft check is enabled so the relationship will be created" in console_output
 
     config.soft_cardinality_check = False
+
+
+@mark_async_test
+async def test_connect_many():
+    config = get_config()
+    config.soft_cardinality_check = False
+    company = await Company(name="ManyCorp").save()
+    other = await Company(name="OtherCorp").save()
+    employees = [await Employee(name=f"Many {i}").save() for i in range(5)]
+
+    assert await company.employees.connect_many(employees[:3], batch_size=2) is None
+    assert len(await company.employees.all()) == 3
+    assert await employees[0].employer.single() == company
+
+    # the inverse ZeroOrOne cardinality is checked in the same statement
+    with raises(AttemptedCardinalityViolation):
+        await other.employees.connect_many(employees[2:])
+    assert len(await other.employees.all()) == 0
+    # a violation in a later batch rolls back the previous ones
+    with raises(AttemptedCardinalityViolation):
+        await other.employees.connect_many([employees[3], employees[2]], batch_size=1)
+    assert len(await other.employees.all()) == 0
+
+    # the source cardinality too
+    monkey = await Monkey(name="Bubbles").save()
+    drivers = [await ScrewDriver(version=i).save() for i in range(2)]
+    with raises(AttemptedCardinalityViolation):
+        await monkey.driver.connect_many(drivers)
+    await monkey.driver.connect_many(drivers[:1])
+    with raises(AttemptedCardinalityViolation):
+        await monkey.driver.connect_many(drivers[1:])
+    assert await monkey.driver.single() == drivers[0]
+
+    stream = io.StringIO()
+    with patch("sys.stdout", new=stream):
+        config.soft_cardinality_check = True
+        await other.employees.connect_many(employees[2:])
+    config.soft_cardinality_check = False
+    assert "Cardinality violation detected" in stream.getvalue()
+    assert len(await other.employees.all()) == 3
+
+
+@mark_async_test
+async def test_connect_checks_cardinality_in_one_statement(mocker):
+    config = get_config()
+    config.soft_cardinality_check = False
+    company = await Company(name="OneStatementCorp").save()
+    other = await Company(name="OtherStatementCorp").save()
+    employee = await Employee(name="Jane").save()
+
+    cypher_query = mocker.spy(adb, "cypher_query")
+    await company.employees.connect(employee)
+    assert cypher_query.call_count == 1
+
+    # the inverse ZeroOrOne limit is checked by the same statement
+    with raises(AttemptedCardinalityViolation):
+        await other.employees.connect(employee)
+    assert cypher_query.call_count == 2
+    assert await employee.employer.single() == company
+
+    # connecting again to a connected node is still a violation
+    monkey = await Monkey(name="Statement").save()
+    driver = await ScrewDriver(version=3).save()
+    await monkey.driver.connect(driver)
+    with raises(AttemptedCardinalityViolation):
+        await monkey.driver.connect(driver)
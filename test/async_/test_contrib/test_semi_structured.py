@@ -37,6 +37,19 @@ async def test_save_to_model_with_extras():
     assert u.bar == 99
 
 
+@mark_async_test
+async def test_save_extras_of_loaded_node():
+    await UserProf(email="kim@test.com", age=5, bar=1).save()
+    u = await UserProf.nodes.get(email="kim@test.com")
+    u.bar = 2
+    u.baz = "new"
+    await u.save()
+
+    u = await UserProf.nodes.get(email="kim@test.com")
+    assert u.bar == 2
+    assert u.baz == "new"
+
+
 @mark_async_test
 async def test_save_empty_model():
     dummy = Dummy()
@@ -1,4 +1,5 @@
 import builtins
+from datetime import datetime, timezone
 from test._async_compat import mark_async_test
 
 import pytest
@@ -6,7 +7,18 @@ from neo4j.exceptions import ClientError as CypherError
 from numpy import ndarray
 from pandas import DataFrame, Series
 
-from neomodel import AsyncStructuredNode, StringProperty, adb
+from neomodel import (
+    AsyncStructuredNode,
+    BooleanProperty,
+    DateTimeProperty,
+    EmailProperty,
+    IntegerProperty,
+    NPlusOneWarning,
+    StringProperty,
+    UniqueIdProperty,
+    adb,
+    get_config,
+)
 from neomodel._async_compat.util import AsyncUtil
 
 
@@ -20,6 +32,22 @@ class UserPandas(AsyncStructuredNode):
     email = StringProperty()
 
 
+class UserFrame(AsyncStructuredNode):
+    name = StringProperty()
+    age = IntegerProperty()
+    active = BooleanProperty()
+    joined = DateTimeProperty()
+
+
+class UserArrow(AsyncStructuredNode):
+    name = StringProperty()
+    age = IntegerProperty()
+    active = BooleanProperty()
+    joined = DateTimeProperty()
+    email = EmailProperty()
+    uid = UniqueIdProperty()
+
+
 class UserNP(AsyncStructuredNode):
     name = StringProperty()
     email = StringProperty()
@@ -74,6 +102,89 @@ async def test_cypher_syntax_error():
         assert False, "CypherError not raised."
 
 
+@mark_async_test
+async def test_query_listener():
+    await User2(email="listened@test.com").save()
+    events = []
+    adb.add_query_listener(events.append)
+    try:
+        await adb.cypher_query(
+            "MATCH (a:User2) WHERE a.email = $email RETURN a",
+            {"email": "listened@test.com"},
+        )
+        names = [user.email async for user in User2.nodes]
+        await adb.cypher_query("PROFILE MATCH (a:User2) RETURN a")
+    finally:
+        adb.remove_query_listener(events.append)
+    await adb.cypher_query("RETURN 1")
+
+    assert len(events) == 3
+    event = events[0]
+    assert event.query.endswith("WHERE a.email = $email RETURN a")
+    assert event.param_count == 1
+    assert event.param_size == 1
+    assert event.record_count == 1
+    assert not event.streamed
+    assert event.duration >= event.time_to_first_record >= 0
+    assert event.result_available_after is not None
+    assert event.db_hits is None
+
+    assert events[1].streamed
+    assert events[1].record_count == len(names)
+    assert events[1].summary is not None
+    assert events[2].db_hits > 0
+
+
+@mark_async_test
+async def test_assert_max_queries():
+    await User2(email="counted@test.com").save()
+    with adb.assert_max_queries(2) as counter:
+        await User2.nodes.get(email="counted@test.com")
+        assert [user async for user in User2.nodes.filter(email="counted@test.com")]
+    assert len(counter.queries) == 2
+    assert counter.queries[1].streamed
+
+    with pytest.raises(AssertionError, match="3 queries run, expected at most 2"):
+        with adb.assert_max_queries(2):
+            for _ in range(3):
+                await adb.cypher_query("RETURN 1")
+
+    # queries are counted by each enclosing block
+    with adb.assert_max_queries(2) as outer:
+        with adb.assert_max_queries(1) as inner:
+            await adb.cypher_query("RETURN 1")
+        await adb.cypher_query("RETURN 1")
+    assert len(inner.queries) == 1
+    assert len(outer.queries) == 2
+
+
+@mark_async_test
+async def test_detect_n_plus_one():
+    emails = [f"n{i}@test.com" for i in range(4)]
+    with pytest.warns(NPlusOneWarning) as record:
+        with adb.detect_n_plus_one(threshold=2):
+            for email in emails:
+                await User2.nodes.get_or_none(email=email)
+            # queries only differing by their literals are the same
+            for i in range(3):
+                await adb.cypher_query(
+                    f"MATCH (a:User2) WHERE a.name = 'x{i}' RETURN a"
+                )
+    assert len(record) == 2
+    assert record[0].filename == __file__
+    assert "a.name = ? RETURN a" in str(record[1].message)
+
+    # detected in every transaction block
+    get_config().n_plus_one_threshold = 2
+    try:
+        with pytest.warns(NPlusOneWarning):
+            async with adb.transaction:
+                for email in emails:
+                    await User2.nodes.get_or_none(email=email)
+    finally:
+        get_config().n_plus_one_threshold = 0
+
+
 @mark_async_test
 @pytest.mark.parametrize("hide_available_pkg", ["pandas"], indirect=True)
 async def test_pandas_not_installed(hide_available_pkg):
@@ -132,6 +243,117 @@ async def test_pandas_integration():
     assert df["name"].tolist() == ["jimla", "jimlo"]
 
 
+@mark_async_test
+async def test_nodeset_to_dataframe():
+    joined = datetime(2020, 1, 2, tzinfo=timezone.utc)
+    await UserFrame(name="jimla", age=30, active=True, joined=joined).save()
+    await UserFrame(name="jimlo", age=31, active=False).save()
+    await UserFrame(name="jimlu", age=32, active=True).save()
+
+    df = await UserFrame.nodes.order_by("name").to_dataframe(
+        columns=["name", "age", "active", "joined"]
+    )
+    assert isinstance(df, DataFrame)
+    assert list(df.columns) == ["name", "age", "active", "joined"]
+    assert df["name"].tolist() == ["jimla", "jimlo", "jimlu"]
+    assert str(df["age"].dtype) == "int64"
+    assert str(df["active"].dtype) == "bool"
+    assert str(df["joined"].dtype) == "datetime64[ns, UTC]"
+    assert df["joined"][0] == joined
+    assert df["joined"][1:].isna().all()
+
+    chunks = [
+        chunk
+        async for chunk in UserFrame.nodes.order_by("name").to_dataframe(
+            columns=["age"], chunk_size=2
+        )
+    ]
+    assert [chunk["age"].tolist() for chunk in chunks] == [[30, 31], [32]]
+
+    df = await UserFrame.nodes.filter(name="missing").to_dataframe()
+    assert df.shape == (0, 4)
+
+
+@mark_async_test
+@pytest.mark.parametrize("hide_available_pkg", ["pyarrow"], indirect=True)
+async def test_arrow_not_installed(hide_available_pkg):
+    if not AsyncUtil.is_async_code:
+        pytest.skip("This test is async only")
+    with pytest.raises(ImportError):
+        with pytest.warns(
+            UserWarning,
+            match="The neomodel.integration.arrow module expects pyarrow to be installed",
+        ):
+            from neomodel.integration.arrow import columns_to_record_batch
+
+
+@mark_async_test
+async def test_arrow_integration():
+    pa = pytest.importorskip("pyarrow")
+
+    joined = datetime(2020, 1, 2, tzinfo=timezone.utc)
+    await UserArrow(name="jimla", age=30, active=True, joined=joined).save()
+    await UserArrow(name="jimlo", age=31, active=False).save()
+    await UserArrow(name="jimlu", age=32, active=True).save()
+
+    batches = [
+        batch
+        async for batch in adb.cypher_query_arrow(
+            "MATCH (a:UserArrow) RETURN a.name AS name, a.age AS age ORDER BY name",
+            batch_size=2,
+        )
+    ]
+    assert [batch.num_rows for batch in batches] == [2, 1]
+    table = pa.Table.from_batches(batches)
+    assert table.column_names == ["name", "age"]
+    assert table.column("age").to_pylist() == [30, 31, 32]
+    assert table.schema.field("age").type == pa.int64()
+
+    # the type of a column null in the first batch is inferred from the next ones
+    batches = [
+        batch
+        async for batch in adb.cypher_query_arrow(
+            "MATCH (a:UserArrow) RETURN a.name AS name, a.joined AS joined "
+            "ORDER BY name DESC",
+            batch_size=1,
+        )
+    ]
+    assert [batch.num_rows for batch in batches] == [1, 1, 1]
+    table = pa.Table.from_batches(batches)
+    assert table.schema.field("joined").type == pa.float64()
+    assert table.column("joined").to_pylist() == [None, None, joined.timestamp()]
+
+    batches = [
+        batch
+        async for batch in UserArrow.nodes.order_by("name").to_arrow_batches(
+            columns=["name", "age", "active", "joined"]
+        )
+    ]
+    assert len(batches) == 1
+    assert batches[0].schema == pa.schema(
+        [
+            ("name", pa.string()),
+            ("age", pa.int64()),
+            ("active", pa.bool_()),
+            ("joined", pa.timestamp("us", tz="UTC")),
+        ]
+    )
+    assert batches[0].column("joined").to_pylist() == [joined, None, None]
+
+    # the types of the stock properties don't depend on the values, so an
+    # email column without values doesn't hold the batches back
+    batches = [
+        batch
+        async for batch in UserArrow.nodes.order_by("name").to_arrow_batches(
+            columns=["name", "email", "uid"], batch_size=1
+        )
+    ]
+    assert len(batches) == 3
+    assert batches[0].schema == pa.schema(
+        [("name", pa.string()), ("email", pa.string()), ("uid", pa.string())]
+    )
+
+
 @mark_async_test
 @pytest.mark.parametrize("hide_available_pkg", ["numpy"], indirect=True)
 async def test_numpy_not_installed(hide_available_pkg):
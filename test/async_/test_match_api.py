@@ -1,4 +1,5 @@
 import re
+from contextlib import aclosing
 from datetime import datetime
 from test._async_compat import mark_async_test
 from unittest.mock import AsyncMock, MagicMock
@@ -12,12 +13,14 @@ from neomodel import (
     AsyncStructuredNode,
     AsyncStructuredRel,
     AsyncZeroOrOne,
+    DateTimeNeo4jFormatProperty,
     DateTimeProperty,
     IntegerProperty,
     Q,
     StringProperty,
     UniqueIdProperty,
     adb,
+    get_config,
 )
 from neomodel._async_compat.util import AsyncUtil
 from neomodel.async_.match import (
@@ -34,7 +37,7 @@ from neomodel.async_.match import (
     Size,
 )
 from neomodel.exceptions import MultipleNodesReturned, RelationshipClassNotDefined
-from neomodel.util import RelationshipDirection
+from neomodel.util import Param, RelationshipDirection
 
 
 class SupplierRel(AsyncStructuredRel):
@@ -64,6 +67,11 @@ class Coffee(AsyncStructuredNode):
     id_ = IntegerProperty()
 
 
+class Roast(AsyncStructuredNode):
+    name = StringProperty()
+    roasted = DateTimeNeo4jFormatProperty()
+
+
 class Extension(AsyncStructuredNode):
     extension = AsyncRelationshipTo("Extension", "extension")
 
@@ -275,6 +283,357 @@ async def test_slice():
         assert len(list(Coffee.nodes[1:2])) == 1
 
 
+@mark_async_test
+async def test_pagination_is_parameterized():
+    queries = set()
+    for page in range(1, 4):
+        nodeset = await Coffee.nodes.order_by("name").get_item(
+            slice(page * 2, page * 2 + 2)
+        )
+        qbuilder = await nodeset.query_cls(nodeset).build_ast()
+        queries.add(qbuilder.build_query())
+        assert qbuilder._query_params["skip"] == page * 2
+        assert qbuilder._query_params["limit"] == 2
+    assert len(queries) == 1
+    assert "SKIP $skip LIMIT $limit" in queries.pop()
+
+    await Coffee(name="Icelands finest").save()
+    await Coffee(name="Britains finest").save()
+    await Coffee(name="Japans finest").save()
+    nodeset = await Coffee.nodes.order_by("name").get_item(slice(1, 3))
+    assert [c.name for c in await nodeset.all()] == [
+        "Icelands finest",
+        "Japans finest",
+    ]
+    nodeset = await Coffee.nodes.get_item(slice(1, 3))
+    assert await nodeset.get_len() == 2
+
+
+@mark_async_test
+async def test_prepared_query():
+    for name, price in (("Arabica", 5), ("Robusta", 3), ("Rwanda", 8)):
+        await Coffee(name=name, price=price).save()
+
+    prepared = (
+        Coffee.nodes.filter(name__istartswith=Param("prefix"), price__lt=Param("max"))
+        .order_by("price")
+        .prepare()
+    )
+    assert [c.name for c in await prepared.all(prefix="r", max=10)] == [
+        "Robusta",
+        "Rwanda",
+    ]
+    assert [c.name for c in await prepared.all(prefix="R", max=5)] == ["Robusta"]
+    assert (await prepared.first(prefix="r", max=10)).name == "Robusta"
+    assert await prepared.first_or_none(prefix="x", max=10) is None
+    assert (await prepared.get(prefix="a", max=10)).name == "Arabica"
+    with raises(MultipleNodesReturned):
+        await prepared.get(prefix="r", max=10)
+    with raises(Coffee.DoesNotExist):
+        await prepared.get(prefix="x", max=10)
+    lazy_ids = await prepared.all(lazy=True, prefix="a", max=10)
+    assert lazy_ids == [(await Coffee.nodes.get(name="Arabica")).element_id]
+
+    names = [c.name async for c in prepared.bind(prefix="r", max=10)]
+    assert names == ["Robusta", "Rwanda"]
+
+    # The query is only built once per variant
+    assert len(prepared._compiled) == 4
+    query, _ = prepared._compiled[(False, None)]
+    assert "LIMIT" not in query
+
+    with raises(ValueError, match="Missing value for parameter 'max'"):
+        await prepared.all(prefix="r")
+
+    with raises(ValueError, match="A Param can not be used for isnull"):
+        await Coffee.nodes.filter(price__isnull=Param("null")).prepare().all()
+    with raises(ValueError, match=r"Param placeholders need NodeSet.prepare\(\)"):
+        await Coffee.nodes.filter(name=Param("name")).all()
+
+
+@mark_async_test
+async def test_prepared_query_variants_are_built_from_copies(mocker):
+    prepared = Coffee.nodes.filter(name=Param("name")).prepare()
+    build_ast = mocker.spy(AsyncQueryBuilder, "build_ast")
+
+    await prepared._compile(False, 1)
+    await prepared._compile(False, None)
+
+    # the shared node set is never changed, so that variants compiled
+    # concurrently don't get each other's limit
+    assert all(
+        call.args[0].node_set is not prepared.node_set
+        for call in build_ast.call_args_list
+    )
+    assert not hasattr(prepared.node_set, "limit")
+    assert "LIMIT" in prepared._compiled[(False, 1)][0]
+    assert "LIMIT" not in prepared._compiled[(False, None)][0]
+
+
+@mark_async_test
+async def test_traversals_are_created_lazily():
+    nodeset = Coffee.nodes
+    assert "suppliers" not in vars(nodeset)
+    traversal = nodeset.suppliers
+    assert isinstance(traversal, AsyncTraversal)
+    assert traversal.target_class is Supplier
+    assert nodeset.suppliers is traversal
+    with raises(AttributeError):
+        nodeset.unknown
+
+
+@mark_async_test
+async def test_iteration_streams_records(mocker):
+    for i in range(5):
+        await Coffee(name=f"streamed {i}", price=i).save()
+
+    config = get_config()
+    fetch_size = config.fetch_size
+    config.fetch_size = 2
+    cypher_query = mocker.spy(adb, "cypher_query")
+    try:
+        names = [coffee.name async for coffee in Coffee.nodes.order_by("price")]
+        assert names == [f"streamed {i}" for i in range(5)]
+
+        # breaking out early releases the session
+        async for coffee in Coffee.nodes.order_by("price"):
+            assert coffee.name == "streamed 0"
+            break
+        cypher_query.assert_not_called()
+    finally:
+        config.fetch_size = fetch_size
+    assert await Coffee.nodes.get_len() == 5
+
+
+@mark_async_test
+async def test_closing_iteration_closes_session(mocker):
+    for i in range(3):
+        await Coffee(name=f"closed {i}", price=i).save()
+
+    open_session = adb._open_session
+    closes = []
+
+    def spy_open_session(*args, **kwargs):
+        session = open_session(*args, **kwargs)
+        closes.append(mocker.spy(session, "close"))
+        return session
+
+    mocker.patch.object(adb, "_open_session", side_effect=spy_open_session)
+    coffees = Coffee.nodes.order_by("price").__aiter__()
+    async with aclosing(coffees):
+        async for coffee in coffees:
+            assert coffee.name == "closed 0"
+            break
+        closes[-1].assert_not_called()
+    closes[-1].assert_called_once()
+
+
+@mark_async_test
+async def test_prefetch(mocker):
+    arabica = await Species(name="Arabica prefetched").save()
+    lidl = await Supplier(name="lidl prefetched").save()
+    aldi = await Supplier(name="aldi prefetched").save()
+    espresso = await Coffee(name="espresso prefetched", price=2).save()
+    filter_coffee = await Coffee(name="filter prefetched", price=1).save()
+    await espresso.suppliers.connect(lidl)
+    await espresso.suppliers.connect(aldi)
+    await espresso.species.connect(arabica)
+    await filter_coffee.species.connect(arabica)
+
+    with raises(ValueError, match="No relationship called 'missing' on Coffee"):
+        Coffee.nodes.prefetch("species__missing")
+
+    cypher_query = mocker.spy(adb, "cypher_query")
+    coffees = (
+        await Coffee.nodes.filter(name__endswith="prefetched")
+        .order_by("price")
+        .prefetch("suppliers", "species", "species__coffees")
+        .all()
+    )
+    # one query per relationship, the species are only fetched once
+    assert cypher_query.call_count == 3
+
+    assert [coffee.name for coffee in coffees] == [
+        "filter prefetched",
+        "espresso prefetched",
+    ]
+    assert await coffees[0].suppliers.all() == []
+    assert not await coffees[0].suppliers.check_bool()
+    assert {supplier.name async for supplier in coffees[1].suppliers} == {
+        "lidl prefetched",
+        "aldi prefetched",
+    }
+    assert await coffees[1].suppliers.get_len() == 2
+    assert await coffees[1].suppliers.check_contains(lidl)
+    species = await coffees[1].species.single()
+    assert species.name == "Arabica prefetched"
+    assert len(await species.coffees.all()) == 2
+    assert cypher_query.call_count == 3
+
+    # changing the relationship drops the prefetched nodes
+    await coffees[0].suppliers.connect(lidl)
+    assert [supplier.name for supplier in await coffees[0].suppliers.all()] == [
+        "lidl prefetched"
+    ]
+
+
+@mark_async_test
+async def test_values():
+    arabica = await Species(name="Arabica valued").save()
+    espresso = await Coffee(name="espresso valued", price=2).save()
+    await Coffee(name="filter valued", price=1).save()
+    await espresso.species.connect(arabica)
+
+    nodes = Coffee.nodes.filter(name__endswith="valued").order_by("price")
+    assert [row async for row in nodes.values("name", "price")] == [
+        {"name": "filter valued", "price": 1},
+        {"name": "espresso valued", "price": 2},
+    ]
+    assert [
+        row
+        async for row in Coffee.nodes.filter(name__endswith="valued")
+        .order_by("price")
+        .values_list("name", "species__name")
+    ] == [("filter valued", None), ("espresso valued", "Arabica valued")]
+    assert [
+        name
+        async for name in Coffee.nodes.filter(
+            species__name="Arabica valued"
+        ).values_list("name", flat=True)
+    ] == ["espresso valued"]
+
+    # values are inflated by their property
+    rows = [row async for row in Species.nodes.filter(name="Arabica valued").values()]
+    assert rows == [{"name": "Arabica valued", "tags": []}]
+
+    with raises(ValueError, match="No property called 'missing' on Species"):
+        [row async for row in Coffee.nodes.values("species__missing")]
+    with raises(ValueError):
+        [row async for row in Coffee.nodes.values_list("name", "price", flat=True)]
+
+
+@mark_async_test
+async def test_paginate(mocker):
+    for i in range(5):
+        await Coffee(name=f"paginated {i}", price=i % 2).save()
+    nodes = Coffee.nodes.filter(name__startswith="paginated")
+
+    page = await nodes.paginate(order_by="name", size=2)
+    assert [coffee.name for coffee in page.items] == ["paginated 0", "paginated 1"]
+    first_cursor = page.next_cursor
+    names = []
+    while page.next_cursor:
+        names += [coffee.name for coffee in page.items]
+        page = await nodes.paginate(order_by="name", after=page.next_cursor, size=2)
+    names += [coffee.name for coffee in page.items]
+    assert names == [f"paginated {i}" for i in range(5)]
+
+    # the node set itself isn't ordered nor limited
+    assert not nodes.order_by_elements and not hasattr(nodes, "limit")
+    assert len(await nodes) == 5
+
+    # composite keys, descending first
+    stream_query = mocker.spy(adb, "_stream_query")
+    page = await nodes.paginate(order_by=["-price", "name"], size=3)
+    assert [coffee.name for coffee in page.items] == [
+        "paginated 1",
+        "paginated 3",
+        "paginated 0",
+    ]
+    page = await nodes.paginate(
+        order_by=["-price", "name"], after=page.next_cursor, size=3
+    )
+    assert [coffee.name for coffee in page.items] == ["paginated 2", "paginated 4"]
+    assert page.next_cursor is None
+    query = stream_query.call_args[0][0]
+    assert "SKIP" not in query
+    assert "coffee.price < $after_0" in query
+
+    with raises(ValueError, match="was not created for the ordering"):
+        await Coffee.nodes.paginate(order_by="price", after=first_cursor)
+    with raises(ValueError, match="No property called 'missing' on Coffee"):
+        await Coffee.nodes.paginate(order_by="-missing")
+    with raises(ValueError, match="Cannot paginate by array property 'tags'"):
+        await Species.nodes.paginate(order_by="tags")
+
+    # cursors of temporal values
+    for day in range(1, 4):
+        await Roast(name=f"roast {day}", roasted=datetime(2024, 1, day)).save()
+    page = await Roast.nodes.paginate(order_by="roasted", size=2)
+    page = await Roast.nodes.paginate(
+        order_by="roasted", after=page.next_cursor, size=2
+    )
+    assert [roast.name for roast in page.items] == ["roast 3"]
+
+
+@mark_async_test
+async def test_explain():
+    await Coffee(name="explained", price=3).save()
+
+    plan = await Coffee.nodes.filter(name="explained").explain()
+    assert "coffee.name = $coffee_name_1" in plan.query
+    assert plan.rows is None
+    assert plan.index_operators
+    plan.assert_uses_index()
+
+    # a regular expression can't use the index
+    plan = await Coffee.nodes.filter(name__iexact="Explained").explain()
+    assert "NodeByLabelScan" in plan.operators
+    with raises(AssertionError, match="scans without index"):
+        plan.assert_uses_index()
+
+    plan = await Coffee.nodes.filter(name="explained").profile()
+    assert plan.rows == 1
+    assert plan.total_db_hits > 0
+
+
+@mark_async_test
+async def test_partitions():
+    for i in range(10):
+        await Coffee(name=f"partitioned {i}", price=i if i < 8 else None).save()
+    nodes = Coffee.nodes.filter(name__startswith="partitioned")
+
+    partitions = await nodes.partitions(3)
+    assert len(partitions) == 3
+    names = [coffee.name for partition in partitions for coffee in await partition]
+    assert sorted(names) == [f"partitioned {i}" for i in range(10)]
+
+    # nodes without the property are in the first partition
+    partitions = await nodes.partitions(4, by="price")
+    assert [partition._partition for partition in partitions] == [
+        ("price", None, 2),
+        ("price", 2, 4),
+        ("price", 4, 6),
+        ("price", 6, None),
+    ]
+    assert sorted(coffee.name for coffee in await partitions[0]) == [
+        "partitioned 0",
+        "partitioned 1",
+        "partitioned 8",
+        "partitioned 9",
+    ]
+    assert len(await nodes.partitions(20, by="price")) == 8
+
+    # refining a partition doesn't change the others nor the node set
+    partitions[0].has(suppliers=True).order_by("-name")
+    assert await partitions[0] == []
+    assert not partitions[1].must_match and not partitions[1].order_by_elements
+    assert len(await partitions[1]) == 2
+    assert not nodes.must_match and len(await nodes) == 10
+
+    names = [coffee.name async for coffee in nodes.parallel_iter(workers=3)]
+    assert sorted(names) == [f"partitioned {i}" for i in range(10)]
+    async with adb.transaction:
+        names = [coffee.name async for coffee in nodes.parallel_iter(by="price")]
+    assert sorted(names) == [f"partitioned {i}" for i in range(10)]
+
+    with raises(ValueError, match="non numeric property 'name'"):
+        await nodes.partitions(2, by="name")
+    sliced = await Coffee.nodes.get_item(slice(0, 5))
+    with raises(ValueError, match="Cannot partition a sliced node set"):
+        await sliced.partitions(2)
+
+
 @mark_async_test
 async def test_issue_208():
     # calls to match persist across queries.
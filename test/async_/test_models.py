@@ -237,6 +237,29 @@ async def test_setting_value_to_none():
     assert copy.age is None
 
 
+@mark_async_test
+async def test_save_only_writes_changed_properties(mocker):
+    c = await Customer2(email="dirty@bob.com", age=42).save()
+    cypher = mocker.spy(c, "cypher")
+    await c.save()
+    cypher.assert_not_called()
+
+    c.age = 43
+    await c.save()
+    query, params = cypher.call_args.args
+    assert params == {"age": 43}
+    assert "email" not in query and "SET n:" not in query
+    assert (await Customer2.nodes.get(email="dirty@bob.com")).age == 43
+
+    loaded = await Customer2.nodes.get(email="dirty@bob.com")
+    await loaded.save()
+    assert loaded._dirty == frozenset()
+    loaded.email = "clean@bob.com"
+    await loaded.save()
+    await c.refresh()
+    assert (c.email, c.age) == ("clean@bob.com", 43)
+
+
 @mark_async_test
 async def test_inheritance():
     class User(AsyncStructuredNode):
@@ -0,0 +1,50 @@
+from test._async_compat import mark_async_test
+
+from pytest import raises
+
+from neomodel import AsyncStructuredNode, DateTimeProperty, StringProperty, adb
+from neomodel.exceptions import UniqueProperty
+from neomodel.testing import AsyncFakeDriver, CassetteMismatch
+
+
+class Tape(AsyncStructuredNode):
+    name = StringProperty(unique_index=True)
+    recorded = DateTimeProperty(default_now=True)
+
+
+async def scenario():
+    tape = await Tape(name="Jazz").save()
+    async with adb.transaction:
+        found = await Tape.nodes.get(name="Jazz")
+    with raises(UniqueProperty):
+        await Tape(name="Jazz").save()
+    return tape, found
+
+
+@mark_async_test
+async def test_record_and_replay(tmp_path):
+    await adb.install_labels(Tape)
+    real_driver = adb.driver
+    path = str(tmp_path / "cassette.json")
+    try:
+        recorder = AsyncFakeDriver.record(real_driver)
+        await adb.set_connection(driver=recorder)
+        tape, found = await scenario()
+        assert found.element_id == tape.element_id
+        recorder.cassette.save(path)
+
+        # the same queries are answered without the database
+        player = AsyncFakeDriver.replay(path)
+        await adb.set_connection(driver=player)
+        replayed, replayed_found = await scenario()
+        assert replayed.element_id == tape.element_id
+        assert replayed_found.recorded == found.recorded
+        assert player.queries == recorder.queries
+
+        player = AsyncFakeDriver.replay(path)
+        await adb.set_connection(driver=player)
+        with raises(CassetteMismatch):
+            await Tape.nodes.get(name="Jazz")
+    finally:
+        await adb.set_connection(driver=real_driver)
+        await adb.cypher_query("MATCH (n:Tape) DETACH DELETE n")
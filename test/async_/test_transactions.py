@@ -5,7 +5,13 @@ from neo4j.api import Bookmarks
 from neo4j.exceptions import ClientError, TransactionError
 from pytest import raises
 
-from neomodel import AsyncStructuredNode, StringProperty, UniqueProperty, adb
+from neomodel import (
+    AsyncStructuredNode,
+    StringProperty,
+    UniqueProperty,
+    adb,
+    get_config,
+)
 
 
 class APerson(AsyncStructuredNode):
@@ -177,3 +183,57 @@ async def test_query_inside_bookmark_transaction():
         assert len([p.name for p in await APerson.nodes]) == 2
 
     assert isinstance(transaction.last_bookmarks, Bookmarks)
+
+
+@mark_async_test
+async def test_session_cache():
+    await APerson(name="Alice").save()
+    await APerson(name="Bob").save()
+    query = "MATCH (a:APerson {name: 'Alice'}), (p:APerson) RETURN a, p ORDER BY p.name"
+
+    results, _ = await adb.cypher_query(query, resolve_objects=True)
+    assert results[0][0] is not results[1][0]
+
+    with adb.session_cache():
+        results, _ = await adb.cypher_query(query, resolve_objects=True)
+        assert results[0][0] is results[1][0] is results[0][1]
+        assert await APerson.nodes.get(name="Alice") is results[0][0]
+    assert adb._identity_map is None
+
+    async with adb.transaction.with_session_cache:
+        alice = await APerson.nodes.get(name="Alice")
+        assert await APerson.nodes.get(name="Alice") is alice
+    assert adb._identity_map is None
+
+
+@mark_async_test
+async def test_route_reads(mocker):
+    session = mocker.spy(adb.driver, "session")
+    get_config().route_reads = True
+    try:
+        # reads see the writes made before them, through the shared bookmarks
+        harriet = await APerson(name="Harriet").save()
+        assert await APerson.nodes.get(name="Harriet")
+        assert await harriet.labels() == ["APerson"]
+        assert session.call_args.kwargs["default_access_mode"] == "READ"
+        assert session.call_args.kwargs["bookmark_manager"] is not None
+
+        # raw queries and writes still run in WRITE sessions
+        await adb.cypher_query("MATCH (p:APerson) RETURN p")
+        assert session.call_args.kwargs["default_access_mode"] == "WRITE"
+
+        assert await APerson.nodes.access_mode("WRITE").filter(name="Harriet")
+        assert session.call_args.kwargs["default_access_mode"] == "WRITE"
+        with raises(ValueError):
+            APerson.nodes.access_mode("read")
+    finally:
+        get_config().route_reads = False
+
+    await adb.cypher_query("MATCH (p:APerson) RETURN p", access_mode="READ")
+    assert session.call_args.kwargs["default_access_mode"] == "READ"
+    with raises(ClientError) as e:
+        await adb.cypher_query("CREATE (p:APerson {name: 'Ian'})", access_mode="READ")
+    assert e.value.code == "Neo.ClientError.Statement.AccessMode"
+
+    assert await APerson.nodes.filter(name="Harriet")
+    assert session.call_args.kwargs["default_access_mode"] == "WRITE"
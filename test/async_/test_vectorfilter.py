@@ -359,3 +359,74 @@ async def test_vectorfilter_invalid_threshold_type():
             )
         )
         await nodeset.all()  # This triggers the build_vector_query call
+
+
+@mark_async_test
+async def test_vectorfilter_query_is_parameterized():
+    """
+    Tests that searches with different vectors share the same query text,
+    so that the query plan is reused.
+    """
+
+    class someNodeParams(AsyncStructuredNode):
+        name = StringProperty()
+        vector = ArrayProperty(
+            base_property=FloatProperty(), vector_index=VectorIndex(2, "cosine")
+        )
+
+    async def build(candidate_vector, topk, threshold):
+        nodeset = someNodeParams.nodes.filter(
+            vector_filter=VectorFilter(
+                topk=topk,
+                vector_attribute_name="vector",
+                candidate_vector=candidate_vector,
+                threshold=threshold,
+            )
+        )
+        qbuilder = await nodeset.query_cls(nodeset).build_ast()
+        return qbuilder.build_query(), qbuilder._query_params
+
+    query1, params1 = await build([0.25, 0.0], 3, 0.5)
+    query2, params2 = await build([0.75, 0.1], 5, 0.9)
+    assert query1 == query2
+    assert "0.25" not in query1
+    assert params1["vector_query_vector"] == [0.25, 0.0]
+    assert params2["vector_query_vector"] == [0.75, 0.1]
+    assert params2["vector_query_topk"] == 5
+    assert params2["vector_query_threshold"] == 0.9
+
+
+@mark_async_test
+async def test_vectorfilter_values_and_paginate():
+    """
+    Tests that values() and paginate() project and filter the matched nodes,
+    not the node and score returned by the vector query.
+    """
+    # Vector Indexes only exist from 5.13 onwards
+    if not await adb.version_is_higher_than("5.13"):
+        pytest.skip("Vector Index not Generally Available in Neo4j.")
+
+    class someNodeValues(AsyncStructuredNode):
+        name = StringProperty()
+        vector = ArrayProperty(
+            base_property=FloatProperty(), vector_index=VectorIndex(2, "cosine")
+        )
+
+    await adb.install_labels(someNodeValues)
+
+    await someNodeValues(name="John", vector=[float(0.5), float(0.5)]).save()
+    await someNodeValues(name="Fred", vector=[float(1.0), float(0.0)]).save()
+
+    nodeset = someNodeValues.nodes.filter(
+        vector_filter=VectorFilter(
+            topk=3, vector_attribute_name="vector", candidate_vector=[0.25, 0]
+        )
+    )
+    names = [name async for name in nodeset.values_list("name", flat=True)]
+    assert sorted(names) == ["Fred", "John"]
+
+    page = await nodeset.paginate(order_by="name", size=1)
+    assert page.items[0][0].name == "Fred"
+    page = await nodeset.paginate(order_by="name", after=page.next_cursor, size=1)
+    assert page.items[0][0].name == "John"
+    assert page.next_cursor is None
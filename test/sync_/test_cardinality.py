@@ -374,3 +374,69 @@ def test_bidirectional_cardinality_validation():
     assert "Soft check is enabled so the relationship will be created" in console_output
 
     config.soft_cardinality_check = False
+
+
+@mark_sync_test
+def test_connect_many():
+    config = get_config()
+    config.soft_cardinality_check = False
+    company = Company(name="ManyCorp").save()
+    other = Company(name="OtherCorp").save()
+    employees = [Employee(name=f"Many {i}").save() for i in range(5)]
+
+    assert company.employees.connect_many(employees[:3], batch_size=2) is None
+    assert len(company.employees.all()) == 3
+    assert employees[0].employer.single() == company
+
+    # the inverse ZeroOrOne cardinality is checked in the same statement
+    with raises(AttemptedCardinalityViolation):
+        other.employees.connect_many(employees[2:])
+    assert len(other.employees.all()) == 0
+    # a violation in a later batch rolls back the previous ones
+    with raises(AttemptedCardinalityViolation):
+        other.employees.connect_many([employees[3], employees[2]], batch_size=1)
+    assert len(other.employees.all()) == 0
+
+    # the source cardinality too
+    monkey = Monkey(name="Bubbles").save()
+    drivers = [ScrewDriver(version=i).save() for i in range(2)]
+    with raises(AttemptedCardinalityViolation):
+        monkey.driver.connect_many(drivers)
+    monkey.driver.connect_many(drivers[:1])
+    with raises(AttemptedCardinalityViolation):
+        monkey.driver.connect_many(drivers[1:])
+    assert monkey.driver.single() == drivers[0]
+
+    stream = io.StringIO()
+    with patch("sys.stdout", new=stream):
+        config.soft_cardinality_check = True
+        other.employees.connect_many(employees[2:])
+    config.soft_cardinality_check = False
+    assert "Cardinality violation detected" in stream.getvalue()
+    assert len(other.employees.all()) == 3
+
+
+@mark_sync_test
+def test_connect_checks_cardinality_in_one_statement(mocker):
+    config = get_config()
+    config.soft_cardinality_check = False
+    company = Company(name="OneStatementCorp").save()
+    other = Company(name="OtherStatementCorp").save()
+    employee = Employee(name="Jane").save()
+
+    cypher_query = mocker.spy(db, "cypher_query")
+    company.employees.connect(employee)
+    assert cypher_query.call_count == 1
+
+    # the inverse ZeroOrOne limit is checked by the same statement
+    with raises(AttemptedCardinalityViolation):
+        other.employees.connect(employee)
+    assert cypher_query.call_count == 2
+    assert employee.employer.single() == company
+
+    # connecting again to a connected node is still a violation
+    monkey = Monkey(name="Statement").save()
+    driver = ScrewDriver(version=3).save()
+    monkey.driver.connect(driver)
+    with raises(AttemptedCardinalityViolation):
+        monkey.driver.connect(driver)
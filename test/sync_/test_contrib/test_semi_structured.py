@@ -37,6 +37,19 @@ def test_save_to_model_with_extras():
     assert u.bar == 99
 
 
+@mark_sync_test
+def test_save_extras_of_loaded_node():
+    UserProf(email="kim@test.com", age=5, bar=1).save()
+    u = UserProf.nodes.get(email="kim@test.com")
+    u.bar = 2
+    u.baz = "new"
+    u.save()
+
+    u = UserProf.nodes.get(email="kim@test.com")
+    assert u.bar == 2
+    assert u.baz == "new"
+
+
 @mark_sync_test
 def test_save_empty_model():
     dummy = Dummy()
@@ -237,6 +237,29 @@ def test_setting_value_to_none():
     assert copy.age is None
 
 
+@mark_sync_test
+def test_save_only_writes_changed_properties(mocker):
+    c = Customer2(email="dirty@bob.com", age=42).save()
+    cypher = mocker.spy(c, "cypher")
+    c.save()
+    cypher.assert_not_called()
+
+    c.age = 43
+    c.save()
+    query, params = cypher.call_args.args
+    assert params == {"age": 43}
+    assert "email" not in query and "SET n:" not in query
+    assert (Customer2.nodes.get(email="dirty@bob.com")).age == 43
+
+    loaded = Customer2.nodes.get(email="dirty@bob.com")
+    loaded.save()
+    assert loaded._dirty == frozenset()
+    loaded.email = "clean@bob.com"
+    loaded.save()
+    c.refresh()
+    assert (c.email, c.age) == ("clean@bob.com", 43)
+
+
 @mark_sync_test
 def test_inheritance():
     class User(StructuredNode):
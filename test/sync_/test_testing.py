@@ -0,0 +1,50 @@
+from test._async_compat import mark_sync_test
+
+from pytest import raises
+
+from neomodel import DateTimeProperty, StringProperty, StructuredNode, db
+from neomodel.exceptions import UniqueProperty
+from neomodel.testing import CassetteMismatch, FakeDriver
+
+
+class Tape(StructuredNode):
+    name = StringProperty(unique_index=True)
+    recorded = DateTimeProperty(default_now=True)
+
+
+def scenario():
+    tape = Tape(name="Jazz").save()
+    with db.transaction:
+        found = Tape.nodes.get(name="Jazz")
+    with raises(UniqueProperty):
+        Tape(name="Jazz").save()
+    return tape, found
+
+
+@mark_sync_test
+def test_record_and_replay(tmp_path):
+    db.install_labels(Tape)
+    real_driver = db.driver
+    path = str(tmp_path / "cassette.json")
+    try:
+        recorder = FakeDriver.record(real_driver)
+        db.set_connection(driver=recorder)
+        tape, found = scenario()
+        assert found.element_id == tape.element_id
+        recorder.cassette.save(path)
+
+        # the same queries are answered without the database
+        player = FakeDriver.replay(path)
+        db.set_connection(driver=player)
+        replayed, replayed_found = scenario()
+        assert replayed.element_id == tape.element_id
+        assert replayed_found.recorded == found.recorded
+        assert player.queries == recorder.queries
+
+        player = FakeDriver.replay(path)
+        db.set_connection(driver=player)
+        with raises(CassetteMismatch):
+            Tape.nodes.get(name="Jazz")
+    finally:
+        db.set_connection(driver=real_driver)
+        db.cypher_query("MATCH (n:Tape) DETACH DELETE n")
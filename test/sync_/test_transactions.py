@@ -5,7 +5,13 @@ from neo4j.api import Bookmarks
 from neo4j.exceptions import ClientError, TransactionError
 from pytest import raises
 
-from neomodel import StringProperty, StructuredNode, UniqueProperty, db
+from neomodel import (
+    StringProperty,
+    StructuredNode,
+    UniqueProperty,
+    db,
+    get_config,
+)
 
 
 class APerson(StructuredNode):
@@ -177,3 +183,57 @@ def test_query_inside_bookmark_transaction():
         assert len([p.name for p in APerson.nodes]) == 2
 
     assert isinstance(transaction.last_bookmarks, Bookmarks)
+
+
+@mark_sync_test
+def test_session_cache():
+    APerson(name="Alice").save()
+    APerson(name="Bob").save()
+    query = "MATCH (a:APerson {name: 'Alice'}), (p:APerson) RETURN a, p ORDER BY p.name"
+
+    results, _ = db.cypher_query(query, resolve_objects=True)
+    assert results[0][0] is not results[1][0]
+
+    with db.session_cache():
+        results, _ = db.cypher_query(query, resolve_objects=True)
+        assert results[0][0] is results[1][0] is results[0][1]
+        assert APerson.nodes.get(name="Alice") is results[0][0]
+    assert db._identity_map is None
+
+    with db.transaction.with_session_cache:
+        alice = APerson.nodes.get(name="Alice")
+        assert APerson.nodes.get(name="Alice") is alice
+    assert db._identity_map is None
+
+
+@mark_sync_test
+def test_route_reads(mocker):
+    session = mocker.spy(db.driver, "session")
+    get_config().route_reads = True
+    try:
+        # reads see the writes made before them, through the shared bookmarks
+        harriet = APerson(name="Harriet").save()
+        assert APerson.nodes.get(name="Harriet")
+        assert harriet.labels() == ["APerson"]
+        assert session.call_args.kwargs["default_access_mode"] == "READ"
+        assert session.call_args.kwargs["bookmark_manager"] is not None
+
+        # raw queries and writes still run in WRITE sessions
+        db.cypher_query("MATCH (p:APerson) RETURN p")
+        assert session.call_args.kwargs["default_access_mode"] == "WRITE"
+
+        assert APerson.nodes.access_mode("WRITE").filter(name="Harriet")
+        assert session.call_args.kwargs["default_access_mode"] == "WRITE"
+        with raises(ValueError):
+            APerson.nodes.access_mode("read")
+    finally:
+        get_config().route_reads = False
+
+    db.cypher_query("MATCH (p:APerson) RETURN p", access_mode="READ")
+    assert session.call_args.kwargs["default_access_mode"] == "READ"
+    with raises(ClientError) as e:
+        db.cypher_query("CREATE (p:APerson {name: 'Ian'})", access_mode="READ")
+    assert e.value.code == "Neo.ClientError.Statement.AccessMode"
+
+    assert APerson.nodes.filter(name="Harriet")
+    assert session.call_args.kwargs["default_access_mode"] == "WRITE"
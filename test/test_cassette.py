@@ -0,0 +1,102 @@
+"""
+Tests for the cassettes of the fake drivers in neomodel.testing, which need no
+database.
+"""
+
+import os
+import tempfile
+import unittest
+
+import neo4j.time
+from neo4j.exceptions import ConstraintError
+from neo4j.graph import Graph, Node, Path
+from neo4j.spatial import CartesianPoint
+
+from neomodel.testing import Cassette, CassetteMismatch, FakeDriver
+
+
+class Summary:
+    query_type = "r"
+    plan = None
+    profile = None
+    metadata = {"stats": {"nodes-created": 1}}
+    result_available_after = 1
+    result_consumed_after = 2
+
+
+def make_path() -> Path:
+    graph = Graph()
+    knows = graph.relationship_type("KNOWS")
+    start = Node(graph, "4:a:1", 1, ["Person"], {"name": "jim"})
+    end = Node(graph, "4:a:2", 2, ["Person"], {"name": "bob"})
+    rel = knows(graph, "5:a:1", 1, {"since": 2020})
+    rel._start_node, rel._end_node = start, end
+    return Path(start, rel)
+
+
+class TestCassette(unittest.TestCase):
+    def test_values_round_trip(self):
+        values = [
+            make_path(),
+            {"tags": ["a", "b"], "raw": b"\x00\x01"},
+            neo4j.time.DateTime(2024, 5, 17, 12, 30, 15, 123456789),
+            neo4j.time.Date(2024, 5, 17),
+            neo4j.time.Duration(days=2, seconds=30),
+            CartesianPoint((1.0, 2.0)),
+            None,
+        ]
+        cassette = Cassette()
+        cassette.record("RETURN $x", {"x": object()}, ["a"], [[values]], Summary())
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "cassette.json")
+            cassette.save(path)
+            cassette = Cassette.load(path)
+
+        keys, records, summary = cassette.replay("RETURN $x")
+        self.assertEqual(keys, ["a"])
+        path, mapping, *rest = records[0]["a"]
+        self.assertEqual(path.start_node["name"], "jim")
+        self.assertEqual(path.end_node["name"], "bob")
+        self.assertEqual(path.relationships[0].type, "KNOWS")
+        self.assertEqual(path.relationships[0]["since"], 2020)
+        self.assertIs(path.relationships[0].start_node, path.start_node)
+        self.assertEqual(mapping, {"tags": ["a", "b"], "raw": b"\x00\x01"})
+        self.assertEqual(rest, values[2:])
+        self.assertEqual(summary.counters.nodes_created, 1)
+        self.assertEqual(summary.result_consumed_after, 2)
+
+    def test_replay_order(self):
+        cassette = Cassette()
+        for query in ["RETURN 1", "RETURN 2", "RETURN 1"]:
+            cassette.record(query, None, ["x"], [[query[-1]]], Summary())
+
+        with self.assertRaises(CassetteMismatch):
+            cassette.replay("RETURN 2")
+        self.assertEqual(cassette.replay("RETURN 1")[1][0]["x"], "1")
+
+        # out of order, the first query with the same text left is replayed
+        self.assertEqual(cassette.replay("RETURN 1", ordered=False)[1][0]["x"], "1")
+        self.assertEqual(cassette.replay("RETURN 2", ordered=False)[1][0]["x"], "2")
+        with self.assertRaises(CassetteMismatch):
+            cassette.replay("RETURN 1", ordered=False)
+
+    def test_fake_driver_replays_errors(self):
+        cassette = Cassette()
+        cassette.record_error(
+            "CREATE (n:Person {name: $name})",
+            {"name": "jim"},
+            ConstraintError._hydrate_neo4j(
+                code="Neo.ClientError.Schema.ConstraintValidationFailed",
+                message="already exists",
+            ),
+        )
+        driver = FakeDriver.replay(cassette)
+        with driver.session() as session:
+            with self.assertRaises(ConstraintError) as raised:
+                session.run("CREATE (n:Person {name: $name})", {"name": "bob"})
+        self.assertEqual(raised.exception.message, "already exists")
+        self.assertEqual(driver.queries, ["CREATE (n:Person {name: $name})"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -30,6 +30,10 @@ class TestNeomodelConfig:
         assert config_obj.soft_cardinality_check is False
         assert config_obj.cypher_debug is False
         assert config_obj.slow_queries == 0.0
+        assert config_obj.batch_size == 1000
+        assert config_obj.fetch_size == 1000
+        assert config_obj.n_plus_one_threshold == 0
+        assert config_obj.route_reads is False
         assert config_obj.connection_timeout == 30.0
         assert config_obj.max_connection_pool_size == 100
 
@@ -52,6 +56,20 @@ class TestNeomodelConfig:
         with pytest.raises(ValueError, match="slow_queries must be non-negative"):
             NeomodelConfig(slow_queries=-1.0)
 
+        # Test batch_size validation
+        with pytest.raises(ValueError, match="batch_size must be positive"):
+            NeomodelConfig(batch_size=0)
+
+        # Test fetch_size validation
+        with pytest.raises(ValueError, match="fetch_size must be positive"):
+            NeomodelConfig(fetch_size=0)
+        assert NeomodelConfig(fetch_size=-1).fetch_size == -1
+
+        with pytest.raises(
+            ValueError, match="n_plus_one_threshold must be non-negative"
+        ):
+            NeomodelConfig(n_plus_one_threshold=-1)
+
         # Test additional validation branches
         with pytest.raises(
             ValueError, match="connection_acquisition_timeout must be positive"
@@ -0,0 +1,301 @@
+"""
+Tests for the precomputed per-class model schema (neomodel.schema).
+"""
+
+import unittest
+
+from neo4j.graph import Graph, Node
+
+from neomodel import (
+    AliasProperty,
+    ArrayProperty,
+    IntegerProperty,
+    RelationshipFrom,
+    RelationshipTo,
+    StringProperty,
+    StructuredNode,
+    StructuredRel,
+)
+from neomodel.exceptions import DeflateError, InflateError, RequiredProperty
+from neomodel.schema import ModelSchema
+
+
+class SchemaKnows(StructuredRel):
+    since = IntegerProperty(db_property="since_year")
+
+
+class SchemaPerson(StructuredNode):
+    name = StringProperty(unique_index=True)
+    full_name = AliasProperty(to="name")
+    age = IntegerProperty(db_property="years")
+    knows = RelationshipTo("SchemaPerson", "SCHEMA_KNOWS", model=SchemaKnows)
+    known_by = RelationshipFrom("SchemaPerson", "SCHEMA_KNOWS", model=SchemaKnows)
+
+
+class SchemaEmployee(SchemaPerson):
+    __optional_labels__ = ["SchemaManager"]
+    company = StringProperty(required=True)
+
+
+class SchemaMixin(StructuredNode):
+    __abstract_node__ = True
+    tag = StringProperty()
+
+
+class SchemaProduct(StructuredNode):
+    code = StringProperty(required=True, db_property="product_code")
+    size = StringProperty(choices={"S": "Small", "L": "Large"})
+    stock = IntegerProperty(default=0)
+    tags = ArrayProperty(StringProperty())
+    related = RelationshipTo("SchemaProduct", "SCHEMA_RELATED")
+
+
+class SchemaSizeMixin:
+    size = StringProperty(choices={"S": "Small", "L": "Large"})
+
+
+class SchemaMixedProduct(StructuredNode, SchemaSizeMixin):
+    code = StringProperty()
+
+
+class SchemaCustomInit(StructuredNode):
+    name = StringProperty(default="anonymous")
+
+    def __init__(self, *args, **kwargs):
+        kwargs["name"] = kwargs["name"].upper()
+        super().__init__(*args, **kwargs)
+
+
+class SchemaCompact(StructuredNode):
+    __compact__ = True
+    code = StringProperty(required=True, db_property="compact_code")
+    size = StringProperty(choices={"S": "Small", "L": "Large"})
+    stock = IntegerProperty(default=0)
+    related = RelationshipTo("SchemaCompact", "SCHEMA_COMPACT_RELATED")
+
+
+class SchemaCompactChild(SchemaCompact):
+    stock = IntegerProperty(default=10)
+    colour = StringProperty()
+
+
+def make_node(properties, element_id="4:schema:1"):
+    return Node(Graph(), element_id, 1, ["SchemaProduct"], properties)
+
+
+class TestModelSchema(unittest.TestCase):
+    def test_schema_is_built_with_the_class(self):
+        schema = SchemaPerson.__dict__["__schema__"]
+        self.assertIsInstance(schema, ModelSchema)
+        self.assertIs(SchemaPerson.get_schema(), schema)
+        self.assertIsNot(SchemaEmployee.get_schema(), schema)
+
+    def test_members(self):
+        schema = SchemaEmployee.get_schema()
+        self.assertEqual(list(schema.properties), ["name", "age", "company"])
+        self.assertEqual(list(schema.aliases), ["full_name"])
+        self.assertEqual(list(schema.relationships), ["knows", "known_by"])
+        self.assertEqual(schema.required_properties, ("name", "company"))
+
+    def test_property_name_mappings(self):
+        schema = SchemaPerson.get_schema()
+        self.assertEqual(schema.db_property_names["age"], "years")
+        self.assertEqual(schema.attribute_names["years"], "age")
+        self.assertEqual(
+            [(name, db_name) for name, db_name, _ in schema.property_fields],
+            [("name", "name"), ("age", "years")],
+        )
+        with self.assertRaises(TypeError):
+            schema.properties["other"] = StringProperty()  # type: ignore[index]
+
+    def test_labels(self):
+        schema = SchemaEmployee.get_schema()
+        self.assertEqual(schema.labels, ("SchemaEmployee", "SchemaPerson"))
+        self.assertEqual(schema.label_string, "SchemaEmployee:SchemaPerson")
+        self.assertEqual(schema.optional_labels, ("SchemaManager",))
+        self.assertEqual(
+            SchemaEmployee.inherited_labels(), ["SchemaEmployee", "SchemaPerson"]
+        )
+
+    def test_defined_properties_matches_schema(self):
+        self.assertEqual(
+            list(SchemaPerson.defined_properties()),
+            ["name", "full_name", "age", "knows", "known_by"],
+        )
+        self.assertEqual(
+            list(SchemaPerson.defined_properties(aliases=False, rels=False)),
+            ["name", "age"],
+        )
+        self.assertEqual(
+            list(SchemaPerson.defined_properties(properties=False, aliases=False)),
+            ["knows", "known_by"],
+        )
+        # callers are free to mutate the returned dict
+        props = SchemaPerson.defined_properties()
+        props.pop("name")
+        self.assertIn("name", SchemaPerson.defined_properties())
+
+    def test_lookup(self):
+        schema = SchemaPerson.get_schema()
+        self.assertIs(schema.lookup("name"), SchemaPerson.__dict__["name"])
+        self.assertIsNotNone(schema.lookup("knows"))
+        self.assertIsNone(schema.lookup("knows", rels=False))
+        self.assertIsNone(schema.lookup("missing"))
+
+    def test_find_inverse(self):
+        schema = SchemaPerson.get_schema()
+        direction = SchemaPerson.knows.definition["direction"]
+        name, _ = schema.find_inverse("SCHEMA_KNOWS", direction, SchemaPerson)
+        self.assertEqual(name, "known_by")
+        self.assertIsNone(schema.find_inverse("OTHER", direction, SchemaPerson))
+
+    def test_relationship_and_abstract_schemas_are_built_on_first_use(self):
+        self.assertEqual(
+            SchemaKnows.get_schema().db_property_names["since"], "since_year"
+        )
+        self.assertEqual(SchemaKnows.deflate({"since": 2020}), {"since_year": 2020})
+        self.assertEqual(list(SchemaMixin.get_schema().properties), ["tag"])
+        self.assertEqual(SchemaMixin.get_schema().labels, ())
+
+
+class TestGeneratedInflateDeflate(unittest.TestCase):
+    def test_inflate_matches_init(self):
+        node = make_node({"product_code": "p1", "size": "S", "tags": ["a"]})
+        product = SchemaProduct.inflate(node)
+        expected = SchemaProduct(code="p1", size="S", tags=["a"])
+        self.assertEqual(product.element_id, "4:schema:1")
+        expected.element_id_property = "4:schema:1"
+        self.assertEqual(product.__properties__, expected.__properties__)
+        self.assertEqual(
+            [name for name in vars(product) if not name.startswith("_")],
+            [name for name in vars(expected) if not name.startswith("_")],
+        )
+        self.assertEqual(product.stock, 0)
+        self.assertEqual(product.get_size_display(), "Small")
+        self.assertIs(product.related.source, product)
+
+    def test_inflate_error(self):
+        with self.assertRaises(InflateError):
+            SchemaProduct.inflate(make_node({"product_code": "p3", "stock": "many"}))
+
+    def test_inflate_with_custom_init(self):
+        node = SchemaCustomInit.inflate(make_node({"name": "bob"}))
+        self.assertEqual(node.name, "BOB")
+        self.assertEqual(SchemaCustomInit.inflate(make_node({})).name, "ANONYMOUS")
+
+    def test_deflate(self):
+        self.assertEqual(
+            SchemaProduct.deflate({"code": "p1", "size": "L"}),
+            {"product_code": "p1", "size": "L", "stock": 0, "tags": None},
+        )
+        self.assertEqual(
+            SchemaProduct.deflate({"code": "p1"}, skip_empty=True),
+            {"product_code": "p1", "stock": 0},
+        )
+        with self.assertRaises(RequiredProperty):
+            SchemaProduct.deflate({"size": "S"})
+        with self.assertRaises(DeflateError):
+            SchemaProduct.deflate({"code": "p1", "size": "XL"})
+
+
+class TestLazyAndCompactInstances(unittest.TestCase):
+    def test_relationship_managers_are_built_on_first_access(self):
+        product = SchemaProduct.inflate(make_node({"product_code": "p1"}))
+        self.assertNotIn("related", vars(product))
+        manager = product.related
+        self.assertIs(manager.source, product)
+        self.assertIs(vars(product)["related"], manager)
+        self.assertIs(product.related, manager)
+        self.assertIs(
+            SchemaProduct.related, SchemaProduct.get_schema().lookup("related")
+        )
+
+    def test_display_methods_are_defined_on_the_class(self):
+        product = SchemaProduct(code="p1", size="L")
+        self.assertNotIn("get_size_display", vars(product))
+        self.assertIn("get_size_display", vars(SchemaProduct))
+        self.assertEqual(product.get_size_display(), "Large")
+
+    def test_display_methods_for_inherited_properties(self):
+        product = SchemaMixedProduct(code="p1", size="S")
+        self.assertEqual(product.get_size_display(), "Small")
+        self.assertEqual(SchemaCompactChild(size="L").get_size_display(), "Large")
+
+    def test_compact_storage(self):
+        self.assertEqual(SchemaCompact.__slots__, ("code", "size", "stock"))
+        self.assertIsInstance(SchemaCompact.code, StringProperty)
+        self.assertEqual(
+            list(SchemaCompact.get_schema().properties), ["code", "size", "stock"]
+        )
+        self.assertEqual(SchemaCompact.code.name, "code")
+
+        node = SchemaCompact.inflate(make_node({"compact_code": "c1", "size": "S"}))
+        self.assertEqual((node.code, node.size, node.stock), ("c1", "S", 0))
+        self.assertEqual(list(vars(node)), ["element_id_property"])
+        self.assertEqual(node.get_size_display(), "Small")
+        self.assertEqual(
+            node.__properties__,
+            {
+                "code": "c1",
+                "size": "S",
+                "stock": 0,
+                "element_id_property": "4:schema:1",
+            },
+        )
+        self.assertEqual(
+            SchemaCompact.deflate(node.__properties__),
+            {"compact_code": "c1", "size": "S", "stock": 0},
+        )
+        node.stock = 5
+        self.assertEqual(node.stock, 5)
+        self.assertNotIn("stock", vars(node))
+
+    def test_compact_inheritance(self):
+        self.assertEqual(SchemaCompactChild.__slots__, ("colour",))
+        node = SchemaCompactChild(code="c2", colour="red")
+        self.assertEqual(node.stock, 10)
+        self.assertEqual(vars(node), {"_dirty": None})
+        self.assertEqual(
+            list(SchemaCompactChild.get_schema().properties),
+            ["code", "size", "stock", "colour"],
+        )
+
+
+class TestChangeTracking(unittest.TestCase):
+    def test_inflated_nodes_are_clean(self):
+        product = SchemaProduct.inflate(
+            make_node({"product_code": "p1", "stock": 3, "tags": ["a"]})
+        )
+        self.assertNotIn("_dirty", vars(product))
+        self.assertEqual(product._deflate_changes(), {})
+
+        product.stock = 4
+        product.tags.append("b")
+        self.assertEqual(product._dirty, {"stock"})
+        self.assertEqual(product._deflate_changes(), {"stock": 4, "tags": ["a", "b"]})
+        # other nodes are not affected
+        self.assertEqual(SchemaProduct._dirty, frozenset())
+
+        product._mark_saved({"stock": 4, "tags": ["a", "b"]})
+        self.assertEqual(product._deflate_changes(), {})
+
+    def test_changes_are_deflated(self):
+        product = SchemaProduct.inflate(make_node({"product_code": "p1"}))
+        product.code = None
+        with self.assertRaises(RequiredProperty):
+            product._deflate_changes()
+        product.code = "p2"
+        product.size = None
+        self.assertEqual(
+            product._deflate_changes(),
+            {"product_code": "p2", "size": None},
+        )
+
+    def test_new_nodes_are_not_tracked(self):
+        product = SchemaProduct(code="p1")
+        product.stock = 1
+        self.assertIsNone(product._dirty)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,12 +8,15 @@ import warnings
 from types import FrameType
 
 from neomodel.util import (
+    QueryEvent,
+    QueryPlan,
     RelationshipDirection,
     _UnsavedNode,
     classproperty,
     deprecated,
     enumerate_traceback,
     get_graph_entity_properties,
+    query_template,
     version_tag_to_integer,
 )
 
@@ -124,6 +127,87 @@ class TestUtil(unittest.TestCase):
         with self.assertRaises(ValueError):
             version_tag_to_integer("")
 
+    def test_query_plan(self):
+        """Test QueryPlan built from a profiled plan of the driver."""
+        plan = QueryPlan.from_summary(
+            {
+                "operatorType": "ProduceResults@neo4j",
+                "args": {"EstimatedRows": 2.0, "Details": "p"},
+                "identifiers": ["p"],
+                "rows": 2,
+                "dbHits": 0,
+                "children": [
+                    {
+                        "operatorType": "Filter@neo4j",
+                        "args": {"EstimatedRows": 2.0, "Details": "p.name =~ $r"},
+                        "identifiers": ["p"],
+                        "rows": 2,
+                        "dbHits": 20,
+                        "children": [
+                            {
+                                "operatorType": "NodeByLabelScan@neo4j",
+                                "args": {"EstimatedRows": 10.0, "Details": "p:Person"},
+                                "identifiers": ["p"],
+                                "rows": 10,
+                                "dbHits": 11,
+                            }
+                        ],
+                    }
+                ],
+            },
+            query="MATCH (p:Person) WHERE p.name =~ $r RETURN p",
+        )
+        self.assertEqual(
+            plan.operators, ["ProduceResults", "Filter", "NodeByLabelScan"]
+        )
+        self.assertEqual(plan.total_db_hits, 31)
+        self.assertEqual(plan.children[0].estimated_rows, 2.0)
+        self.assertEqual(plan.query, "MATCH (p:Person) WHERE p.name =~ $r RETURN p")
+        self.assertEqual(
+            [operator.details for operator in plan.full_scans], ["p:Person"]
+        )
+        self.assertEqual(plan.index_operators, [])
+        self.assertIn("    +NodeByLabelScan p:Person (estimated rows: 10", str(plan))
+        with self.assertRaises(AssertionError):
+            plan.assert_uses_index()
+
+        plan = QueryPlan.from_summary(
+            {
+                "operatorType": "NodeUniqueIndexSeek@neo4j",
+                "args": {"EstimatedRows": 1.0},
+            }
+        )
+        self.assertIsNone(plan.total_db_hits)
+        self.assertEqual(len(plan.index_operators), 1)
+        plan.assert_uses_index()
+
+    def test_query_template(self):
+        """Test query_template strips literal values and whitespace."""
+        self.assertEqual(
+            query_template(
+                "MATCH (n1:Person {name: 'it\\'s'})-[*1..3]->(m)\n"
+                '  WHERE m.code = "x" AND n1.age > 4.5 RETURN m LIMIT $limit'
+            ),
+            "MATCH (n1:Person {name: ?})-[*?..?]->(m) "
+            "WHERE m.code = ? AND n1.age > ? RETURN m LIMIT $limit",
+        )
+
+    def test_query_event_param_size(self):
+        """Test param_size counts the values nested in the parameters."""
+        event = QueryEvent(
+            query="UNWIND $rows AS row CREATE (n:Person) SET n = row",
+            params={
+                "rows": [{"name": "a", "tags": ["x", "y"]}, {"name": "b", "tags": []}],
+                "limit": 10,
+                "empty": None,
+            },
+            duration=0.0,
+            time_to_first_record=None,
+            record_count=0,
+        )
+        self.assertEqual(event.param_count, 3)
+        self.assertEqual(event.param_size, 6)
+
 
 if __name__ == "__main__":
     unittest.main()